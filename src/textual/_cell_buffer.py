@@ -0,0 +1,293 @@
+"""
+A record of the cells most recently written to the terminal.
+
+The compositor keeps a `CellBuffer` so that partial updates need only write the cells
+which differ from what is already on the terminal.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Sequence
+
+import rich.repr
+from rich.cells import get_character_cell_size
+from rich.style import Style
+from typing_extensions import Final
+
+from textual.strip import Strip
+
+MAX_STYLES: Final[int] = 4096
+"""Maximum number of interned styles before the buffer is reset."""
+
+MERGE_GAP: Final[int] = 4
+"""Runs of unchanged cells up to this length are written with the changes either side,
+as that is cheaper than moving the cursor."""
+
+UNKNOWN_STYLE: Final[int] = -1
+"""Style id of a cell with unknown contents."""
+
+
+@rich.repr.auto(angular=True)
+class CellBuffer:
+    """The text and style of every cell on the terminal.
+
+    Styles are interned, so each cell stores a string and an integer. A cell whose
+    contents are not known (before the first update, or after `invalidate`) has a text
+    of `None`, and will never compare equal to new content.
+
+    The second cell of a double width character has an empty string for its text.
+
+    Args:
+        width: Width of the terminal.
+        height: Height of the terminal.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self._style_ids: dict[Style | None, int] = {}
+        self._styles: list[Style | None] = []
+        self._text: list[list[str | None]] = []
+        self._style_lines: list[list[int]] = []
+        self.invalidate()
+
+    def __rich_repr__(self) -> rich.repr.Result:
+        yield self.width
+        yield self.height
+
+    def invalidate(self) -> None:
+        """Forget the contents of every cell, so that the next update writes them all."""
+        self._style_ids.clear()
+        self._styles.clear()
+        width = self.width
+        self._text = [[None] * width for _ in range(self.height)]
+        self._style_lines = [[UNKNOWN_STYLE] * width for _ in range(self.height)]
+
+    def scroll(self, top: int, bottom: int, distance: int) -> None:
+        """Record lines being scrolled by the terminal (within a scroll region).
+
+        Args:
+            top: First line in the scroll region.
+            bottom: Line after the last line in the scroll region.
+            distance: Number of lines to scroll up, or down if negative.
+        """
+        width = self.width
+        exposed = range(abs(distance))
+        for lines, unknown in (
+            (self._text, None),
+            (self._style_lines, UNKNOWN_STYLE),
+        ):
+            exposed_lines = [[unknown] * width for _ in exposed]
+            scroll_lines = lines[top:bottom]
+            if distance > 0:
+                lines[top:bottom] = scroll_lines[distance:] + exposed_lines
+            else:
+                lines[top:bottom] = exposed_lines + scroll_lines[:distance]
+
+    def get_style(self, x: int, y: int) -> Style | None:
+        """Get the style of the cell at the given coordinate.
+
+        Args:
+            x: X coordinate.
+            y: Y coordinate.
+
+        Returns:
+            The style of the cell (a null style if the cell is unstyled), or `None` if
+                the cell is not known.
+        """
+        if 0 <= y < self.height and 0 <= x < self.width:
+            style_id = self._style_lines[y][x]
+            if style_id != UNKNOWN_STYLE:
+                return self._styles[style_id] or Style.null()
+        return None
+
+    def _get_style_id(self, style: Style | None) -> int:
+        """Intern a style.
+
+        Args:
+            style: A Rich style.
+
+        Returns:
+            An integer which identifies the style.
+        """
+        style_id = self._style_ids.get(style)
+        if style_id is None:
+            style_id = self._style_ids[style] = len(self._styles)
+            self._styles.append(style)
+        return style_id
+
+    def _get_cells(self, strips: Iterable[Strip]) -> tuple[list[str | None], list[int]]:
+        """Split strips into cells.
+
+        Args:
+            strips: Strips to split.
+
+        Returns:
+            A list of text and a list of style ids, with one entry per cell.
+        """
+        text_cells: list[str | None] = []
+        style_cells: list[int] = []
+        add_text = text_cells.append
+        add_style = style_cells.append
+        extend_text = text_cells.extend
+        extend_styles = style_cells.extend
+        get_style_id = self._get_style_id
+        for strip in strips:
+            for text, style, control in strip:
+                if control:
+                    continue
+                style_id = get_style_id(style)
+                if text.isascii():
+                    extend_text(text)
+                    extend_styles([style_id] * len(text))
+                    continue
+                for character in text:
+                    character_width = get_character_cell_size(character)
+                    if character_width == 1:
+                        add_text(character)
+                        add_style(style_id)
+                    elif character_width == 2:
+                        add_text(character)
+                        add_text("")
+                        add_style(style_id)
+                        add_style(style_id)
+                    elif text_cells and text_cells[-1]:
+                        # Zero width characters combine with the previous character
+                        text_cells[-1] += character
+        return text_cells, style_cells
+
+    def update_lines(self, strips: Sequence[Strip]) -> None:
+        """Record strips covering the full width of the terminal (a full update).
+
+        Args:
+            strips: A strip for each line.
+        """
+        if len(self._styles) > MAX_STYLES:
+            self.invalidate()
+        width = self.width
+        for y, strip in enumerate(strips[: self.height]):
+            text_cells, style_cells = self._get_cells([strip])
+            if len(text_cells) == width:
+                self._text[y] = text_cells
+                self._style_lines[y] = style_cells
+            else:
+                self._text[y] = [None] * width
+                self._style_lines[y] = [UNKNOWN_STYLE] * width
+
+    def update(
+        self,
+        chops: Sequence[Mapping[int, Strip | None]],
+        chop_ends: Sequence[Sequence[int]],
+        spans: Iterable[tuple[int, int, int]],
+    ) -> list[tuple[int, int, int]]:
+        """Record the cells in a partial update, and find the cells which changed.
+
+        Args:
+            chops: The chops rendered by the compositor.
+            chop_ends: The end offsets of the chops on each line.
+            spans: The spans to update, as tuples of (Y, X1, X2).
+
+        Returns:
+            The spans within `spans` which differ from the terminal.
+        """
+        if len(self._styles) > MAX_STYLES:
+            self.invalidate()
+        changed_spans: list[tuple[int, int, int]] = []
+        add_span = changed_spans.append
+        get_cells = self._get_cells
+        for y, x1, x2 in spans:
+            start = -1
+            end = x2
+            strips: list[Strip] = []
+            for chop_end, (x, strip) in zip(chop_ends[y], chops[y].items()):
+                if chop_end <= x1 or x >= x2:
+                    continue
+                if strip is None:
+                    break
+                if start == -1:
+                    start = x
+                strips.append(strip)
+                end = chop_end
+            else:
+                if start != -1:
+                    text_cells, style_cells = get_cells(strips)
+                    if len(text_cells) == end - start:
+                        for run_x1, run_x2 in self._update_span(
+                            y, x1, x2, start, text_cells, style_cells
+                        ):
+                            add_span((y, run_x1, run_x2))
+                        continue
+            # The cells could not be determined, so write the span and forget the cells
+            add_span((y, x1, x2))
+            self._text[y][x1:x2] = [None] * (x2 - x1)
+            self._style_lines[y][x1:x2] = [UNKNOWN_STYLE] * (x2 - x1)
+
+        return changed_spans
+
+    def _update_span(
+        self,
+        y: int,
+        x1: int,
+        x2: int,
+        start: int,
+        text_cells: list[str | None],
+        style_cells: list[int],
+    ) -> list[tuple[int, int]]:
+        """Compare and record new cells within a line.
+
+        Args:
+            y: The line.
+            x1: Start of the span.
+            x2: End of the span.
+            start: Offset of the first cell in `text_cells` and `style_cells`.
+            text_cells: New text, which may extend beyond the span.
+            style_cells: New style ids, which may extend beyond the span.
+
+        Returns:
+            A list of runs (X1, X2) of changed cells.
+        """
+        line_text = self._text[y]
+        line_styles = self._style_lines[y]
+        new_text = text_cells[x1 - start : x2 - start]
+        new_styles = style_cells[x1 - start : x2 - start]
+        if line_text[x1:x2] == new_text and line_styles[x1:x2] == new_styles:
+            return []
+
+        runs: list[tuple[int, int]] = []
+        run_start = -1
+        run_end = -1
+        for x, old_text, text, old_style, style in zip(
+            range(x1, x2), line_text[x1:x2], new_text, line_styles[x1:x2], new_styles
+        ):
+            if old_text != text or old_style != style:
+                if run_start == -1:
+                    run_start = x
+                elif x - run_end > MERGE_GAP:
+                    runs.append((run_start, run_end))
+                    run_start = x
+                run_end = x + 1
+        if run_start != -1:
+            runs.append((run_start, run_end))
+
+        # Runs shouldn't start or end within a double width character
+        end = start + len(text_cells)
+        aligned_runs: list[tuple[int, int]] = []
+        for run_start, run_end in runs:
+            while run_start > start and (
+                text_cells[run_start - start] == "" or line_text[run_start] == ""
+            ):
+                run_start -= 1
+            while run_end < end and (
+                text_cells[run_end - start] == "" or line_text[run_end] == ""
+            ):
+                run_end += 1
+            if aligned_runs and run_start <= aligned_runs[-1][1]:
+                run_start = aligned_runs.pop()[0]
+            aligned_runs.append((run_start, run_end))
+            line_text[run_start:run_end] = text_cells[
+                run_start - start : run_end - start
+            ]
+            line_styles[run_start:run_end] = style_cells[
+                run_start - start : run_end - start
+            ]
+        return aligned_runs
@@ -12,6 +12,7 @@ without having to render the entire screen.
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
@@ -30,9 +31,11 @@ from rich.segment import Segment
 from rich.style import Style
 
 from textual import errors
+from textual._cell_buffer import CellBuffer
 from textual._cells import cell_len
 from textual._context import visible_screen_stack
 from textual._loop import loop_last
+from textual._sgr_encoder import SGREncoder
 from textual.geometry import NULL_SPACING, Offset, Region, Size, Spacing
 from textual.map_geometry import MapGeometry
 from textual.strip import Strip, StripRenderable
@@ -59,6 +62,12 @@ CompositorMap: TypeAlias = "dict[Widget, MapGeometry]"
 class CompositorUpdate:
     """An update generated by the compositor, which also doubles as console renderables."""
 
+    def prepare(self) -> None:
+        """Prepare the update to be rendered in another thread.
+
+        Called on the event loop, prior to `render_segments`.
+        """
+
     def render_segments(self, console: Console) -> str:
         """Render the update to raw data, suitable for writing to terminal.
 
@@ -100,16 +109,17 @@ class LayoutUpdate(CompositorUpdate):
         Returns:
             Raw data with escape sequences.
         """
-        sequences: list[str] = []
-        append = sequences.append
+        encoder = SGREncoder(console)
+        write = encoder.write
+        write_strip = encoder.write_strip
         x = self.region.x
         move_to = Control.move_to
         for last, (y, line) in loop_last(enumerate(self.strips, self.region.y)):
-            append(move_to(x, y).segment.text)
-            append(line.render(console))
+            write(move_to(x, y).segment.text)
+            write_strip(line)
             if not last:
-                append("\n")
-        return "".join(sequences)
+                write("\n")
+        return encoder.finish()
 
     def __rich_repr__(self) -> rich.repr.Result:
         yield self.region
@@ -141,23 +151,25 @@ class InlineUpdate(CompositorUpdate):
         Returns:
             Raw data with escape sequences.
         """
-        sequences: list[str] = []
-        append = sequences.append
+        encoder = SGREncoder(console)
+        write = encoder.write
         for last, strip in loop_last(self.strips):
-            append(strip.render(console))
+            encoder.write_strip(strip)
+            # New lines may scroll the terminal, which fills with the current background
+            encoder.reset()
             if not last:
-                append("\n")
+                write("\n")
         if self.clear:
             if len(self.strips) > 1:
-                append("\n")
-            append("\x1b[J")  # Clear down
+                write("\n")
+            write("\x1b[J")  # Clear down
         if len(self.strips) > 1:
             back_lines = len(self.strips) if self.clear else len(self.strips) - 1
-            append(f"\x1b[{back_lines}A\r")  # Move cursor back to original position
+            write(f"\x1b[{back_lines}A\r")  # Move cursor back to original position
         else:
-            append("\r")
-        append("\x1b[6n")  # Query new cursor position
-        return "".join(sequences)
+            write("\r")
+        write("\x1b[6n")  # Query new cursor position
+        return encoder.finish()
 
 
 @rich.repr.auto(angular=True)
@@ -169,6 +181,7 @@ class ChopsUpdate(CompositorUpdate):
         chops: Sequence[Mapping[int, Strip | None]],
         spans: list[tuple[int, int, int]],
         chop_ends: list[list[int]],
+        scroll: tuple[int, int, int] | None = None,
     ) -> None:
         """A renderable which updates chops (fragments of lines).
 
@@ -176,10 +189,24 @@ class ChopsUpdate(CompositorUpdate):
             chops: A mapping of offsets to list of segments, per line.
             crop: Region to restrict update to.
             chop_ends: A list of the end offsets for each line
+            scroll: Lines to scroll prior to the update, as a tuple of
+                (TOP, BOTTOM, DISTANCE), or `None` for no scroll.
         """
         self.chops = chops
         self.spans = spans
         self.chop_ends = chop_ends
+        self.scroll = scroll
+        self._strips: list[tuple[int, int, Strip | None]] | None = None
+
+    @property
+    def scroll_sequence(self) -> str:
+        """Sequence to scroll lines, with a scroll region (may be empty)."""
+        if self.scroll is None:
+            return ""
+        top, bottom, distance = self.scroll
+        scroll = f"\x1b[{distance}S" if distance > 0 else f"\x1b[{-distance}T"
+        # Set scroll region, scroll, and reset scroll region
+        return f"\x1b[{top + 1};{bottom}r{scroll}\x1b[r"
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
@@ -188,7 +215,10 @@ class ChopsUpdate(CompositorUpdate):
         new_line = Segment.line()
         chops = self.chops
         chop_ends = self.chop_ends
-        last_y = self.spans[-1][0]
+        last_y = self.spans[-1][0] if self.spans else -1
+
+        if self.scroll is not None:
+            yield Segment(self.scroll_sequence)
 
         _cell_len = cell_len
         for y, x1, x2 in self.spans:
@@ -230,23 +260,20 @@ class ChopsUpdate(CompositorUpdate):
             if y != last_y:
                 yield new_line
 
-    def render_segments(self, console: Console) -> str:
-        """Render the update to raw data, suitable for writing to terminal.
-
-        Args:
-            console: Console instance.
+    def _get_strips(self) -> list[tuple[int, int, Strip | None]]:
+        """Get the strips to write, cropped to the spans.
 
         Returns:
-            Raw data with escape sequences.
+            A list of (X, Y, STRIP) tuples, where a strip of `None` is a new line.
         """
+        if self._strips is not None:
+            return self._strips
 
-        sequences: list[str] = []
-        append = sequences.append
-
-        move_to = Control.move_to
+        strips: list[tuple[int, int, Strip | None]] = []
+        add_strip = strips.append
         chops = self.chops
         chop_ends = self.chop_ends
-        last_y = self.spans[-1][0]
+        last_y = self.spans[-1][0] if self.spans else -1
 
         for y, x1, x2 in self.spans:
             line = chops[y]
@@ -255,28 +282,111 @@ class ChopsUpdate(CompositorUpdate):
                 if strip is None:
                     continue
 
-                if x > x2 or end <= x1:
+                if x >= x2 or end <= x1:
                     continue
 
                 if x2 > x >= x1 and end <= x2:
-                    append(move_to(x, y).segment.text)
-                    append(strip.render(console))
+                    add_strip((x, y, strip))
                     continue
 
-                strip = strip.crop(0, min(end, x2) - x)
-                append(move_to(x, y).segment.text)
-                append(strip.render(console))
+                strip = strip.crop(max(0, x1 - x), min(end, x2) - x)
+                add_strip((max(x, x1), y, strip))
 
             if y != last_y:
-                append("\n")
+                add_strip((0, y, None))
+
+        self._strips = strips
+        return strips
+
+    def prepare(self) -> None:
+        """Crop the strips, which uses caches that aren't safe to share between threads."""
+        self._get_strips()
 
-        terminal_sequences = "".join(sequences)
-        return terminal_sequences
+    def render_segments(self, console: Console) -> str:
+        """Render the update to raw data, suitable for writing to terminal.
+
+        Args:
+            console: Console instance.
+
+        Returns:
+            Raw data with escape sequences.
+        """
+
+        encoder = SGREncoder(console)
+        write = encoder.write
+        write_strip = encoder.write_strip
+        move_to = Control.move_to
+
+        write(self.scroll_sequence)
+        for x, y, strip in self._get_strips():
+            if strip is None:
+                write("\n")
+            else:
+                write(move_to(x, y).segment.text)
+                write_strip(strip)
+
+        return encoder.finish()
 
     def __rich_repr__(self) -> rich.repr.Result:
         yield from ()
 
 
+@rich.repr.auto(angular=True)
+class Frame:
+    """A compositor update, ready to be written to the terminal.
+
+    Frames may be encoded in a thread by the driver. A frame with a full update
+    supersedes any previous frames which haven't yet been written. Inline frames
+    move the cursor relative to the previous frame, and are never discarded.
+
+    Args:
+        update: The compositor update.
+        console: Console instance.
+        prefix: Sequence to write before the update.
+        suffix: Sequence to write after the update.
+        sync: Wrap the update in synchronized output sequences?
+    """
+
+    __slots__ = ["update", "console", "prefix", "suffix", "sync"]
+
+    def __init__(
+        self,
+        update: CompositorUpdate,
+        console: Console,
+        prefix: str = "",
+        suffix: str = "",
+        sync: bool = False,
+    ) -> None:
+        update.prepare()
+        self.update = update
+        self.console = console
+        self.prefix = prefix
+        self.suffix = suffix
+        self.sync = sync
+
+    def __rich_repr__(self) -> rich.repr.Result:
+        yield self.update
+        yield "sync", self.sync, False
+
+    @property
+    def is_full(self) -> bool:
+        """Does the frame update the entire screen?"""
+        return isinstance(self.update, LayoutUpdate)
+
+    @property
+    def is_inline(self) -> bool:
+        """Is the frame an inline update (positioned relative to the previous frame)?"""
+        return isinstance(self.update, InlineUpdate)
+
+    def render(self) -> str:
+        """Render the frame to raw data, suitable for writing to the terminal.
+
+        Returns:
+            Raw data with escape sequences (not including synchronized output sequences).
+        """
+        return f"{self.prefix}{self.update.render_segments(self.console)}{self.suffix}"
+
+
 @rich.repr.auto(angular=True)
 class Compositor:
     """Responsible for storing information regarding the relative positions of Widgets and rendering them."""
@@ -304,12 +414,38 @@ class Compositor:
         # The points in each line where the line bisects the left and right edges of the widget
         self._cuts: list[list[int]] | None = None
 
+        # The visible region of each widget, when the cuts were last updated
+        self._cut_regions: dict[Widget, Region] = {}
+
+        # A count of the widget edges at each cut, for each line
+        self._cut_counts: list[dict[int, int]] = []
+
+        # The sorted cuts for each line, which are updated incrementally
+        self._cut_lines: list[list[int]] = []
+
         # Regions that require an update
         self._dirty_regions: set[Region] = set()
 
+        # The cells written by the last update
+        self._cell_buffer: CellBuffer | None = None
+
+        # The scroll offsets of scrollable widgets in the last update
+        self._scroll_offsets: dict[Widget, Offset] = {}
+
+        # Number of cells hidden behind widgets in front, which were not rendered in the last render
+        self.culled_cells = 0
+
         # Mapping of line numbers on to lists of widget and regions
         self._layers_visible: list[list[tuple[Widget, Region, Region]]] | None = None
 
+        # The layers_visible used to build the hit test index
+        self._hit_test_layers: list[list[tuple[Widget, Region, Region]]] | None = None
+
+        # Cuts and the front-most widget (and region) between each cut, built lazily for each line
+        self._hit_test_lines: list[
+            tuple[list[int], list[tuple[Widget, Region] | None]] | None
+        ] = []
+
     def clear(self) -> None:
         """Remove all references to widgets (used when the screen closes)."""
         self._full_map.clear()
@@ -318,6 +454,38 @@ class Compositor:
         self.widgets.clear()
         self._visible_widgets = None
         self._layers_visible = None
+        self._hit_test_layers = None
+        self._hit_test_lines.clear()
+        self._cell_buffer = None
+        self._scroll_offsets.clear()
+        self._cuts = None
+        self._cut_regions.clear()
+        self._cut_lines.clear()
+
+    def invalidate_cells(self) -> None:
+        """Forget the cells written by previous updates.
+
+        Call this when the terminal may have been written to by something other than
+        this compositor, so that the next partial update doesn't skip any cells.
+        """
+        if self._cell_buffer is not None:
+            self._cell_buffer.invalidate()
+
+    def _get_cell_buffer(self) -> CellBuffer:
+        """Get a cell buffer which matches the size of the compositor.
+
+        Returns:
+            A cell buffer.
+        """
+        width, height = self.size
+        cell_buffer = self._cell_buffer
+        if (
+            cell_buffer is None
+            or cell_buffer.width != width
+            or cell_buffer.height != height
+        ):
+            cell_buffer = self._cell_buffer = CellBuffer(width, height)
+        return cell_buffer
 
     @classmethod
     def _regions_to_spans(
@@ -395,6 +563,7 @@ class Compositor:
 
         # Replace map and widgets
         self._full_map = map
+        self._full_map_invalidated = False
         self.widgets = widgets
 
         # Contains widgets + geometry for every widget that changed (added, removed, or updated)
@@ -475,6 +644,119 @@ class Compositor:
 
         return exposed_widgets
 
+    def reflow_widgets(
+        self, parent: Widget, size: Size, widgets: Iterable[Widget]
+    ) -> tuple[ReflowResult, list[tuple[Widget, MapGeometry]]] | None:
+        """Reflow (layout) only the children of the given containers.
+
+        This is a fast-path for layout changes within containers whose size doesn't
+        depend on their children. The new geometry is spliced in to the existing map.
+
+        Args:
+            parent: The root widget.
+            size: Size of the area to be filled.
+            widgets: Containers to reflow.
+
+        Returns:
+            Hidden, shown, and resized widgets, and the new geometry of the reflowed
+                widgets in layer order. Or `None` if a full reflow is required.
+        """
+        if (
+            parent is not self.root
+            or size != self.size
+            or self._full_map_invalidated
+            or self._visible_map is not None
+        ):
+            return None
+
+        old_map = self._full_map
+        containers = set(widgets)
+        roots: list[tuple[Widget, MapGeometry]] = []
+        for widget in containers:
+            geometry = old_map.get(widget)
+            # Overlays (and their children) have an ambiguous order, so can't be reflowed on their own
+            if geometry is None or geometry.order[0] != (0, 0, 0):
+                return None
+            if len(geometry.order) == 1:
+                return None
+            if not containers.intersection(widget.ancestors):
+                roots.append((widget, geometry))
+
+        # Find the current geometry of the containers and their descendants
+        # Descendants have an order which starts with the order of the container
+        root_orders = [(widget, geometry.order) for widget, geometry in roots]
+        old_sub_map: CompositorMap = {}
+        for widget, geometry in old_map.items():
+            order = geometry.order
+            if order[0] == (1, 0, 0):
+                ancestors = widget.ancestors
+                if any(root in ancestors for root, _ in root_orders):
+                    old_sub_map[widget] = geometry
+                continue
+            for _, root_order in root_orders:
+                if order[: len(root_order)] == root_order:
+                    old_sub_map[widget] = geometry
+                    break
+
+        sub_map: CompositorMap = {}
+        sub_widgets: set[Widget] = set()
+        for widget, geometry in roots:
+            root_map, root_widgets = self._arrange_root(
+                widget, size, visible_only=False, root_geometry=geometry
+            )
+            sub_map.update(root_map)
+            sub_widgets.update(root_widgets)
+
+        self._cuts = None
+        self._layers = None
+        self._layers_visible = None
+        self._visible_widgets = None
+
+        map = {
+            widget: geometry
+            for widget, geometry in old_map.items()
+            if widget not in old_sub_map
+        }
+        map.update(sub_map)
+        self._full_map = map
+
+        old_widgets = self.widgets & old_sub_map.keys()
+        hidden_widgets = old_widgets - sub_widgets
+        self.widgets = (self.widgets - old_widgets) | sub_widgets
+
+        shown_widgets = sub_map.keys() - old_map.keys()
+
+        # Contains widgets + geometry for every widget that changed (added, removed, or updated)
+        changes = sub_map.items() ^ old_sub_map.items()
+
+        # Mark dirty regions.
+        screen_region = size.region
+        if screen_region not in self._dirty_regions:
+            regions = {
+                region
+                for region in (
+                    map_geometry.clip.intersection(map_geometry.region)
+                    for _, map_geometry in changes
+                )
+                if region
+            }
+            self._dirty_regions.update(regions)
+
+        resized_widgets = {
+            widget
+            for widget, (region, *_) in changes
+            if (widget in old_map and old_map[widget].region[2:] != region[2:])
+        }
+        layers = sorted(sub_map.items(), key=lambda item: item[1].order, reverse=True)
+        return (
+            ReflowResult(
+                hidden=hidden_widgets,
+                shown=shown_widgets,
+                resized=resized_widgets,
+            ),
+            layers,
+        )
+
     @property
     def full_map(self) -> CompositorMap:
         """Lazily built compositor map that covers all widgets."""
@@ -522,7 +804,11 @@ class Compositor:
         return self._visible_widgets
 
     def _arrange_root(
-        self, root: Widget, size: Size, visible_only: bool = True
+        self,
+        root: Widget,
+        size: Size,
+        visible_only: bool = True,
+        root_geometry: MapGeometry | None = None,
     ) -> tuple[CompositorMap, set[Widget]]:
         """Arrange a widget's children based on its layout attribute.
 
@@ -530,6 +816,8 @@ class Compositor:
             root: Top level widget.
             size: Size of visible area (screen).
             visible_only: Only update visible widgets (used in scrolling).
+            root_geometry: Existing geometry of the root, if it is not the top level
+                widget (used to arrange part of the screen).
 
         Returns:
             Compositor map and set of widgets.
@@ -718,17 +1006,29 @@ class Compositor:
                     dock_gutter,
                 )
 
-        # Add top level (root) widget
-        add_widget(
-            root,
-            size.region,
-            size.region,
-            ((0, 0, 0),),
-            layer_order,
-            size.region,
-            True,
-            NULL_SPACING,
-        )
+        if root_geometry is None:
+            # Add top level (root) widget
+            add_widget(
+                root,
+                size.region,
+                size.region,
+                ((0, 0, 0),),
+                layer_order,
+                size.region,
+                True,
+                NULL_SPACING,
+            )
+        else:
+            add_widget(
+                root,
+                root_geometry.virtual_region,
+                root_geometry.region,
+                root_geometry.order,
+                root_geometry.order[-1][2],
+                root_geometry.clip,
+                True,
+                root_geometry.dock_gutter,
+            )
         widgets -= invisible_widgets
         return map, widgets
 
@@ -818,13 +1118,55 @@ class Compositor:
             A tuple of the widget and its region.
         """
 
-        contains = Region.contains
-        if len(self.layers_visible) > y >= 0:
-            for widget, cropped_region, region in self.layers_visible[int(y)]:
+        layers_visible = self.layers_visible
+        if len(layers_visible) > y >= 0:
+            cuts, widgets = self._get_hit_test_line(int(y))
+            index = bisect_right(cuts, x) - 1
+            if 0 <= index < len(widgets):
+                hit = widgets[index]
+                if hit is not None and hit[0].visible:
+                    return hit
+            # Widgets with visibility: hidden are in the index, so search for widgets behind
+            contains = Region.contains
+            for widget, cropped_region, region in layers_visible[int(y)]:
                 if contains(cropped_region, x, y) and widget.visible:
                     return widget, region
         raise errors.NoWidget(f"No widget under screen coordinate ({x}, {y})")
 
+    def _get_hit_test_line(
+        self, y: int
+    ) -> tuple[list[int], list[tuple[Widget, Region] | None]]:
+        """Get the hit test index for a line, which maps offsets on to widgets.
+
+        Args:
+            y: Y coordinate.
+
+        Returns:
+            A tuple of cuts, and the front-most widget and region between each cut
+                (or `None` if there is no widget).
+        """
+        layers_visible = self.layers_visible
+        if self._hit_test_layers is not layers_visible:
+            # Layers have changed since the last hit test
+            self._hit_test_layers = layers_visible
+            self._hit_test_lines = [None] * len(layers_visible)
+        hit_test_line = self._hit_test_lines[y]
+        if hit_test_line is None:
+            line = layers_visible[y]
+            cuts = sorted(
+                {x for _, cropped_region, _ in line for x in cropped_region.column_span}
+            )
+            widgets: list[tuple[Widget, Region] | None] = []
+            for x in cuts[:-1]:
+                for widget, cropped_region, region in line:
+                    if cropped_region.x <= x < cropped_region.right:
+                        widgets.append((widget, region))
+                        break
+                else:
+                    widgets.append(None)
+            hit_test_line = self._hit_test_lines[y] = (cuts, widgets)
+        return hit_test_line
+
     def get_widgets_at(self, x: int, y: int) -> Iterable[tuple[Widget, Region]]:
         """Get all widgets under a given coordinate.
 
@@ -857,6 +1199,19 @@ class Compositor:
         if widget not in self.visible_widgets:
             return Style.null()
 
+        # The style of the cell in the last update, if it's not about to change
+        cell_buffer = self._cell_buffer
+        if (
+            cell_buffer is not None
+            and (cell_buffer.width, cell_buffer.height) == self.size
+            and not any(
+                dirty_region.contains(x, y) for dirty_region in self._dirty_regions
+            )
+        ):
+            style = cell_buffer.get_style(int(x), int(y))
+            if style is not None:
+                return style
+
         x -= region.x
         y -= region.y
 
@@ -977,33 +1332,75 @@ class Compositor:
             return self._cuts
 
         width, height = self.size
-        cuts = [[0, width] for _ in range(height)]
+        if len(self._cut_lines) != height or (
+            height and self._cut_lines[0][-1] != width
+        ):
+            # Size has changed, so start from scratch
+            self._cut_regions.clear()
+            self._cut_counts = [{} for _ in range(height)]
+            self._cut_lines = [sorted({0, width}) for _ in range(height)]
 
         intersection = Region.intersection
-        extend = list.extend
+        cut_regions = {
+            widget: visible_region
+            for widget, (region, clip) in self.visible_widgets.items()
+            if (visible_region := intersection(region, clip))
+        }
+        old_cut_regions = self._cut_regions
+        cut_counts = self._cut_counts
+        changed_lines: set[int] = set()
 
-        for region, clip in self.visible_widgets.values():
-            x, y, region_width, region_height = intersection(region, clip)
-            if region_width and region_height:
-                region_cuts = (x, x + region_width)
-                for cut in cuts[y : y + region_height]:
-                    extend(cut, region_cuts)
+        def update_counts(region: Region, change: int) -> None:
+            """Add or remove the cuts at the edges of a region.
 
-        # Sort the cuts for each line
-        self._cuts = [sorted(set(line_cuts)) for line_cuts in cuts]
+            Args:
+                region: A visible region.
+                change: 1 to add the cuts, -1 to remove the cuts.
+            """
+            x, y, region_width, region_height = region
+            x2 = x + region_width
+            for counts in cut_counts[y : y + region_height]:
+                for cut in (x, x2):
+                    count = counts.get(cut, 0) + change
+                    if count:
+                        counts[cut] = count
+                    else:
+                        del counts[cut]
+            changed_lines.update(range(y, y + region_height))
+
+        get_old_region = old_cut_regions.get
+        get_new_region = cut_regions.get
+        for widget, region in old_cut_regions.items():
+            if get_new_region(widget) != region:
+                update_counts(region, -1)
+        for widget, region in cut_regions.items():
+            if get_old_region(widget) != region:
+                update_counts(region, +1)
+        self._cut_regions = cut_regions
+
+        # Sort the cuts for lines which changed
+        cut_lines = self._cut_lines
+        edges = {0, width}
+        for y in changed_lines:
+            cut_lines[y] = sorted(edges.union(cut_counts[y]))
+        self._cuts = cut_lines[:]
 
         return self._cuts
 
     def _get_renders(
         self, crop: Region | None = None
-    ) -> Iterable[tuple[Region, Region, list[Strip]]]:
+    ) -> Iterable[tuple[Region, list[Strip]]]:
         """Get rendered widgets (lists of segments) in the composition.
 
+        Widgets are rendered front to back. Lines which are entirely covered by
+        widgets in front are culled (not rendered), as are lines outside of the
+        crop region. The number of culled cells is stored in `culled_cells`.
+
         Args:
             crop: Region to crop to, or `None` for entire screen.
 
         Returns:
-            An iterable of <region>, <clip region>, and <strips>
+            An iterable of <render region> and <strips>.
         """
         # If a renderable throws an error while rendering, the user likely doesn't care about the traceback
         # up to this point.
@@ -1012,6 +1409,7 @@ class Compositor:
         _Region = Region
 
         visible_widgets = self.visible_widgets
+        self.culled_cells = 0
 
         if crop:
             crop_overlaps = crop.overlaps
@@ -1020,44 +1418,73 @@ class Compositor:
                 for widget, (region, clip) in visible_widgets.items()
                 if crop_overlaps(clip)
             ]
+            crop_y1, crop_y2 = crop.line_span
         else:
             widget_regions = [
                 (widget, region, clip)
                 for widget, (region, clip) in visible_widgets.items()
             ]
+            crop_y1, crop_y2 = 0, self.size.height
 
         intersection = _Region.intersection
-        contains_region = _Region.contains_region
+
+        # Spans of each line which are covered by widgets in front
+        coverage: dict[int, list[tuple[int, int]]] = {}
+        get_coverage = coverage.get
+
+        def is_covered(y: int, x1: int, x2: int) -> bool:
+            """Check if a span of a line is covered by a widget in front."""
+            for cover_x1, cover_x2 in get_coverage(y, ()):
+                if cover_x1 <= x1 and cover_x2 >= x2:
+                    return True
+            return False
+
+        def add_coverage(y: int, x1: int, x2: int) -> None:
+            """Add a span to the coverage of a line, combining overlapping spans."""
+            spans = coverage.get(y)
+            if spans is None:
+                coverage[y] = [(x1, x2)]
+                return
+            merged: list[tuple[int, int]] = []
+            for cover_x1, cover_x2 in sorted([*spans, (x1, x2)]):
+                if merged and cover_x1 <= merged[-1][1]:
+                    if cover_x2 > merged[-1][1]:
+                        merged[-1] = (merged[-1][0], cover_x2)
+                else:
+                    merged.append((cover_x1, cover_x2))
+            coverage[y] = merged
 
         for widget, region, clip in widget_regions:
-            if contains_region(clip, region):
-                yield (
-                    region,
-                    clip,
-                    widget.render_lines(
-                        _Region(
-                            0,
-                            0,
-                            region.width,
-                            region.height,
-                        )
-                    ),
-                )
-            else:
-                new_x, new_y, new_width, new_height = intersection(region, clip)
-                if new_width and new_height:
-                    yield (
-                        region,
-                        clip,
-                        widget.render_lines(
-                            _Region(
-                                new_x - region.x,
-                                new_y - region.y,
-                                new_width,
-                                new_height,
-                            )
-                        ),
+            render_x, render_y, render_width, render_height = intersection(region, clip)
+            if not (render_width and render_height):
+                continue
+            render_x2 = render_x + render_width
+            y1 = max(render_y, crop_y1)
+            y2 = min(render_y + render_height, crop_y2)
+            if y1 >= y2:
+                continue
+            visible_lines = [
+                y for y in range(y1, y2) if not is_covered(y, render_x, render_x2)
+            ]
+            for y in range(y1, y2):
+                add_coverage(y, render_x, render_x2)
+            if not visible_lines:
+                self.culled_cells += (y2 - y1) * render_width
+                continue
+            first_line = visible_lines[0]
+            render_height = visible_lines[-1] - first_line + 1
+            self.culled_cells += (y2 - y1 - render_height) * render_width
+            yield (
+                _Region(render_x, first_line, render_width, render_height),
+                widget.render_lines(
+                    _Region(
+                        render_x - region.x,
+                        first_line - region.y,
+                        render_width,
+                        render_height,
                     )
+                ),
+            )
 
     def render_update(
         self,
@@ -1116,12 +1543,11 @@ class Compositor:
         self._dirty_regions.clear()
         crop = screen_region
         chops = self._render_chops(crop, lambda y: True)
+        render_strips = [Strip.join(chop.values()) for chop in chops]
+        self._get_cell_buffer().update_lines(render_strips)
+        self._update_scroll_offsets()
         if simplify:
-            render_strips = [
-                Strip.join(chop.values()).simplify().discard_meta() for chop in chops
-            ]
-        else:
-            render_strips = [Strip.join(chop.values()) for chop in chops]
+            render_strips = [strip.simplify().discard_meta() for strip in render_strips]
 
         return LayoutUpdate(render_strips, screen_region)
 
@@ -1143,7 +1569,79 @@ class Compositor:
             return None
         chops = self._render_chops(crop, is_rendered_line)
         chop_ends = [cut_set[1:] for cut_set in self.cuts]
-        return ChopsUpdate(chops, spans, chop_ends)
+        cell_buffer = self._get_cell_buffer()
+        scroll = self._get_scroll(spans)
+        if scroll is not None:
+            cell_buffer.scroll(*scroll)
+        self._update_scroll_offsets()
+        # Only write the cells which differ from those already on the terminal
+        spans = cell_buffer.update(chops, chop_ends, spans)
+        if not spans and scroll is None:
+            return None
+        return ChopsUpdate(chops, spans, chop_ends, scroll)
+
+    def _update_scroll_offsets(self) -> None:
+        """Record the scroll offsets of visible scrollable widgets."""
+        self._scroll_offsets = {
+            widget: widget.scroll_offset
+            for widget in self.visible_widgets
+            if widget.is_scrollable
+        }
+
+    def _get_scroll(
+        self, spans: list[tuple[int, int, int]]
+    ) -> tuple[int, int, int] | None:
+        """Find lines which may be scrolled by the terminal, rather than repainted.
+
+        This is possible when a widget spanning the width of the screen, which isn't
+        covered by other widgets, has scrolled vertically since the last update.
+        The scrolled lines must all be updated, so that anything which didn't move
+        with the scroll is repainted.
+
+        Args:
+            spans: Spans which will be updated.
+
+        Returns:
+            A tuple of (TOP, BOTTOM, DISTANCE), or `None` if there is no scroll.
+        """
+        previous_offsets = self._scroll_offsets
+        if not previous_offsets:
+            return None
+        width = self.size.width
+        updated_lines = {y for y, x1, x2 in spans if x1 == 0 and x2 == width}
+        if not updated_lines:
+            return None
+
+        scroll: tuple[int, int, int] | None = None
+        front_regions: list[tuple[Widget, Region]] = []
+        intersection = Region.intersection
+        for widget, (region, clip) in self.visible_widgets.items():
+            previous_offset = previous_offsets.get(widget)
+            front_regions.append((widget, intersection(region, clip)))
+            if previous_offset is None or region.x != 0 or region.width != width:
+                continue
+            scroll_x, scroll_y = widget.scroll_offset
+            distance = scroll_y - previous_offset.y
+            if scroll_x != previous_offset.x or not distance:
+                continue
+            scroll_region = intersection(
+                widget._get_scrollable_region(region.shrink(widget.styles.gutter)),
+                clip,
+            )
+            top, bottom = scroll_region.line_span
+            if abs(distance) >= bottom - top:
+                continue
+            if not updated_lines.issuperset(range(top, bottom)):
+                continue
+            if any(
+                front_region.overlaps(scroll_region)
+                and widget not in front_widget.ancestors
+                for front_widget, front_region in front_regions[:-1]
+            ):
+                continue
+            if scroll is None or bottom - top > scroll[1] - scroll[0]:
+                scroll = (top, bottom, distance)
+        return scroll
 
     def render_strips(self, size: Size | None = None) -> list[Strip]:
         """Render to a list of strips.
@@ -1183,10 +1681,8 @@ class Compositor:
 
         # Go through all the renders in reverse order and fill buckets with no render
         renders = self._get_renders(crop)
-        intersection = Region.intersection
 
-        for region, clip, strips in renders:
-            render_region = intersection(region, clip)
+        for render_region, strips in renders:
             render_x = render_region.x
             first_cut, last_cut = render_region.column_span
 
@@ -1217,8 +1713,10 @@ class Compositor:
         """
 
         # If there are any *new* widgets we need to invalidate the full map
-        if not self._full_map_invalidated and not widgets.issubset(
-            self.visible_widgets.keys()
+        if (
+            not self._full_map_invalidated
+            and not widgets.issubset(self.visible_widgets.keys())
+            and not widgets.issubset(self._full_map.keys())
         ):
             self._full_map_invalidated = True
 
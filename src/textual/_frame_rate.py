@@ -0,0 +1,74 @@
+"""
+Adapts the frame rate to the speed of the terminal.
+
+When writing to the terminal takes a significant part of each frame (over a slow or
+congested connection for instance), updating less often leaves more of the connection
+free for input, and avoids queuing frames that will be quickly replaced.
+"""
+
+from __future__ import annotations
+
+import rich.repr
+from typing_extensions import Final
+
+TARGET_LOAD: Final[float] = 0.5
+"""Fraction of the frame period that output may take before the frame rate is reduced."""
+
+
+@rich.repr.auto(angular=True)
+class FrameRate:
+    """Chooses a frame rate between bounds, from the measured time to write a frame.
+
+    The frame rate is reduced as soon as output is too slow, and raised gradually
+    when output is fast enough.
+
+    Args:
+        max_fps: Maximum frames per second.
+        min_fps: Minimum frames per second, or `None` for a fixed frame rate.
+    """
+
+    def __init__(self, max_fps: int, min_fps: int | None = None) -> None:
+        self.max_fps = max(1, max_fps)
+        self.min_fps = self.max_fps if min_fps is None else min(min_fps, self.max_fps)
+        self.fps = self.max_fps
+        """The current frame rate."""
+
+    def __rich_repr__(self) -> rich.repr.Result:
+        yield self.fps
+        yield "min_fps", self.min_fps
+        yield "max_fps", self.max_fps
+
+    @property
+    def adaptive(self) -> bool:
+        """Is the frame rate adaptive?"""
+        return self.min_fps < self.max_fps
+
+    @property
+    def period(self) -> float:
+        """Time between frames, in seconds."""
+        return 1 / self.fps
+
+    def update(self, output_time: float | None) -> bool:
+        """Update the frame rate from the time taken to write frames.
+
+        Args:
+            output_time: Average time to write and flush a frame, in seconds, or
+                `None` if it is not known.
+
+        Returns:
+            `True` if the frame rate changed, otherwise `False`.
+        """
+        if output_time is None or not self.adaptive:
+            return False
+        fps = self.fps
+        target_fps = (
+            self.max_fps if output_time <= 0 else int(TARGET_LOAD / output_time)
+        )
+        if target_fps < fps:
+            new_fps = max(self.min_fps, target_fps)
+        elif target_fps > fps:
+            new_fps = min(self.max_fps, target_fps, fps + max(1, fps // 10))
+        else:
+            return False
+        self.fps = new_fps
+        return new_fps != fps
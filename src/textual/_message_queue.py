@@ -0,0 +1,71 @@
+"""
+A message queue which coalesces messages.
+
+A message may declare a coalesce key (with [`Message.coalesce_key`][textual.message.Message.coalesce_key]).
+When a message is posted while a message with the same key is pending, the pending message is
+replaced. This keeps queues short under high-frequency events, such as mouse movement or
+resizing the terminal.
+
+Messages are never reordered across messages without a coalesce key (such as key presses,
+mouse clicks, or callbacks), so a message may only replace a pending message if every message
+queued after it may also be coalesced.
+"""
+
+from __future__ import annotations
+
+from asyncio import Queue
+from collections import deque
+from typing import TYPE_CHECKING, Hashable
+
+if TYPE_CHECKING:
+    from textual.message import Message
+
+    _MessageQueueBase = Queue["Message | None"]
+else:
+    _MessageQueueBase = Queue
+
+
+class MessageQueue(_MessageQueueBase):
+    """An asyncio queue of messages, which coalesces messages with the same coalesce key.
+
+    A `None` in the queue signals that the queue is closed.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: deque[Message | None] = deque()
+        self._pending: dict[Hashable, Message] = {}
+        """Messages which may be replaced, keyed on their coalesce key."""
+        self.coalesced_count = 0
+        """Number of messages discarded because a newer message had the same coalesce key."""
+
+    def _put(self, message: Message | None) -> None:
+        coalesce_key = None if message is None else message.coalesce_key()
+        if coalesce_key is None:
+            # Messages queued before this one may no longer be replaced
+            self._pending.clear()
+            self._queue.append(message)
+            return
+        assert message is not None
+        pending_message = self._pending.get(coalesce_key)
+        self._pending[coalesce_key] = message
+        if pending_message is None:
+            self._queue.append(message)
+            return
+        # Replace the pending message (found by identity, as messages may define __eq__)
+        queue = self._queue
+        for index in range(len(queue) - 1, -1, -1):
+            if queue[index] is pending_message:
+                queue[index] = message
+                break
+        message._coalesce(pending_message)
+        self.coalesced_count += 1
+        # Only one of the two messages will be processed
+        self.task_done()
+
+    def _get(self) -> Message | None:
+        message = self._queue.popleft()
+        if self._pending and message is not None:
+            coalesce_key = message.coalesce_key()
+            if coalesce_key is not None and self._pending.get(coalesce_key) is message:
+                del self._pending[coalesce_key]
+        return message
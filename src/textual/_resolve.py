@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from fractions import Fraction
-from itertools import accumulate
+from math import gcd
 from typing import TYPE_CHECKING, Iterable, Sequence, cast
 
 from typing_extensions import Literal
@@ -15,6 +15,43 @@ if TYPE_CHECKING:
     from textual.widget import Widget
 
 
+def get_common_denominator(values: Iterable[Fraction | int]) -> int:
+    """Get the lowest common denominator of a number of fractions.
+
+    Multiplying each value by the common denominator produces an integer, so that
+    positions may be accumulated with (fast) integer arithmetic rather than fractions.
+    Positions are then converted back to cells with a floor division, which gives the
+    same results as the equivalent fraction arithmetic.
+
+    Args:
+        values: Fractions (or integers).
+
+    Returns:
+        Lowest common denominator.
+    """
+    scale = 1
+    for denominator in {value.denominator for value in values}:
+        if scale % denominator:
+            scale = scale * denominator // gcd(scale, denominator)
+    return scale
+
+
+def _sum_cells(values: list[Fraction]) -> int:
+    """Sum (non-negative) fractions, and round down to a whole number of cells.
+
+    Args:
+        values: Fractions to sum.
+
+    Returns:
+        Number of cells.
+    """
+    scale = get_common_denominator(values)
+    return (
+        sum([value.numerator * (scale // value.denominator) for value in values])
+        // scale
+    )
+
+
 def resolve(
     dimensions: Sequence[Scalar],
     total: int,
@@ -68,19 +105,17 @@ def resolve(
             max(Fraction(min_size), fraction) for fraction in resolved_fractions
         ]
 
-    fraction_gutter = Fraction(gutter)
-    offsets = [0] + [
-        fraction.__floor__()
-        for fraction in accumulate(
-            value
-            for fraction in resolved_fractions
-            for value in (fraction, fraction_gutter)
-        )
-    ]
-    results = [
-        (offset1, offset2 - offset1)
-        for offset1, offset2 in zip(offsets[::2], offsets[1::2])
-    ]
+    # Accumulate offsets as integers scaled by the common denominator
+    scale = get_common_denominator(resolved_fractions)
+    scaled_gutter = gutter * scale
+    results: list[tuple[int, int]] = []
+    add_result = results.append
+    position = 0
+    for fraction in resolved_fractions:
+        offset = position // scale
+        position += fraction.numerator * (scale // fraction.denominator)
+        add_result((offset, position // scale - offset))
+        position += scaled_gutter
 
     return results
 
@@ -244,14 +279,12 @@ def resolve_box_models(
     # If all box models have been calculated
     widget_styles = [widget.styles for widget in widgets]
     if resolve_dimension == "width":
-        total_remaining = int(
-            sum(
-                [
-                    box_model.width
-                    for widget, box_model in zip(widgets, box_models)
-                    if (box_model is not None and widget.styles.overlay != "screen")
-                ]
-            )
+        total_remaining = _sum_cells(
+            [
+                box_model.width
+                for widget, box_model in zip(widgets, box_models)
+                if (box_model is not None and widget.styles.overlay != "screen")
+            ]
         )
 
         remaining_space = int(max(0, size.width - total_remaining - margin_width))
@@ -271,14 +304,12 @@ def resolve_box_models(
         width_fraction = fraction_unit
         height_fraction = Fraction(margin_size.height)
     else:
-        total_remaining = int(
-            sum(
-                [
-                    box_model.height
-                    for widget, box_model in zip(widgets, box_models)
-                    if (box_model is not None and widget.styles.overlay != "screen")
-                ]
-            )
+        total_remaining = _sum_cells(
+            [
+                box_model.height
+                for widget, box_model in zip(widgets, box_models)
+                if (box_model is not None and widget.styles.overlay != "screen")
+            ]
         )
 
         remaining_space = int(max(0, size.height - total_remaining - margin_height))
@@ -0,0 +1,191 @@
+"""
+An encoder which converts strips to terminal sequences.
+
+Rather than setting and resetting the style for every segment, the encoder tracks the
+SGR (Select Graphic Rendition) state of the terminal over a whole update, and writes only
+the codes required to get from one style to the next.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional
+
+from rich.color import Color, ColorSystem
+from rich.console import Console
+from rich.style import Style
+from typing_extensions import Final
+
+from textual.strip import Strip
+
+RESET: Final = "\x1b[0m"
+"""Sequence to reset all attributes."""
+
+LINK_END: Final = "\x1b]8;;\x1b\\"
+"""Sequence to end a hyperlink."""
+
+ATTRIBUTE_CODES: Final[tuple[tuple[int, str, str], ...]] = (
+    (1 << 0, "1", "22"),  # bold
+    (1 << 1, "2", "22"),  # dim
+    (1 << 2, "3", "23"),  # italic
+    (1 << 3, "4", "24"),  # underline
+    (1 << 4, "5", "25"),  # blink
+    (1 << 5, "6", "25"),  # blink2
+    (1 << 6, "7", "27"),  # reverse
+    (1 << 7, "8", "28"),  # conceal
+    (1 << 8, "9", "29"),  # strike
+    (1 << 9, "21", "24"),  # underline2
+    (1 << 10, "51", "54"),  # frame
+    (1 << 11, "52", "54"),  # encircle
+    (1 << 12, "53", "55"),  # overline
+)
+"""Bit, code to enable, and code to disable for each attribute."""
+
+
+def _get_color_codes(
+    color: Color | None, color_system: ColorSystem, foreground: bool
+) -> str:
+    """Get the SGR codes for a color.
+
+    Args:
+        color: A color, or `None` for the default color.
+        color_system: Color system of the terminal.
+        foreground: `True` for a foreground color, `False` for background.
+
+    Returns:
+        Codes separated by semicolons.
+    """
+    if color is None:
+        return "39" if foreground else "49"
+    return ";".join(color.downgrade(color_system).get_ansi_codes(foreground))
+
+
+@lru_cache(maxsize=1024 * 4)
+def get_transition(
+    previous: Optional[Style], style: Style, color_system: ColorSystem
+) -> str:
+    """Get the sequence to switch the terminal from one style to another.
+
+    Args:
+        previous: The current style, or `None` if the terminal has default attributes.
+        style: The new style.
+        color_system: Color system of the terminal.
+
+    Returns:
+        Sequence to write, which may be empty if no change is required.
+    """
+    codes = style._make_ansi_codes(color_system)
+    if previous is None:
+        return f"\x1b[{codes}m" if codes else ""
+    if not codes:
+        return RESET if previous._make_ansi_codes(color_system) else ""
+
+    previous_attributes = previous._attributes & previous._set_attributes
+    attributes = style._attributes & style._set_attributes
+    changes: list[str] = []
+    add_change = changes.append
+
+    disabled = previous_attributes & ~attributes
+    if disabled:
+        disable_codes = {off for bit, _, off in ATTRIBUTE_CODES if disabled & bit}
+        changes.extend(sorted(disable_codes))
+        # Some attributes share a code to disable, which may need re-enabling
+        for bit, on, off in ATTRIBUTE_CODES:
+            if attributes & previous_attributes & bit and off in disable_codes:
+                add_change(on)
+    enabled = attributes & ~previous_attributes
+    if enabled:
+        changes.extend(on for bit, on, _ in ATTRIBUTE_CODES if enabled & bit)
+
+    color = _get_color_codes(style._color, color_system, True)
+    if color != _get_color_codes(previous._color, color_system, True):
+        add_change(color)
+    bgcolor = _get_color_codes(style._bgcolor, color_system, False)
+    if bgcolor != _get_color_codes(previous._bgcolor, color_system, False):
+        add_change(bgcolor)
+
+    if not changes:
+        return ""
+    delta = ";".join(changes)
+    # A reset followed by the full style may be shorter than the changes
+    if len(delta) > len(codes) + 2:
+        return f"\x1b[0;{codes}m"
+    return f"\x1b[{delta}m"
+
+
+class SGREncoder:
+    """Encodes strips and control sequences, writing only changes in style.
+
+    Args:
+        console: Console, used to get the color system of the terminal.
+    """
+
+    def __init__(self, console: Console) -> None:
+        self._color_system = console._color_system
+        self._output: list[str] = []
+        self._style: Style | None = None
+        self._link: tuple[str, str] | None = None
+
+    def write(self, sequence: str) -> None:
+        """Write a sequence that doesn't change the style (such as cursor movement).
+
+        Args:
+            sequence: Sequence to write.
+        """
+        self._output.append(sequence)
+
+    def write_strip(self, strip: Strip) -> None:
+        """Write the segments in a strip.
+
+        Args:
+            strip: A strip.
+        """
+        append = self._output.append
+        color_system = self._color_system
+        if color_system is None:
+            for text, style, _ in strip:
+                if style is not None:
+                    append(text)
+            return
+        current_style = self._style
+        current_link = self._link
+        _get_transition = get_transition
+        for text, style, _ in strip:
+            if style is None or not text:
+                continue
+            if style is not current_style:
+                link = (style._link, style._link_id) if style._link else None
+                if link != current_link:
+                    if current_link is not None:
+                        append(LINK_END)
+                    if link is not None:
+                        append(f"\x1b]8;id={link[1]};{link[0]}\x1b\\")
+                    current_link = link
+                append(_get_transition(current_style, style, color_system))
+                current_style = style
+            append(text)
+        self._style = current_style
+        self._link = current_link
+
+    def reset(self) -> None:
+        """Return the terminal to default attributes, and end any link."""
+        if self._link is not None:
+            self._output.append(LINK_END)
+            self._link = None
+        if self._style is not None:
+            if self._color_system is not None and self._style._make_ansi_codes(
+                self._color_system
+            ):
+                self._output.append(RESET)
+            self._style = None
+
+    def finish(self) -> str:
+        """Reset the terminal attributes, and get the encoded output.
+
+        Returns:
+            Terminal sequences.
+        """
+        self.reset()
+        output = "".join(self._output)
+        self._output.clear()
+        return output
@@ -15,6 +15,7 @@ from textual._border import get_box, render_border_label, render_row
 from textual._context import active_app
 from textual._opacity import _apply_opacity
 from textual._segment_tools import apply_hatch, line_pad, line_trim
+from textual.cache import LRUCache
 from textual.color import TRANSPARENT, Color
 from textual.constants import DEBUG
 from textual.content import Content
@@ -74,10 +75,20 @@ class StylesCache:
     ```
     """
 
-    def __init__(self) -> None:
+    def __init__(self, content_cache_size: int = 0) -> None:
+        """Initialize a styles cache.
+
+        Args:
+            content_cache_size: Number of styled content lines to cache by the identity
+                of the content strip, or 0 to disable. Enable this for widgets which
+                return the same strips from `render_line` (after scrolling for instance).
+        """
         self._cache: dict[int, Strip] = {}
         self._dirty_lines: set[int] = set()
         self._width = 1
+        self._content_cache: LRUCache[tuple, tuple[Strip, Strip]] | None = (
+            LRUCache(content_cache_size) if content_cache_size else None
+        )
 
     def __rich_repr__(self) -> rich.repr.Result:
         if self._dirty_lines:
@@ -356,6 +367,7 @@ class StylesCache:
             return segments
 
         line: Iterable[Segment]
+        content_cache_key: tuple | None = None
         # Draw top or bottom borders (A)
         if (border_top and y == 0) or (border_bottom and y == height - 1):
 
@@ -442,8 +454,27 @@ class StylesCache:
             # Content with border and padding (C)
             content_y = y - gutter.top
             if content_y < content_height:
-                line = render_content_line(y - gutter.top)
-                line = line.adjust_cell_length(content_width)
+                content_line = render_content_line(y - gutter.top)
+                content_cache = self._content_cache
+                if content_cache is not None and not (
+                    (outline_top and y == 0) or (outline_bottom and y == height - 1)
+                ):
+                    # The styled line depends only on the content and the styles
+                    content_cache_key = (
+                        id(content_line),
+                        styles._cache_key,
+                        width,
+                        content_width,
+                        padding,
+                        base_background,
+                        background,
+                        opacity,
+                        ansi_theme,
+                    )
+                    cached_line = content_cache.get(content_cache_key)
+                    if cached_line is not None and cached_line[0] is content_line:
+                        return cached_line[1]
+                line = content_line.adjust_cell_length(content_width)
             else:
                 line = [make_blank(content_width, inner.rich_style)]
             if inner:
@@ -507,4 +538,6 @@ class StylesCache:
                 line = [*line, right]
 
         strip = Strip(post(line), width)
+        if content_cache_key is not None and self._content_cache is not None:
+            self._content_cache[content_cache_key] = (content_line, strip)
         return strip
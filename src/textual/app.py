@@ -31,6 +31,7 @@ from pathlib import Path
 from time import perf_counter
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     AsyncGenerator,
     Awaitable,
@@ -75,12 +76,13 @@ from textual._ansi_sequences import SYNC_END, SYNC_START
 from textual._ansi_theme import ALABASTER, MONOKAI
 from textual._callback import invoke
 from textual._compose import compose
-from textual._compositor import CompositorUpdate
+from textual._compositor import CompositorUpdate, Frame
 from textual._context import active_app, active_message_pump
 from textual._context import message_hook as message_hook_context_var
 from textual._dispatch_key import dispatch_key
 from textual._event_broker import NoHandler, extract_handler_actions
 from textual._files import generate_datetime_filename
+from textual._frame_rate import FrameRate
 from textual._path import (
     CSSPathType,
     _css_path_type_as_list,
@@ -586,6 +588,10 @@ class App(Generic[ReturnType], DOMNode):
         self._current_mode: str = self.DEFAULT_MODE
         """The current mode the app is in."""
         self._sync_available = False
+        self._frame_rate = FrameRate(
+            constants.MAX_FPS, constants.MIN_FPS if constants.ADAPTIVE_FPS else None
+        )
+        """Frame rate for screen updates."""
 
         self.mouse_over: Widget | None = None
         self.mouse_captured: Widget | None = None
@@ -792,6 +798,12 @@ class App(Generic[ReturnType], DOMNode):
         self._css_update_count: int = 0
         """Incremented when CSS is invalidated."""
 
+        self._css_refresh_count: int | None = None
+        """The value of `_css_update_count` when CSS was last refreshed."""
+
+        self._css_refresh_classes: frozenset[str] = frozenset()
+        """The app's classes when CSS was last refreshed."""
+
         self._clipboard: str = ""
         """Contents of local clipboard."""
 
@@ -960,6 +972,12 @@ class App(Generic[ReturnType], DOMNode):
         for filter in self._filters:
             if isinstance(filter, ANSIToTruecolor):
                 filter.enabled = not ansi_color
+        self._clear_pseudo_class_masks()
+
+    def _clear_pseudo_class_masks(self) -> None:
+        """Clear the cached pseudo classes of every node, after app-wide state changes."""
+        for node in self._registry:
+            node._pseudo_class_mask = None
 
     def animate(
         self,
@@ -1046,6 +1064,16 @@ class App(Generic[ReturnType], DOMNode):
         """Is the app running in 'web' mode via a browser?"""
         return False if self._driver is None else self._driver.is_web
 
+    @property
+    def frame_rate(self) -> int:
+        """The current maximum frames per second for screen updates.
+
+        This is fixed at `TEXTUAL_FPS`, unless `TEXTUAL_ADAPTIVE_FPS=1` is set, in which
+        case it varies between `TEXTUAL_MIN_FPS` and `TEXTUAL_FPS` according to the
+        time taken to write to the terminal.
+        """
+        return self._frame_rate.fps
+
     @property
     def screen_stack(self) -> list[Screen[Any]]:
         """A snapshot of the current screen stack.
@@ -1314,6 +1342,7 @@ class App(Generic[ReturnType], DOMNode):
         theme = self.current_theme
         dark = theme.dark
         self.ansi_color = theme_name == "textual-ansi"
+        self._clear_pseudo_class_masks()
         self.set_class(dark, "-dark-mode", update=False)
         self.set_class(not dark, "-light-mode", update=False)
         self._refresh_truecolor_filter(self.ansi_theme)
@@ -2266,16 +2295,67 @@ class App(Generic[ReturnType], DOMNode):
         """
         return self.screen.get_child_by_type(expect_type)
 
-    def update_styles(self, node: DOMNode) -> None:
-        """Immediately update the styles of this node and all descendant nodes.
+    def update_styles(
+        self, node: DOMNode, names: AbstractSet[str] | None = None
+    ) -> None:
+        """Update the styles of this node and all descendant nodes.
 
         Should be called whenever CSS classes / pseudo classes change.
         For example, when you hover over a button, the :hover pseudo class
         will be added, and this method is called to apply the corresponding
         :hover styles.
+
+        The node itself is updated immediately. Descendants of a node on a screen
+        are updated (in a single pass) before the screen is next refreshed, unless
+        the change may hide or show them.
+
+        Args:
+            node: The node whose classes or pseudo classes changed.
+            names: The classes (prefixed with ".") or pseudo classes (prefixed with
+                ":") which changed. If given, only the nodes which may be affected
+                by rules referring to those names are updated.
+        """
+        if names is not None:
+            update_scope = self.stylesheet.get_update_scope(names)
+            if update_scope is None:
+                return
+            if update_scope == "node":
+                self._update_node_styles(node)
+                return
+        try:
+            screen = node.screen
+        except NoScreen:
+            self.stylesheet.update_nodes(
+                node.walk_children(with_self=True), animate=True
+            )
+        else:
+            if names is not None and self.stylesheet.affects_display(names):
+                # Code may check what is displayed straight after changing a class
+                self.stylesheet.update_nodes(
+                    node.walk_children(with_self=True), animate=True
+                )
+                return
+            self._update_node_styles(node)
+            screen._update_styles_later(node.walk_children())
+
+    def _update_node_styles(self, node: DOMNode) -> None:
+        """Update the styles of a node, but not its descendants.
+
+        Descendants cache styles derived from the colors of their ancestors, so those
+        caches are cleared if the computed style of the node changes.
+
+        Args:
+            node: The node to update.
         """
-        descendants = node.walk_children(with_self=True)
-        self.stylesheet.update_nodes(descendants, animate=True)
+        if not node._nodes:
+            self.stylesheet.update_nodes([node], animate=True)
+            return
+        computed_style = node._get_computed_style()
+        self.stylesheet.update_nodes([node], animate=True)
+        # Ignore the cache key and parent, and compare the resolved styles
+        if node._get_computed_style()[2:] != computed_style[2:]:
+            for descendant in node.walk_children():
+                descendant.notify_style_update()
 
     def mount(
         self,
@@ -3495,9 +3575,33 @@ class App(Generic[ReturnType], DOMNode):
             animate: Also execute CSS animations.
         """
         stylesheet = self.app.stylesheet
-        stylesheet.set_variables(self.get_css_variables())
-        stylesheet.reparse()
-        stylesheet.update(self.app, animate=animate)
+        updated_rules = stylesheet.update_variables(self.get_css_variables())
+        if updated_rules is None:
+            stylesheet.reparse()
+        elif self._classes != self._css_refresh_classes:
+            # Classes changed without an update (i.e. dark mode), so restyle everything
+            updated_rules = None
+        refresh_count = self._css_refresh_count
+        self._css_refresh_count = self._css_update_count
+        self._css_refresh_classes = frozenset(self._classes)
+
+        def update_styles(root: DOMNode, css_update_count: int) -> None:
+            """Update styles, restyling only nodes affected by changed variables if possible.
+
+            Args:
+                root: Root node to update.
+                css_update_count: CSS update count of the screen containing the nodes.
+            """
+            if updated_rules is not None and css_update_count == refresh_count:
+                stylesheet.update_rules(root, updated_rules, animate=animate)
+            else:
+                stylesheet.update(root, animate=animate)
+
+        try:
+            screen_update_count = self.screen._css_update_count
+        except ScreenError:
+            screen_update_count = -1
+        update_styles(self.app, screen_update_count)
         try:
             self.screen._refresh_layout(self.size)
             self.screen._css_update_count = self._css_update_count
@@ -3508,7 +3612,7 @@ class App(Generic[ReturnType], DOMNode):
         # the current one and update them too.
         for screen in self.screen_stack:
             if screen != self.screen:
-                stylesheet.update(screen, animate=animate)
+                update_styles(screen, screen._css_update_count)
                 screen._css_update_count = self._css_update_count
 
     def _display(self, screen: Screen, renderable: RenderableType | None) -> None:
@@ -3519,6 +3623,7 @@ class App(Generic[ReturnType], DOMNode):
             renderable: A Rich renderable.
         """
 
+        frame_written = False
         try:
             if renderable is None:
                 return
@@ -3531,55 +3636,57 @@ class App(Generic[ReturnType], DOMNode):
                 and self._driver is not None
             ):
                 console = self.console
+                if isinstance(renderable, CompositorUpdate):
+                    try:
+                        cursor_position = self.screen.outer_size.clamp_offset(
+                            self.cursor_position
+                        )
+                        if self._driver.is_inline:
+                            prefix = Control.move(
+                                *(-self._previous_cursor_position)
+                            ).segment.text
+                            suffix = Control.move(*cursor_position).segment.text
+                        else:
+                            prefix = ""
+                            suffix = Control.move_to(*cursor_position).segment.text
+                        self._previous_cursor_position = cursor_position
+                        frame = Frame(
+                            renderable,
+                            console,
+                            prefix,
+                            suffix,
+                            sync=self._sync_available,
+                        )
+                        if self._driver.write_frame(frame):
+                            frame_written = True
+                        else:
+                            # The terminal is too far behind, and waiting frames
+                            # were discarded: repaint everything
+                            screen.refresh()
+                    except Exception as error:
+                        self._handle_exception(error)
+                    self._driver.flush()
+                    self._frame_rate.update(self._driver.output_time)
+                    return
+
                 self._begin_update()
                 try:
                     try:
-                        if isinstance(renderable, CompositorUpdate):
-                            cursor_position = self.screen.outer_size.clamp_offset(
-                                self.cursor_position
-                            )
-                            if self._driver.is_inline:
-                                terminal_sequence = Control.move(
-                                    *(-self._previous_cursor_position)
-                                ).segment.text
-                                terminal_sequence += renderable.render_segments(console)
-                                terminal_sequence += Control.move(
-                                    *cursor_position
-                                ).segment.text
-                            else:
-                                terminal_sequence = renderable.render_segments(console)
-                                terminal_sequence += Control.move_to(
-                                    *cursor_position
-                                ).segment.text
-                            self._previous_cursor_position = cursor_position
-                        else:
-                            segments = console.render(renderable)
-                            terminal_sequence = console._render_buffer(segments)
+                        segments = console.render(renderable)
+                        terminal_sequence = console._render_buffer(segments)
                     except Exception as error:
                         self._handle_exception(error)
                     else:
-                        if WINDOWS:
-                            # Combat a problem with Python on Windows.
-                            #
-                            # https://github.com/Textualize/textual/issues/2548
-                            # https://github.com/python/cpython/issues/82052
-                            CHUNK_SIZE = 8192
-                            write = self._driver.write
-                            for chunk in (
-                                terminal_sequence[offset : offset + CHUNK_SIZE]
-                                for offset in range(
-                                    0, len(terminal_sequence), CHUNK_SIZE
-                                )
-                            ):
-                                write(chunk)
-                        else:
-                            self._driver.write(terminal_sequence)
+                        self._driver.write(terminal_sequence)
                 finally:
                     self._end_update()
 
                 self._driver.flush()
 
         finally:
+            if isinstance(renderable, CompositorUpdate) and not frame_written:
+                # The compositor recorded cells which didn't reach the terminal
+                screen._compositor.invalidate_cells()
             self.post_display_hook()
 
     def post_display_hook(self) -> None:
@@ -4349,6 +4456,9 @@ class App(Generic[ReturnType], DOMNode):
     @on(Driver.SignalResume)
     def _resume_signal(self) -> None:
         """Signal that the application is being resumed from a suspension."""
+        if self._screen_stack:
+            # The terminal may have been written to while suspended
+            self.screen._compositor.invalidate_cells()
         self.app_resume_signal.publish(self)
 
     @contextmanager
@@ -139,6 +139,15 @@ SHOW_RETURN: Final[bool] = _get_environ_bool("TEXTUAL_SHOW_RETURN")
 MAX_FPS: Final[int] = _get_environ_int("TEXTUAL_FPS", 60, minimum=1)
 """Maximum frames per second for updates."""
 
+ADAPTIVE_FPS: Final[bool] = _get_environ_bool("TEXTUAL_ADAPTIVE_FPS")
+"""Adapt the frame rate to the time taken to write to the terminal?"""
+
+MIN_FPS: Final[int] = _get_environ_int("TEXTUAL_MIN_FPS", 10, minimum=1)
+"""Minimum frames per second for updates, when the frame rate is adaptive."""
+
+CSS_CACHE: Final[bool] = _get_environ_bool("TEXTUAL_CSS_CACHE")
+"""Cache parsed CSS in the user's cache directory, to speed up startup?"""
+
 COLOR_SYSTEM: Final[str | None] = get_environ("TEXTUAL_COLOR_SYSTEM", "auto")
 """Force color system override."""
 
@@ -27,6 +27,7 @@ from typing_extensions import Final, TypeAlias
 from textual._cells import cell_len
 from textual._context import active_app
 from textual._loop import loop_last
+from textual.cache import FIFOCache
 from textual.color import Color
 from textual.css.types import TextAlign, TextOverflow
 from textual.selection import Selection
@@ -103,6 +104,13 @@ class Span(NamedTuple):
         return self
 
 
+_WRAP_CACHE_SIZE: Final = 4
+"""Maximum number of wraps (at different widths or text rules) to keep per content."""
+
+_WrapKey: TypeAlias = "tuple[int, TextAlign, TextOverflow, bool, int]"
+"""Width, alignment, overflow, no wrap, and tab size."""
+
+
 @rich.repr.auto
 @total_ordering
 class Content(Visual):
@@ -113,7 +121,7 @@ class Content(Visual):
 
     """
 
-    __slots__ = ["_text", "_spans", "_cell_length"]
+    __slots__ = ["_text", "_spans", "_cell_length", "_wrap_cache"]
 
     _NORMALIZE_TEXT_ALIGN = {"start": "left", "end": "right", "justify": "full"}
 
@@ -133,6 +141,7 @@ class Content(Visual):
         self._text: str = _strip_control_codes(text)
         self._spans: list[Span] = [] if spans is None else spans
         self._cell_length = cell_length
+        self._wrap_cache: FIFOCache[_WrapKey, list[_FormattedLine]] | None = None
 
     def __str__(self) -> str:
         return self._text
@@ -394,10 +403,13 @@ class Content(Visual):
         Returns:
             A height in lines.
         """
-        lines = self.without_spans._wrap_and_format(
+        # Same arguments as `render_strips`, so rendering reuses the wrapped lines
+        lines = self._wrap_and_format(
             width,
+            align=rules.get("text_align", "left"),
             overflow=rules.get("text_overflow", "fold"),
             no_wrap=rules.get("text_wrap", "wrap") == "nowrap",
+            tab_size=8,
         )
         return len(lines)
 
@@ -423,8 +435,14 @@ class Content(Visual):
             selection_style: Selection style, or `None` if no selection.
 
         Returns:
-            List of formatted lines.
+            List of formatted lines (which should not be modified).
         """
+        cache_key = (width, align, overflow, no_wrap, tab_size)
+        if selection is None and self._wrap_cache is not None:
+            cached_lines = self._wrap_cache.get(cache_key)
+            if cached_lines is not None:
+                return cached_lines
+
         output_lines: list[_FormattedLine] = []
 
         if selection is not None:
@@ -472,6 +490,10 @@ class Content(Visual):
 
             output_lines.extend(new_lines)
 
+        if selection is None:
+            if self._wrap_cache is None:
+                self._wrap_cache = FIFOCache(_WRAP_CACHE_SIZE)
+            self._wrap_cache[cache_key] = output_lines
         return output_lines
 
     def render_strips(
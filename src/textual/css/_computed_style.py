@@ -0,0 +1,146 @@
+"""
+Styles which depend on a node's ancestors, resolved once per change.
+
+Rendering a widget needs colors and text styles which are blended from the styles of
+every node from the app down to the widget. Rather than walk the ancestors on every
+render, each node keeps a [`ComputedStyle`][textual.css._computed_style.ComputedStyle]
+which is built from the computed style of its parent, and rebuilt only when the
+node's styles (or the computed style of its parent) change.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from rich.style import Style
+
+from textual.color import BLACK, WHITE, Color
+from textual.style import Style as VisualStyle
+
+if TYPE_CHECKING:
+    from textual.css.styles import RenderStyles
+
+TRANSPARENT_BACKGROUND = Color(0, 0, 0, 0)
+"""Initial background when resolving the rich style."""
+TRANSPARENT_COLOR = Color(255, 255, 255, 0)
+"""Initial foreground when resolving the rich style."""
+
+
+class ComputedStyle(NamedTuple):
+    """Colors and styles of a node, resolved from the node and its ancestors."""
+
+    cache_key: int
+    """The `_cache_key` of the node's styles when the computed style was built."""
+    parent: ComputedStyle | None
+    """The computed style of the parent, or `None` for the root node."""
+    opacity: float
+    """Opacity multiplied by the opacity of all ancestors."""
+    background_colors: tuple[Color, Color]
+    """The parent's background color and the background color."""
+    opacity_background_colors: tuple[Color, Color]
+    """Background colors adjusted for opacity."""
+    colors: tuple[Color, Color, Color, Color]
+    """Parent background, parent color, background, and color."""
+    background: Color
+    """Background of the rich style (adjusted for opacity)."""
+    color: Color
+    """Foreground of the rich style."""
+    text_style: Style
+    """Text style combined with the text style of all ancestors."""
+    rich_style: Style
+    """A Rich style for the node."""
+    visual_style: VisualStyle
+    """A Visual style for the node."""
+
+    @classmethod
+    def from_styles(
+        cls, styles: RenderStyles, parent: ComputedStyle | None
+    ) -> ComputedStyle:
+        """Build a computed style.
+
+        Args:
+            styles: Styles of the node.
+            parent: Computed style of the node's parent, or `None` for the root node.
+
+        Returns:
+            A new computed style.
+        """
+        has_rule = styles.has_rule
+        tinted_background = styles.background.tint(styles.background_tint)
+
+        if parent is None:
+            opacity = 1.0
+            background = opacity_background = BLACK
+            colors_background = WHITE
+            colors_base_color = colors_color = BLACK
+            rich_background = TRANSPARENT_BACKGROUND
+            rich_color = TRANSPARENT_COLOR
+            text_style = Style()
+        else:
+            opacity = parent.opacity
+            background = parent.background_colors[1]
+            opacity_background = parent.opacity_background_colors[1]
+            _, colors_base_color, colors_background, colors_color = parent.colors
+            rich_background = parent.background
+            rich_color = parent.color
+            text_style = parent.text_style
+
+        opacity *= styles.opacity
+        background_colors = (background, background + tinted_background)
+        opacity_background_colors = (
+            opacity_background,
+            opacity_background + tinted_background.multiply_alpha(opacity),
+        )
+
+        base_background = colors_background
+        colors_background += tinted_background
+        if has_rule("color"):
+            colors_base_color = colors_color
+            if styles.auto_color:
+                colors_color = colors_background.get_contrast_text(colors_color.a)
+            else:
+                colors_color = styles.color
+        colors = (base_background, colors_base_color, colors_background, colors_color)
+
+        if has_rule("background"):
+            text_background = rich_background + tinted_background
+            rich_background += tinted_background.multiply_alpha(opacity)
+        else:
+            text_background = rich_background
+        if has_rule("color"):
+            rich_color = styles.color
+        text_style += styles.text_style
+        if has_rule("auto_color") and styles.auto_color:
+            rich_color = text_background.get_contrast_text(rich_color.a)
+
+        rich_style = text_style + Style.from_color(
+            (
+                (rich_background + rich_color).rich_color
+                if (rich_background.a or rich_color.a)
+                else None
+            ),
+            rich_background.rich_color if rich_background.a else None,
+        )
+        visual_style = VisualStyle(
+            rich_background,
+            rich_color,
+            bold=text_style.bold,
+            dim=text_style.dim,
+            italic=text_style.italic,
+            underline=text_style.underline,
+            strike=text_style.strike,
+        )
+
+        return cls(
+            styles._cache_key,
+            parent,
+            opacity,
+            background_colors,
+            opacity_background_colors,
+            colors,
+            rich_background,
+            rich_color,
+            text_style,
+            rich_style,
+            visual_style,
+        )
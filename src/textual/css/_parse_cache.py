@@ -0,0 +1,145 @@
+"""
+A persistent cache of parsed CSS.
+
+Parsing the CSS for an app (including the default CSS of every widget) is a noticeable
+part of startup time. When enabled (with `TEXTUAL_CSS_CACHE=1`), the rules parsed from
+each CSS source are pickled to the user's cache directory, so that subsequent runs
+may load them rather than parse the CSS again.
+
+The cache is strictly an optimization: any problem reading or writing the cache is
+ignored, and the CSS is parsed as normal.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import sys
+from contextlib import suppress
+from functools import lru_cache
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Mapping
+
+from typing_extensions import Final
+
+from textual.css.model import RuleSet
+from textual.css.types import CSSLocation
+
+CACHE_VERSION: Final[int] = 2
+"""Version of the cache format, to be incremented if the format changes."""
+
+
+@lru_cache(maxsize=1)
+def _get_textual_version() -> str:
+    """Get the installed version of Textual.
+
+    Returns:
+        Version string.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("textual")
+    except PackageNotFoundError:
+        return ""
+
+
+def get_cache_path() -> Path:
+    """Get the default directory for cached CSS.
+
+    Returns:
+        A path in the user's cache directory.
+    """
+    from platformdirs import user_cache_path
+
+    return user_cache_path("textual") / "css"
+
+
+def get_cache_key(
+    css: str,
+    read_from: CSSLocation,
+    is_default_rules: bool,
+    tie_breaker: int,
+    scope: str,
+    variables: Mapping[str, str],
+) -> str:
+    """Get a key which identifies parsed CSS.
+
+    The key covers everything which may change the result of parsing, including the
+    versions of Textual and Python.
+
+    Args:
+        css: The CSS source.
+        read_from: Original CSS location.
+        is_default_rules: Are the rules default (i.e. from `DEFAULT_CSS`) rules?
+        tie_breaker: Specificity tie breaker.
+        scope: Scope of rules, or empty string for global scope.
+        variables: CSS variables.
+
+    Returns:
+        A hex digest.
+    """
+    key = repr(
+        (
+            CACHE_VERSION,
+            _get_textual_version(),
+            sys.version_info[:2],
+            css,
+            read_from,
+            is_default_rules,
+            tie_breaker,
+            scope,
+            sorted(variables.items()),
+        )
+    )
+    return sha256(key.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+def load_rules(cache_path: Path, key: str) -> list[RuleSet] | None:
+    """Load parsed rules from the cache.
+
+    Args:
+        cache_path: Directory containing the cache.
+        key: Key from `get_cache_key`.
+
+    Returns:
+        A list of rule sets, or `None` if the rules are not cached (or the cache is invalid).
+    """
+    path = cache_path / f"{key}.pickle"
+    try:
+        with open(path, "rb") as cache_file:
+            rules = pickle.load(cache_file)
+    except Exception:
+        # A corrupt or incompatible cache file will be replaced by `save_rules`
+        return None
+    if not isinstance(rules, list) or not all(
+        isinstance(rule_set, RuleSet) for rule_set in rules
+    ):
+        return None
+    return rules
+
+
+def save_rules(cache_path: Path, key: str, rules: list[RuleSet]) -> None:
+    """Save parsed rules to the cache.
+
+    Args:
+        cache_path: Directory containing the cache.
+        key: Key from `get_cache_key`.
+        rules: Rule sets to save.
+    """
+    temp_path: str | None = None
+    try:
+        cache_path.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so another process never reads a partial file
+        with NamedTemporaryFile(
+            "wb", dir=cache_path, prefix=f"{key}.", suffix=".tmp", delete=False
+        ) as temp_file:
+            temp_path = temp_file.name
+            pickle.dump(rules, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path / f"{key}.pickle")
+    except Exception:
+        if temp_path is not None:
+            with suppress(OSError):
+                os.unlink(temp_path)
@@ -1,12 +1,101 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING, AbstractSet, Iterable
 
-from textual.css.model import CombinatorType, Selector, SelectorSet
+from typing_extensions import Final
+
+from textual.css.model import CombinatorType, Selector, SelectorSet, SelectorType
 
 if TYPE_CHECKING:
     from textual.dom import DOMNode
 
+BLOOM_BITS: Final[int] = 128
+"""Number of bits in the Bloom filters of selector names."""
+
+
+def _get_bloom(names: Iterable[str]) -> int:
+    """Get a Bloom filter for selector names.
+
+    Args:
+        names: Selector names, i.e. a type name, or a class or ID with its prefix.
+
+    Returns:
+        An integer with a bit set for each name.
+    """
+    bloom = 0
+    for name in names:
+        bloom |= 1 << (hash(name) % BLOOM_BITS)
+    return bloom
+
+
+@lru_cache(maxsize=1024 * 4)
+def _get_node_bloom(
+    type_names: AbstractSet[str], classes: AbstractSet[str], id: str | None
+) -> int:
+    """Get a Bloom filter for the selector names which match a node.
+
+    Args:
+        type_names: The node's CSS type names.
+        classes: The node's classes.
+        id: The node's ID, or `None`.
+
+    Returns:
+        Bloom filter.
+    """
+    bloom = _get_bloom(type_names) | _get_bloom(
+        f".{class_name}" for class_name in classes
+    )
+    if id is not None:
+        bloom |= _get_bloom([f"#{id}"])
+    return bloom
+
+
+def get_ancestor_bloom(css_path_nodes: list[DOMNode]) -> int:
+    """Get a Bloom filter for the selector names which match the ancestors of a node.
+
+    Args:
+        css_path_nodes: The DOM nodes from the App to the node.
+
+    Returns:
+        Bloom filter.
+    """
+    bloom = 0
+    for node in css_path_nodes[:-1]:
+        bloom |= _get_node_bloom(
+            node._css_type_names, frozenset(node._classes), node._id
+        )
+    return bloom
+
+
+def _get_selector_set_bloom(selector_set: SelectorSet) -> int:
+    """Get a Bloom filter for the selector names which must match ancestors of a node.
+
+    Args:
+        selector_set: A selector set.
+
+    Returns:
+        Bloom filter.
+    """
+    if selector_set._ancestor_bloom is not None:
+        return selector_set._ancestor_bloom
+    selectors = selector_set.selectors
+    SAME = CombinatorType.SAME
+    # The selectors before the last combinator match ancestors
+    last_compound = len(selectors) - 1
+    while last_compound > 0 and selectors[last_compound].combinator == SAME:
+        last_compound -= 1
+    names: list[str] = []
+    for selector in selectors[:last_compound]:
+        if selector.type == SelectorType.TYPE:
+            names.append(selector.name)
+        elif selector.type == SelectorType.CLASS:
+            names.append(f".{selector.name}")
+        elif selector.type == SelectorType.ID:
+            names.append(f"#{selector.name}")
+    bloom = selector_set._ancestor_bloom = _get_bloom(names)
+    return bloom
+
 
 def match(selector_sets: Iterable[SelectorSet], node: DOMNode) -> bool:
     """Check if a given node matches any of the given selector sets.
@@ -18,10 +107,37 @@ def match(selector_sets: Iterable[SelectorSet], node: DOMNode) -> bool:
     Returns:
         True if the node matches the selector, otherwise False.
     """
-    return any(
-        _check_selectors(selector_set.selectors, node.css_path_nodes)
-        for selector_set in selector_sets
-    )
+    css_path_nodes = node.css_path_nodes
+    ancestor_bloom: int | None = None
+    for selector_set in selector_sets:
+        selector_bloom = _get_selector_set_bloom(selector_set)
+        if selector_bloom:
+            if ancestor_bloom is None:
+                ancestor_bloom = get_ancestor_bloom(css_path_nodes)
+            if selector_bloom & ~ancestor_bloom:
+                # An ancestor selector can't match
+                continue
+        if _check_selectors(selector_set.selectors, css_path_nodes):
+            return True
+    return False
+
+
+def _check_selector_set(
+    selector_set: SelectorSet, css_path_nodes: list[DOMNode], ancestor_bloom: int
+) -> bool:
+    """Match a selector set against DOM nodes, rejecting impossible matches early.
+
+    Args:
+        selector_set: A selector set.
+        css_path_nodes: The DOM nodes to check the selectors against.
+        ancestor_bloom: Bloom filter from `get_ancestor_bloom`.
+
+    Returns:
+        True if the last node in css_path_nodes matches the selector set.
+    """
+    if _get_selector_set_bloom(selector_set) & ~ancestor_bloom:
+        return False
+    return _check_selectors(selector_set.selectors, css_path_nodes)
 
 
 def _check_selectors(selectors: list[Selector], css_path_nodes: list[DOMNode]) -> bool:
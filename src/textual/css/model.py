@@ -174,6 +174,8 @@ class Declaration:
     token: Token
     name: str
     tokens: list[Token] = field(default_factory=list)
+    variables: set[str] = field(default_factory=set)
+    """Names of the variables substituted in to the tokens."""
 
 
 @rich.repr.auto(angular=True)
@@ -183,6 +185,10 @@ class SelectorSet:
 
     selectors: list[Selector] = field(default_factory=list)
     specificity: Specificity3 = (0, 0, 0)
+    _ancestor_bloom: int | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Bloom filter of the names required in ancestors (calculated on first match)."""
 
     def __post_init__(self) -> None:
         SAME = CombinatorType.SAME
@@ -244,6 +250,12 @@ class RuleSet:
     tie_breaker: int = 0
     selector_names: set[str] = field(default_factory=set)
     pseudo_classes: set[str] = field(default_factory=set)
+    variables: frozenset[str] = frozenset()
+    """Names of the variables used in the declarations."""
+    _declarations: list[Declaration] = field(
+        default_factory=list, repr=False, compare=False
+    )
+    """Declarations the styles were built from (only stored if variables are used)."""
 
     def __hash__(self):
         return id(self)
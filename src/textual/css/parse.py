@@ -165,6 +165,7 @@ def parse_rule_set(
         rule_selectors.append(selectors[:])
 
     declaration = Declaration(token, "")
+    declarations: list[Declaration] = []
     errors: list[tuple[Token, str | HelpText]] = []
     nested_rules: list[RuleSet] = []
 
@@ -234,6 +235,8 @@ def parse_rule_set(
                         rule_set.errors,
                         rule_set.is_default_rules,
                         rule_set.tie_breaker + tie_breaker,
+                        variables=rule_set.variables,
+                        _declarations=rule_set._declarations,
                     )
                     nested_rules.append(nested_rule_set)
             continue
@@ -244,22 +247,31 @@ def parse_rule_set(
                 errors.append((error.token, error.message))
             declaration = Declaration(token, "")
             declaration.name = token.value.rstrip(":")
+            declarations.append(declaration)
         elif token_name == "declaration_set_end":
             break
         else:
             declaration.tokens.append(token)
+            if token.referenced_by is not None:
+                declaration.variables.add(token.referenced_by.name)
 
     try:
         styles_builder.add_declaration(declaration)
     except DeclarationError as error:
         errors.append((error.token, error.message))
 
+    variables = frozenset().union(
+        *[declaration.variables for declaration in declarations]
+    )
     rule_set = RuleSet(
         list(SelectorSet.from_selectors(rule_selectors)),
         styles_builder.styles,
         errors,
         is_default_rules=is_default_rules,
         tie_breaker=tie_breaker,
+        variables=variables,
+        # Declarations are kept so the styles may be rebuilt if variables change
+        _declarations=declarations if variables else [],
     )
 
     rule_set._post_parse()
@@ -427,6 +439,90 @@ def substitute_references(
             yield token
 
 
+def resubstitute_references(
+    tokens: Iterable[Token], variable_tokens: dict[str, list[Token]]
+) -> list[Token]:
+    """Replace previously substituted variable values with new values.
+
+    Tokens which came from a variable (i.e. have their `referenced_by` attribute set)
+    are replaced with the new tokens for that variable.
+
+    Args:
+        tokens: Tokens from a declaration, after substitution.
+        variable_tokens: New tokens for each variable.
+
+    Raises:
+        UnresolvedVariableError: If a variable can't be resolved.
+
+    Returns:
+        New tokens for the declaration.
+    """
+    new_tokens: list[Token] = []
+    add_token = new_tokens.append
+    previous_reference: ReferencedBy | None = None
+    for token in tokens:
+        reference = token.referenced_by
+        if reference is None:
+            add_token(token)
+        elif reference != previous_reference:
+            # The first token from a variable reference
+            variable_name = reference.name
+            if variable_name not in variable_tokens:
+                _unresolved(variable_name, variable_tokens.keys(), token)
+            for variable_token in variable_tokens[variable_name]:
+                if variable_token.name != "whitespace":
+                    add_token(variable_token.with_reference(reference))
+        previous_reference = reference
+    return new_tokens
+
+
+def resubstitute_variables(
+    rule_set: RuleSet, variable_tokens: dict[str, list[Token]]
+) -> bool:
+    """Rebuild the styles in a rule set, with new values for its variables.
+
+    Only the declarations which use variables are substituted again. The styles are
+    updated in place, so any rule sets which share the styles (from nested CSS) are also
+    updated.
+
+    Args:
+        rule_set: A rule set which uses variables.
+        variable_tokens: New tokens for each variable.
+
+    Returns:
+        `True` if the styles were updated, or `False` if the rule set could not be
+            updated (and the CSS should be parsed again).
+    """
+    styles_builder = StylesBuilder()
+    new_declarations: list[Declaration] = []
+    for declaration in rule_set._declarations:
+        if declaration.variables:
+            try:
+                tokens = resubstitute_references(declaration.tokens, variable_tokens)
+            except UnresolvedVariableError:
+                return False
+            if any(token.name == "variable_ref" for token in tokens) or (
+                {token.referenced_by.name for token in tokens if token.referenced_by}
+                != declaration.variables
+            ):
+                # Variables referencing variables (or empty variables) need a reparse
+                return False
+            declaration = Declaration(
+                declaration.token, declaration.name, tokens, declaration.variables
+            )
+        try:
+            styles_builder.add_declaration(declaration)
+        except DeclarationError:
+            return False
+        new_declarations.append(declaration)
+
+    styles = rule_set.styles
+    styles._rules.clear()
+    styles._rules.update(styles_builder.styles._rules)
+    rule_set._declarations[:] = new_declarations
+    return True
+
+
 def parse(
     scope: str,
     css: str,
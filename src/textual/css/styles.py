@@ -630,6 +630,15 @@ class StylesBase:
         """Is the node split?"""
         return self.split != "none"
 
+    @property
+    def _cache_key(self) -> int:
+        """A cache key, that changes when any style is changed.
+
+        Returns:
+            An opaque integer.
+        """
+        raise NotImplementedError()
+
     def has_rule(self, rule_name: str) -> bool:
         """Check if a rule is set on this Styles object.
 
@@ -862,6 +871,15 @@ class Styles(StylesBase):
         self.get_rule: Callable[[str, object], object] = self._rules.get  # type: ignore[assignment]
         self.has_rule: Callable[[str], bool] = self._rules.__contains__  # type: ignore[assignment]
 
+    @property
+    def _cache_key(self) -> int:
+        """A cache key, that changes when any style is changed.
+
+        Returns:
+            An opaque integer.
+        """
+        return self._updates
+
     def copy(self) -> Styles:
         """Get a copy of this Styles object."""
         return Styles(
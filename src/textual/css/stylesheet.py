@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+import re
 from collections import defaultdict
+from functools import lru_cache
 from itertools import chain
 from operator import itemgetter
 from pathlib import Path, PurePath
@@ -13,23 +15,44 @@ from rich.markup import render
 from rich.padding import Padding
 from rich.panel import Panel
 from rich.text import Text
+from typing_extensions import Literal, TypeAlias
 
+from textual import constants
 from textual.cache import LRUCache
+from textual.css import _parse_cache
 from textual.css.errors import StylesheetError
-from textual.css.match import _check_selectors
-from textual.css.model import RuleSet
-from textual.css.parse import parse
+from textual.css.match import _check_selector_set, get_ancestor_bloom
+from textual.css.model import CombinatorType, RuleSet, SelectorType
+from textual.css.parse import parse, resubstitute_variables
 from textual.css.styles import RulesMap, Styles
 from textual.css.tokenize import Token, tokenize_values
 from textual.css.tokenizer import TokenError
 from textual.css.types import CSSLocation, Specificity3, Specificity6
-from textual.dom import DOMNode
+from textual.dom import DOMNode, _get_pseudo_class_bits
 from textual.markup import parse_style
 from textual.style import Style
 from textual.widget import Widget
 
 _DEFAULT_STYLES = Styles()
 
+UpdateScope: TypeAlias = Literal["node", "descendants"]
+"""The nodes which may be affected by a change to a node's classes."""
+
+_RE_VARIABLE_DEFINITION = re.compile(r"^\s*\$[\w-]+\s*:", re.MULTILINE)
+
+
+@lru_cache(maxsize=1024)
+def _defines_variables(css: str) -> bool:
+    """Check if CSS (may) define variables.
+
+    Args:
+        css: CSS source.
+
+    Returns:
+        `True` if variables are defined, `False` if they are not.
+    """
+    return _RE_VARIABLE_DEFINITION.search(css) is not None
+
 
 class StylesheetParseError(StylesheetError):
     """Raised when the stylesheet could not be parsed."""
@@ -138,6 +161,15 @@ class CssSource(NamedTuple):
     scope: str = ""
 
 
+class _ComponentSelectors(NamedTuple):
+    """Names in the selectors of rules which may apply to component classes."""
+
+    types: frozenset[str]
+    classes: frozenset[str]
+    ids: frozenset[str]
+    pseudo_classes: tuple[str, ...]
+
+
 @rich.repr.auto(angular=True)
 class Stylesheet:
     """A Stylesheet generated from Textual CSS."""
@@ -152,6 +184,19 @@ class Stylesheet:
         self._invalid_css: set[str] = set()
         self._parse_cache: LRUCache[tuple, list[RuleSet]] = LRUCache(64)
         self._style_parse_cache: LRUCache[str, Style] = LRUCache(1024 * 4)
+        self._generation = 0
+        """Incremented when the rules change."""
+        self._component_rules_cache: LRUCache[tuple, dict[str, RulesMap]] = LRUCache(
+            1024
+        )
+        self._component_selectors: dict[type[DOMNode], _ComponentSelectors] = {}
+        self._update_scopes: dict[str, UpdateScope] | None = None
+        self._display_names: set[str] = set()
+        """Names in rules which may change the display or visibility of descendants."""
+        self._disk_cache_path: Path | None = (
+            _parse_cache.get_cache_path() if constants.CSS_CACHE else None
+        )
+        """Directory to cache parsed CSS, or `None` to disable the disk cache."""
 
     def __rich_repr__(self) -> rich.repr.Result:
         yield list(self.source.keys())
@@ -205,6 +250,7 @@ class Stylesheet:
             New stylesheet.
         """
         stylesheet = Stylesheet(variables=self._variables.copy())
+        stylesheet._disk_cache_path = self._disk_cache_path
         stylesheet.source = self.source.copy()
         return stylesheet
 
@@ -220,6 +266,157 @@ class Stylesheet:
         self._parse_cache.clear()
         self._style_parse_cache.clear()
 
+    def update_variables(self, variables: dict[str, str]) -> set[RuleSet] | None:
+        """Set CSS variables, and update the rules which use changed variables.
+
+        Rather than parsing all the CSS again, the declarations which reference
+        changed variables are substituted with the new values.
+
+        Args:
+            variables: A mapping of name to variable.
+
+        Returns:
+            The rule sets which were updated, or `None` if the CSS must be parsed
+                again with `reparse`.
+        """
+        previous_variables = self._variables
+        changed_variables = {
+            name
+            for name in previous_variables.keys() | variables.keys()
+            if previous_variables.get(name) != variables.get(name)
+        }
+        if not changed_variables:
+            return set()
+        self._variables = variables
+        self.__variable_tokens = None
+        self._style_parse_cache.clear()
+        if (
+            self._require_parse
+            or self._invalid_css
+            or any(
+                _defines_variables(source.content) for source in self.source.values()
+            )
+        ):
+            # Variables defined in CSS may depend on the changed variables
+            self.set_variables(variables)
+            return None
+
+        rules = self._rules
+        # Cached rules not in the stylesheet would have stale variables
+        rule_ids = {id(rule) for rule in rules}
+        for cache_key in list(self._parse_cache.keys()):
+            cached_rules = self._parse_cache.get(cache_key)
+            if cached_rules is None or not all(
+                id(rule) in rule_ids for rule in cached_rules
+            ):
+                self._parse_cache.discard(cache_key)
+
+        variable_tokens = self._variable_tokens
+        updated_rules: set[RuleSet] = set()
+        updated_styles: set[int] = set()
+        for rule in rules:
+            if changed_variables.isdisjoint(rule.variables):
+                continue
+            # Nested rule sets share styles, which need only be updated once
+            if id(rule.styles) not in updated_styles:
+                if not resubstitute_variables(rule, variable_tokens):
+                    self.set_variables(variables)
+                    return None
+                updated_styles.add(id(rule.styles))
+            updated_rules.add(rule)
+        if updated_rules:
+            self._rules_changed()
+        return updated_rules
+
+    def _rules_changed(self) -> None:
+        """Called when the rules change, to discard data derived from the rules."""
+        self._generation += 1
+        self._component_rules_cache.clear()
+        self._component_selectors.clear()
+        self._update_scopes = None
+
+    def _get_update_scopes(self) -> dict[str, UpdateScope]:
+        """Get an index of the nodes affected by each class and pseudo class.
+
+        A class (or pseudo class) in the last compound selector of a rule affects only
+        the node which has it. Anywhere else in a selector, it affects descendants.
+
+        Returns:
+            A mapping of class names (prefixed with ".") and pseudo classes (prefixed
+                with ":") on to the scope of nodes that they affect.
+        """
+        if self._update_scopes is None:
+            update_scopes: dict[str, UpdateScope] = {}
+            display_names: set[str] = set()
+            SAME = CombinatorType.SAME
+            CLASS = SelectorType.CLASS
+            for rule in self.rules:
+                has_rule = rule.styles.has_rule
+                changes_display = has_rule("display") or has_rule("visibility")
+                for selector_set in rule.selector_set:
+                    selectors = selector_set.selectors
+                    last_compound = len(selectors) - 1
+                    while (
+                        last_compound > 0
+                        and selectors[last_compound].combinator == SAME
+                    ):
+                        last_compound -= 1
+                    for index, selector in enumerate(selectors):
+                        names = [
+                            f":{pseudo_class}"
+                            for pseudo_class in selector.pseudo_classes
+                        ]
+                        if selector.type == CLASS:
+                            names.append(f".{selector.name}")
+                        scope: UpdateScope = (
+                            "node" if index >= last_compound else "descendants"
+                        )
+                        for name in names:
+                            if update_scopes.get(name) != "descendants":
+                                update_scopes[name] = scope
+                        if changes_display and scope == "descendants":
+                            display_names.update(names)
+            self._update_scopes = update_scopes
+            self._display_names = display_names
+        return self._update_scopes
+
+    def get_update_scope(self, names: Iterable[str]) -> UpdateScope | None:
+        """Get the nodes which may need updating, when classes or pseudo classes change.
+
+        Args:
+            names: Class names (prefixed with ".") or pseudo classes (prefixed with ":")
+                which have been added to, or removed from, a node.
+
+        Returns:
+            `"node"` if only the node's styles may change, `"descendants"` if the styles
+                of the node and its descendants may change, or `None` if no rules
+                refer to the names.
+        """
+        update_scopes = self._get_update_scopes()
+        scope: UpdateScope | None = None
+        for name in names:
+            name_scope = update_scopes.get(name)
+            if name_scope == "descendants":
+                return name_scope
+            if name_scope is not None:
+                scope = name_scope
+        return scope
+
+    def affects_display(self, names: Iterable[str]) -> bool:
+        """Check if changing classes or pseudo classes may hide or show descendants.
+
+        Args:
+            names: Class names (prefixed with ".") or pseudo classes (prefixed with ":")
+                which have been added to, or removed from, a node.
+
+        Returns:
+            `True` if a rule which sets `display` or `visibility` refers to one of the
+                names in a selector for descendants.
+        """
+        self._get_update_scopes()
+        display_names = self._display_names
+        return any(name in display_names for name in names)
+
     def parse_style(self, style_text: str | Style) -> Style:
         """Parse a (visual) Style.
 
@@ -265,6 +462,17 @@ class Stylesheet:
             return self._parse_cache[cache_key]
         except KeyError:
             pass
+
+        disk_cache_path = self._disk_cache_path
+        if disk_cache_path is not None:
+            disk_cache_key = _parse_cache.get_cache_key(
+                css, read_from, is_default_rules, tie_breaker, scope, self._variables
+            )
+            cached_rules = _parse_cache.load_rules(disk_cache_path, disk_cache_key)
+            if cached_rules is not None:
+                self._parse_cache[cache_key] = cached_rules
+                return cached_rules
+
         try:
             rules = list(
                 parse(
@@ -283,6 +491,8 @@ class Stylesheet:
             raise StylesheetError(f"failed to parse css; {error}") from None
 
         self._parse_cache[cache_key] = rules
+        if disk_cache_path is not None and not any(rule.errors for rule in rules):
+            _parse_cache.save_rules(disk_cache_path, disk_cache_key, rules)
         return rules
 
     def read(self, filename: str | PurePath) -> None:
@@ -405,6 +615,7 @@ class Stylesheet:
         self._rules = rules
         self._require_parse = False
         self._rules_map = None
+        self._rules_changed()
 
     def reparse(self) -> None:
         """Re-parse source, applying new variables.
@@ -415,6 +626,7 @@ class Stylesheet:
         """
         # Do this in a fresh Stylesheet so if there are errors we don't break self.
         stylesheet = Stylesheet(variables=self._variables)
+        stylesheet._disk_cache_path = self._disk_cache_path
         for read_from, (css, is_defaults, tie_breaker, scope) in self.source.items():
             stylesheet.add_source(
                 css,
@@ -436,22 +648,24 @@ class Stylesheet:
             self._rules_map = None
             self.source = stylesheet.source
             self._require_parse = False
+            self._rules_changed()
 
     @classmethod
     def _check_rule(
-        cls, rule_set: RuleSet, css_path_nodes: list[DOMNode]
+        cls, rule_set: RuleSet, css_path_nodes: list[DOMNode], ancestor_bloom: int
     ) -> Iterable[Specificity3]:
         """Check a rule set, return specificity of applicable rules.
 
         Args:
             rule_set: A rule set.
             css_path_nodes: A list of the nodes from the App to the node being checked.
+            ancestor_bloom: Bloom filter of the selector names matching the ancestors.
 
         Yields:
             Specificity of any matching selectors.
         """
         for selector_set in rule_set.selector_set:
-            if _check_selectors(selector_set.selectors, css_path_nodes):
+            if _check_selector_set(selector_set, css_path_nodes, ancestor_bloom):
                 yield selector_set.specificity
 
     # pseudo classes which iterate over multiple nodes
@@ -464,6 +678,23 @@ class Stylesheet:
         "focus-within",
     }
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_cache_key_mask(cls, node_type: type[DOMNode]) -> int:
+        """Get a mask of the pseudo classes which may be used in a cache key.
+
+        Args:
+            node_type: A DOMNode class.
+
+        Returns:
+            A bitmask of pseudo classes not in `_EXCLUDE_PSEUDO_CLASSES_FROM_CACHE`.
+        """
+        mask = 0
+        for name, bit in _get_pseudo_class_bits(node_type).items():
+            if name not in cls._EXCLUDE_PSEUDO_CLASSES_FROM_CACHE:
+                mask |= bit
+        return mask
+
     def apply(
         self,
         node: DOMNode,
@@ -508,6 +739,11 @@ class Stylesheet:
         node._has_odd_or_even = (
             "odd" in all_pseudo_classes or "even" in all_pseudo_classes
         )
+        if (node._has_order_style or node._has_odd_or_even) and isinstance(
+            node, Widget
+        ):
+            # Recorded so that moving siblings only restyles nodes whose position changed
+            node._positional_state = node._get_positional_state()
 
         cache_key: tuple | None = None
 
@@ -522,7 +758,7 @@ class Stylesheet:
                     else (node._id if f"#{node._id}" in rules_map else None)
                 ),
                 node.classes,
-                node._pseudo_classes_cache_key,
+                node._pseudo_classes_cache_key & self._get_cache_key_mask(type(node)),
                 node._css_type_name,
             )
             cached_result: RulesMap | None = cache.get(cache_key)
@@ -533,6 +769,8 @@ class Stylesheet:
 
         _check_rule = self._check_rule
         css_path_nodes = node.css_path_nodes
+        # Used to reject rules which require ancestors that aren't present
+        ancestor_bloom = get_ancestor_bloom(css_path_nodes)
 
         # Rules that may be set to the special value `initial`
         initial: set[str] = set()
@@ -542,7 +780,7 @@ class Stylesheet:
         for rule in rules:
             is_default_rules = rule.is_default_rules
             tie_breaker = rule.tie_breaker
-            for base_specificity in _check_rule(rule, css_path_nodes):
+            for base_specificity in _check_rule(rule, css_path_nodes, ancestor_bloom):
                 for key, rule_specificity, value in rule.styles.extract_rules(
                     base_specificity, is_default_rules, tie_breaker
                 ):
@@ -603,6 +841,79 @@ class Stylesheet:
             self.replace_rules(node, node_rules, animate=animate)
         self._process_component_classes(node)
 
+    def _get_component_selectors(self, node_type: type[DOMNode]) -> _ComponentSelectors:
+        """Get the selector names which may affect the component classes of a node type.
+
+        Args:
+            node_type: The type of a node with component classes.
+
+        Returns:
+            Names of the types, classes, IDs, and pseudo classes in the selectors.
+        """
+        if node_type in self._component_selectors:
+            return self._component_selectors[node_type]
+        rules_map = self.rules_map
+        # Selector names of the virtual nodes created for component classes
+        names = {"*", DOMNode.__name__}
+        names.update(
+            f".{component}" for component in node_type._get_component_classes()
+        )
+        types: set[str] = set()
+        classes: set[str] = set()
+        ids: set[str] = set()
+        pseudo_classes: set[str] = set()
+        for name in names & rules_map.keys():
+            for rule in rules_map[name]:
+                for selector_set in rule.selector_set:
+                    for selector in selector_set.selectors:
+                        pseudo_classes.update(selector.pseudo_classes)
+                        if selector.type == SelectorType.TYPE:
+                            types.add(selector.name)
+                        elif selector.type == SelectorType.CLASS:
+                            classes.add(selector.name)
+                        elif selector.type == SelectorType.ID:
+                            ids.add(selector.name)
+        component_selectors = self._component_selectors[node_type] = (
+            _ComponentSelectors(
+                frozenset(types),
+                frozenset(classes),
+                frozenset(ids),
+                tuple(sorted(pseudo_classes)),
+            )
+        )
+        return component_selectors
+
+    def _get_component_key(self, node: DOMNode) -> tuple:
+        """Get a key which identifies the component styles of a node.
+
+        The key contains the state of the node and its ancestors, but only the state
+        that may be checked by the rules for the node's component classes.
+
+        Args:
+            node: A DOM node with component classes.
+
+        Returns:
+            A hashable key.
+        """
+        types, classes, ids, pseudo_classes = self._get_component_selectors(type(node))
+        return (
+            type(node),
+            *[
+                (
+                    types & path_node._css_type_names,
+                    classes & path_node._classes,
+                    path_node._id if path_node._id in ids else None,
+                    tuple(
+                        [
+                            path_node.has_pseudo_class(pseudo_class)
+                            for pseudo_class in pseudo_classes
+                        ]
+                    ),
+                )
+                for path_node in node.css_path_nodes
+            ],
+        )
+
     def _process_component_classes(self, node: DOMNode) -> None:
         """Process component classes for the given node.
 
@@ -611,6 +922,15 @@ class Stylesheet:
         """
         component_classes = node._get_component_classes()
         if component_classes:
+            component_key = self._get_component_key(node)
+            if node._component_styles and node._component_styles_key == (
+                self._generation,
+                component_key,
+            ):
+                # Nothing that could change the component styles has changed
+                return
+            component_rules = self._component_rules_cache.get(component_key)
+            new_component_rules: dict[str, RulesMap] = {}
             # Create virtual nodes that exist to extract styles
             refresh_node = False
             old_component_styles = node._component_styles.copy()
@@ -618,7 +938,13 @@ class Stylesheet:
             for component in sorted(component_classes):
                 virtual_node = DOMNode(classes=component)
                 virtual_node._attach(node)
-                self.apply(virtual_node, animate=False)
+                if component_rules is None:
+                    self.apply(virtual_node, animate=False)
+                    new_component_rules[component] = (
+                        virtual_node._css_styles.get_rules()
+                    )
+                else:
+                    virtual_node._css_styles.merge_rules(component_rules[component])
                 if (
                     not refresh_node
                     and old_component_styles.get(component) != virtual_node.styles
@@ -626,6 +952,9 @@ class Stylesheet:
                     # If the styles have changed we want to refresh the node
                     refresh_node = True
                 node._component_styles[component] = virtual_node.styles
+            if component_rules is None:
+                self._component_rules_cache[component_key] = new_component_rules
+            node._component_styles_key = (self._generation, component_key)
             if refresh_node:
                 node.refresh()
 
@@ -708,6 +1037,61 @@ class Stylesheet:
 
         self.update_nodes(root.walk_children(with_self=True), animate=animate)
 
+    def update_rules(
+        self, root: DOMNode, rules: Iterable[RuleSet], animate: bool = False
+    ) -> None:
+        """Update styles on the nodes (under a root) which may match the given rules.
+
+        Args:
+            root: Root node to update.
+            rules: Rule sets which have changed.
+            animate: Enable CSS animation.
+        """
+        selector_names: set[str] = set().union(*[rule.selector_names for rule in rules])
+        if not selector_names:
+            return
+        if "*" in selector_names:
+            self.update(root, animate=animate)
+            return
+
+        component_names: dict[type[DOMNode], set[str]] = {}
+
+        def may_match(node: DOMNode) -> bool:
+            """Check if a node, its component classes, or scrollbars may match the rules.
+
+            Args:
+                node: A DOM node.
+
+            Returns:
+                `True` if the node should be updated.
+            """
+            if not selector_names.isdisjoint(node._selector_names):
+                return True
+            node_type = type(node)
+            if node_type not in component_names:
+                component_names[node_type] = {
+                    f".{component}" for component in node._get_component_classes()
+                }
+            if not selector_names.isdisjoint(component_names[node_type]):
+                return True
+            if isinstance(node, Widget) and node.is_scrollable:
+                scrollbars: list[Widget] = []
+                if node.show_vertical_scrollbar:
+                    scrollbars.append(node.vertical_scrollbar)
+                if node.show_horizontal_scrollbar:
+                    scrollbars.append(node.horizontal_scrollbar)
+                if node.show_horizontal_scrollbar and node.show_vertical_scrollbar:
+                    scrollbars.append(node.scrollbar_corner)
+                return any(
+                    not selector_names.isdisjoint(scrollbar._selector_names)
+                    for scrollbar in scrollbars
+                )
+            return False
+
+        self.update_nodes(
+            filter(may_match, root.walk_children(with_self=True)), animate=animate
+        )
+
     def update_nodes(self, nodes: Iterable[DOMNode], animate: bool = False) -> None:
         """Update styles for nodes.
 
@@ -13,6 +13,7 @@ from inspect import getfile
 from operator import attrgetter
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Callable,
     ClassVar,
@@ -35,7 +36,8 @@ from textual._node_list import NodeList
 from textual._types import WatchCallbackType
 from textual.binding import Binding, BindingsMap, BindingType
 from textual.cache import LRUCache
-from textual.color import BLACK, WHITE, Color
+from textual.color import Color
+from textual.css._computed_style import ComputedStyle
 from textual.css._error_tools import friendly_list
 from textual.css.constants import VALID_DISPLAY, VALID_VISIBILITY
 from textual.css.errors import DeclarationError, StyleValueError
@@ -112,6 +114,19 @@ class NoScreen(DOMError):
     """Raised when the node has no associated screen."""
 
 
+@lru_cache(maxsize=None)
+def _get_pseudo_class_bits(node_type: type[DOMNode]) -> dict[str, int]:
+    """Assign a bit to each of the pseudo classes of a node type.
+
+    Args:
+        node_type: A DOMNode class.
+
+    Returns:
+        A mapping of pseudo class name on to a bit.
+    """
+    return {name: 1 << index for index, name in enumerate(node_type._PSEUDO_CLASSES)}
+
+
 class _ClassesDescriptor:
     """A descriptor to manage the `classes` property."""
 
@@ -128,8 +143,9 @@ class _ClassesDescriptor:
         else:
             class_names = set(classes)
         check_identifiers("class name", *class_names)
+        changed_classes = obj._classes ^ class_names
         obj._classes = class_names
-        obj._update_styles()
+        obj._update_styles({f".{class_name}" for class_name in changed_classes})
 
 
 @rich.repr.auto
@@ -210,8 +226,14 @@ class DOMNode(MessagePump):
         self.styles: RenderStyles = RenderStyles(
             self, self._css_styles, self._inline_styles
         )
+        self._computed_style: ComputedStyle | None = None
+        """Styles resolved from this node and its ancestors."""
+        self._pseudo_class_mask: tuple[tuple[object, ...], int] | None = None
+        """A cache key and the pseudo classes of the node as a bitmask, or `None` if not known."""
         # A mapping of class names to Styles set in COMPONENT_CLASSES
         self._component_styles: dict[str, RenderStyles] = {}
+        self._component_styles_key: tuple | None = None
+        """Identifies the state the component styles were resolved from."""
 
         self._auto_refresh: float | None = None
         self._auto_refresh_timer: Timer | None = None
@@ -1010,6 +1032,28 @@ class DOMNode(MessagePump):
         add_children(tree, self)
         return tree
 
+    def _get_computed_style(self) -> ComputedStyle:
+        """Get the styles resolved from this node and its ancestors.
+
+        The computed style is rebuilt only if the styles of this node, or of an
+        ancestor, have changed.
+
+        Returns:
+            A computed style.
+        """
+        parent = cast("DOMNode | None", self._parent)
+        parent_style = None if parent is None else parent._get_computed_style()
+        computed_style = self._computed_style
+        if (
+            computed_style is None
+            or computed_style.parent is not parent_style
+            or computed_style.cache_key != self.styles._cache_key
+        ):
+            computed_style = self._computed_style = ComputedStyle.from_styles(
+                self.styles, parent_style
+            )
+        return computed_style
+
     @property
     def text_style(self) -> Style:
         """Get the text style object.
@@ -1020,9 +1064,7 @@ class DOMNode(MessagePump):
         Returns:
             A Rich Style.
         """
-        return Style.combine(
-            node.styles.text_style for node in reversed(self.ancestors_with_self)
-        )
+        return self._get_computed_style().text_style
 
     @property
     def selection_style(self) -> Style:
@@ -1037,36 +1079,7 @@ class DOMNode(MessagePump):
         Returns:
             A Rich style.
         """
-        background = Color(0, 0, 0, 0)
-        color = Color(255, 255, 255, 0)
-
-        style = Style()
-        opacity = 1.0
-
-        for node in reversed(self.ancestors_with_self):
-            styles = node.styles
-            has_rule = styles.has_rule
-            opacity *= styles.opacity
-            if has_rule("background"):
-                text_background = background + styles.background.tint(
-                    styles.background_tint
-                )
-                background += (
-                    styles.background.tint(styles.background_tint)
-                ).multiply_alpha(opacity)
-            else:
-                text_background = background
-            if has_rule("color"):
-                color = styles.color
-            style += styles.text_style
-            if has_rule("auto_color") and styles.auto_color:
-                color = text_background.get_contrast_text(color.a)
-
-        style += Style.from_color(
-            (background + color).rich_color if (background.a or color.a) else None,
-            background.rich_color if background.a else None,
-        )
-        return style
+        return self._get_computed_style().rich_style
 
     def check_consume_key(self, key: str, character: str | None) -> bool:
         """Check if the widget may consume the given key.
@@ -1138,12 +1151,7 @@ class DOMNode(MessagePump):
         Returns:
             `(<background color>, <color>)`
         """
-        base_background = background = BLACK
-        for node in reversed(self.ancestors_with_self):
-            styles = node.styles
-            base_background = background
-            background += styles.background.tint(styles.background_tint)
-        return (base_background, background)
+        return self._get_computed_style().background_colors
 
     @property
     def _opacity_background_colors(self) -> tuple[Color, Color]:
@@ -1152,16 +1160,7 @@ class DOMNode(MessagePump):
         Returns:
             `(<background color>, <color>)`
         """
-        base_background = background = BLACK
-        opacity = 1.0
-        for node in reversed(self.ancestors_with_self):
-            styles = node.styles
-            base_background = background
-            opacity *= styles.opacity
-            background += styles.background.tint(styles.background_tint).multiply_alpha(
-                opacity
-            )
-        return (base_background, background)
+        return self._get_computed_style().opacity_background_colors
 
     @property
     def colors(self) -> tuple[Color, Color, Color, Color]:
@@ -1170,20 +1169,7 @@ class DOMNode(MessagePump):
         Returns:
             `(<parent background>, <parent color>, <background>, <color>)`
         """
-        base_background = background = WHITE
-        base_color = color = BLACK
-        for node in reversed(self.ancestors_with_self):
-            styles = node.styles
-            base_background = background
-            background += styles.background.tint(styles.background_tint)
-            if styles.has_rule("color"):
-                base_color = color
-                if styles.auto_color:
-                    color = background.get_contrast_text(color.a)
-                else:
-                    color = styles.color
-
-        return (base_background, base_color, background, color)
+        return self._get_computed_style().colors
 
     @property
     def ancestors_with_self(self) -> list[DOMNode]:
@@ -1251,17 +1237,33 @@ class DOMNode(MessagePump):
         """
         _watch(self, obj, attribute_name, callback, init=init)
 
+    def _get_pseudo_class_mask(self) -> int:
+        """Get the pseudo classes of this node as a bitmask.
+
+        Bits are assigned to the pseudo classes in the order of `_PSEUDO_CLASSES`.
+
+        Returns:
+            A bitmask of the pseudo classes which are present.
+        """
+        mask = 0
+        bit = 1
+        for check_class in self._PSEUDO_CLASSES.values():
+            if check_class(self):
+                mask |= bit
+            bit <<= 1
+        return mask
+
     def get_pseudo_classes(self) -> set[str]:
         """Pseudo classes for a widget.
 
         Returns:
             Names of the pseudo classes.
         """
-
+        mask = self._get_pseudo_class_mask()
         return {
             name
-            for name, check_class in self._PSEUDO_CLASSES.items()
-            if check_class(self)
+            for name, bit in _get_pseudo_class_bits(type(self)).items()
+            if mask & bit
         }
 
     def reset_styles(self) -> None:
@@ -1673,13 +1675,17 @@ class DOMNode(MessagePump):
         self.classes = classes
         return self
 
-    def _update_styles(self) -> None:
+    def _update_styles(self, names: AbstractSet[str] | None = None) -> None:
         """Request an update of this node's styles.
 
         Should be called whenever CSS classes / pseudo classes change.
+
+        Args:
+            names: The classes (prefixed with ".") or pseudo classes (prefixed with
+                ":") which changed, or `None` to update the node and all descendants.
         """
         try:
-            self.app.update_styles(self)
+            self.app.update_styles(self, names)
         except NoActiveAppError:
             pass
 
@@ -1699,7 +1705,9 @@ class DOMNode(MessagePump):
         if old_classes == self._classes:
             return self
         if update:
-            self._update_styles()
+            self._update_styles(
+                {f".{class_name}" for class_name in self._classes - old_classes}
+            )
         return self
 
     def remove_class(self, *class_names: str, update: bool = True) -> Self:
@@ -1718,7 +1726,9 @@ class DOMNode(MessagePump):
         if old_classes == self._classes:
             return self
         if update:
-            self._update_styles()
+            self._update_styles(
+                {f".{class_name}" for class_name in old_classes - self._classes}
+            )
         return self
 
     def toggle_class(self, *class_names: str) -> Self:
@@ -1735,7 +1745,9 @@ class DOMNode(MessagePump):
         self._classes.symmetric_difference_update(class_names)
         if old_classes == self._classes:
             return self
-        self._update_styles()
+        self._update_styles(
+            {f".{class_name}" for class_name in old_classes ^ self._classes}
+        )
         return self
 
     def has_pseudo_class(self, class_name: str) -> bool:
@@ -1747,10 +1759,8 @@ class DOMNode(MessagePump):
         Returns:
             `True` if the DOM node has the pseudo class, `False` if not.
         """
-        try:
-            return self._PSEUDO_CLASSES[class_name](self)
-        except KeyError:
-            return False
+        bit = _get_pseudo_class_bits(type(self)).get(class_name, 0)
+        return bool(bit and self._get_pseudo_class_mask() & bit)
 
     def has_pseudo_classes(self, class_names: set[str]) -> bool:
         """Check the node has all the given pseudo classes.
@@ -1761,16 +1771,17 @@ class DOMNode(MessagePump):
         Returns:
             `True` if all pseudo class names are present.
         """
-        PSEUDO_CLASSES = self._PSEUDO_CLASSES
+        pseudo_class_bits = _get_pseudo_class_bits(type(self))
+        mask = self._get_pseudo_class_mask()
         try:
-            return all(PSEUDO_CLASSES[name](self) for name in class_names)
+            return all(mask & pseudo_class_bits[name] for name in class_names)
         except KeyError:
             return False
 
     @property
-    def _pseudo_classes_cache_key(self) -> tuple[int, ...]:
+    def _pseudo_classes_cache_key(self) -> int:
         """A cache key used when updating a number of nodes from the stylesheet."""
-        return ()
+        return 0
 
     def refresh(
         self, *, repaint: bool = True, layout: bool = False, recompose: bool = False
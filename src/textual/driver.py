@@ -8,9 +8,11 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO, Iterator, Literal, TextIO
 
 from textual import events, log, messages
+from textual._ansi_sequences import SYNC_END, SYNC_START
 from textual.events import MouseUp
 
 if TYPE_CHECKING:
+    from textual._compositor import Frame
     from textual.app import App
 
 
@@ -139,6 +141,39 @@ class Driver(ABC):
             data: Raw data.
         """
 
+    def write_frame(self, frame: Frame) -> bool:
+        """Write a compositor frame to the output device.
+
+        Drivers may override this to encode the frame in another thread.
+
+        Args:
+            frame: A compositor frame.
+
+        Returns:
+            `False` if the frame was discarded (because the output device is too far
+                behind) and a full frame is required, otherwise `True`.
+        """
+        data = frame.render()
+        if frame.sync:
+            data = f"{SYNC_START}{data}{SYNC_END}"
+        self.write(data)
+        return True
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of frames which were superseded before they could be written."""
+        return 0
+
+    @property
+    def merged_frames(self) -> int:
+        """Number of frames which were written along with a previous frame."""
+        return 0
+
+    @property
+    def output_time(self) -> float | None:
+        """Average time (in seconds) to write a frame, or `None` if not known."""
+        return None
+
     def flush(self) -> None:
         """Flush any buffered data."""
 
@@ -1,21 +1,60 @@
 from __future__ import annotations
 
+import sys
 import threading
-from queue import Queue
-from typing import IO
+from collections import deque
+from time import perf_counter
+from typing import IO, TYPE_CHECKING, Callable, Union
 
 from typing_extensions import Final
 
-MAX_QUEUED_WRITES: Final[int] = 30
+from textual._ansi_sequences import SYNC_END, SYNC_START
+
+if TYPE_CHECKING:
+    from textual._compositor import Frame
+
+WINDOWS: Final = sys.platform == "win32"
+
+WINDOWS_CHUNK_SIZE: Final[int] = 8192
+"""Maximum size of a single write on Windows."""
+
+MAX_QUEUED_FRAMES: Final[int] = 30
+"""Maximum number of frames waiting to be written, before they are discarded."""
+
+OUTPUT_TIME_WEIGHT: Final[float] = 0.2
+"""Weight of the latest measurement in the average output time."""
 
 
 class WriterThread(threading.Thread):
-    """A thread / file-like to do writes to stdout in the background."""
+    """A thread / file-like to do writes to stdout in the background.
+
+    Compositor frames are encoded in the thread, so the event loop doesn't wait on
+    encoding or the terminal. If the terminal can't keep up, a frame which updates the
+    whole screen replaces any frames still waiting to be written. If too many partial
+    frames are waiting, they are discarded and the caller should send a full frame.
+    Inline frames are never discarded.
+
+    Args:
+        file: File to write to.
+        on_error: Callback to invoke (from the thread) if a frame fails to render.
+    """
 
-    def __init__(self, file: IO[str]) -> None:
+    def __init__(
+        self,
+        file: IO[str],
+        on_error: Callable[[Exception], object] | None = None,
+    ) -> None:
         super().__init__(daemon=True)
-        self._queue: Queue[str | None] = Queue(MAX_QUEUED_WRITES)
+        self._queue: deque[Union[str, Frame, None]] = deque()
+        self._condition = threading.Condition()
         self._file = file
+        self._on_error = on_error
+        self.dropped_frames = 0
+        """Number of frames which were replaced before being written."""
+        self.merged_frames = 0
+        """Number of frames which were written along with a previous frame."""
+        self.output_time: float | None = None
+        """Average time (in seconds) to write and flush frames, or `None` if no frames were written."""
 
     def write(self, text: str) -> None:
         """Write text. Text will be enqueued for writing.
@@ -23,7 +62,42 @@ class WriterThread(threading.Thread):
         Args:
             text: Text to write to the file.
         """
-        self._queue.put(text)
+        with self._condition:
+            self._queue.append(text)
+            self._condition.notify()
+
+    def write_frame(self, frame: Frame) -> bool:
+        """Enqueue a frame, to be encoded and written in the thread.
+
+        Args:
+            frame: A compositor frame.
+
+        Returns:
+            `False` if the frame was discarded (along with any waiting frames), and a
+                full frame is required, otherwise `True`.
+        """
+        with self._condition:
+            queue = self._queue
+            pending_frames = sum(
+                1 for item in queue if item is not None and not isinstance(item, str)
+            )
+            # Inline frames position the cursor relative to the previous frame
+            collapse = (
+                not frame.is_full
+                and not frame.is_inline
+                and pending_frames >= MAX_QUEUED_FRAMES
+            )
+            if (frame.is_full or collapse) and pending_frames:
+                self._queue = queue = deque(
+                    item for item in queue if item is None or isinstance(item, str)
+                )
+                self.dropped_frames += pending_frames
+            if collapse:
+                self.dropped_frames += 1
+                return False
+            queue.append(frame)
+            self._condition.notify()
+        return True
 
     def isatty(self) -> bool:
         """Pretend to be a terminal.
@@ -45,24 +119,94 @@ class WriterThread(threading.Thread):
         """Flush the file (a no-op, because flush is done in the thread)."""
         return
 
+    def _get_items(self) -> list[str | Frame | None]:
+        """Wait for, and remove, everything in the queue.
+
+        Returns:
+            Queued items.
+        """
+        with self._condition:
+            while not self._queue:
+                self._condition.wait()
+            items = list(self._queue)
+            self._queue.clear()
+        return items
+
+    def _render(self, items: list[str | Frame]) -> str:
+        """Render queued items to a single string.
+
+        Args:
+            items: Text and frames.
+
+        Returns:
+            Data to write to the file.
+        """
+        output: list[str] = []
+        frame_count = 0
+        sync = False
+        for item in items:
+            if isinstance(item, str):
+                output.append(item)
+                continue
+            try:
+                output.append(item.render())
+            except Exception as error:
+                if self._on_error is None:
+                    raise
+                self._on_error(error)
+            else:
+                frame_count += 1
+                sync = sync or item.sync
+        if frame_count > 1:
+            self.merged_frames += frame_count - 1
+        if sync:
+            return f"{SYNC_START}{''.join(output)}{SYNC_END}"
+        return "".join(output)
+
+    def _update_output_time(self, output_time: float) -> None:
+        """Add a measurement to the average output time.
+
+        Args:
+            output_time: Time taken to write and flush, in seconds.
+        """
+        if self.output_time is None:
+            self.output_time = output_time
+        else:
+            self.output_time += (output_time - self.output_time) * OUTPUT_TIME_WEIGHT
+
     def run(self) -> None:
         """Run the thread."""
         write = self._file.write
         flush = self._file.flush
-        get = self._queue.get
-        qsize = self._queue.qsize
-        # Read from the queue, write to the file.
-        # Flush when there is a break.
+        # Read everything from the queue, write to the file, then flush.
         while True:
-            text: str | None = get()
-            if text is None:
+            items = self._get_items()
+            try:
+                stop = items.index(None)
+            except ValueError:
+                stop = -1
+            else:
+                del items[stop:]
+            text = self._render(items)  # type: ignore[arg-type]
+            start_time = perf_counter()
+            if WINDOWS:
+                # Combat a problem with Python on Windows.
+                #
+                # https://github.com/Textualize/textual/issues/2548
+                # https://github.com/python/cpython/issues/82052
+                for offset in range(0, len(text), WINDOWS_CHUNK_SIZE):
+                    write(text[offset : offset + WINDOWS_CHUNK_SIZE])
+            elif text:
+                write(text)
+            flush()
+            if any(not isinstance(item, str) for item in items):
+                self._update_output_time(perf_counter() - start_time)
+            if stop != -1:
                 break
-            write(text)
-            if qsize() == 0:
-                flush()
-        flush()
 
     def stop(self) -> None:
         """Stop the thread, and block until it finished."""
-        self._queue.put(None)
+        with self._condition:
+            self._queue.append(None)
+            self._condition.notify()
         self.join()
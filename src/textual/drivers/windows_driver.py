@@ -10,6 +10,7 @@ from textual.drivers import win32
 from textual.drivers._writer_thread import WriterThread
 
 if TYPE_CHECKING:
+    from textual._compositor import Frame
     from textual.app import App
 
 
@@ -53,6 +54,33 @@ class WindowsDriver(Driver):
         assert self._writer_thread is not None, "Driver must be in application mode"
         self._writer_thread.write(data)
 
+    def write_frame(self, frame: Frame) -> bool:
+        """Write a compositor frame, which will be encoded in the writer thread.
+
+        Args:
+            frame: A compositor frame.
+
+        Returns:
+            `False` if the frame was discarded and a full frame is required.
+        """
+        assert self._writer_thread is not None, "Driver must be in application mode"
+        return self._writer_thread.write_frame(frame)
+
+    @property
+    def dropped_frames(self) -> int:
+        """Number of frames which were superseded before they could be written."""
+        return 0 if self._writer_thread is None else self._writer_thread.dropped_frames
+
+    @property
+    def merged_frames(self) -> int:
+        """Number of frames which were written along with a previous frame."""
+        return 0 if self._writer_thread is None else self._writer_thread.merged_frames
+
+    @property
+    def output_time(self) -> float | None:
+        """Average time (in seconds) to write a frame, or `None` if not known."""
+        return None if self._writer_thread is None else self._writer_thread.output_time
+
     def _enable_mouse_support(self) -> None:
         """Enable reporting of mouse events."""
         if not self._mouse:
@@ -83,13 +111,21 @@ class WindowsDriver(Driver):
         """Disable bracketed paste mode."""
         self.write("\x1b[?2004l")
 
+    def _report_frame_error(self, error: Exception) -> None:
+        """Report an error rendering a frame (called from the writer thread).
+
+        Args:
+            error: The exception.
+        """
+        self._loop.call_soon_threadsafe(self._app._handle_exception, error)
+
     def start_application_mode(self) -> None:
         """Start application mode."""
         loop = asyncio.get_running_loop()
 
         self._restore_console = win32.enable_application_mode()
 
-        self._writer_thread = WriterThread(self._file)
+        self._writer_thread = WriterThread(self._file, self._report_frame_error)
         self._writer_thread.start()
 
         self.write("\x1b[?1049h")  # Enable alt screen
@@ -15,7 +15,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Type, TypeVar
+from typing import TYPE_CHECKING, Hashable, Type, TypeVar
 
 import rich.repr
 from rich.style import Style
@@ -146,6 +146,9 @@ class Resize(Event, bubble=False):
     def can_replace(self, message: "Message") -> bool:
         return isinstance(message, Resize)
 
+    def coalesce_key(self) -> Hashable | None:
+        return Resize
+
     def __rich_repr__(self) -> rich.repr.Result:
         yield "size", self.size
         yield "virtual_size", self.virtual_size, self.size
@@ -569,6 +572,15 @@ class MouseMove(MouseEvent, bubble=True, verbose=True):
     - [X] Verbose
     """
 
+    def coalesce_key(self) -> Hashable | None:
+        return MouseMove
+
+    def _coalesce(self, message: Message) -> None:
+        # Accumulate the movement of the discarded event
+        if isinstance(message, MouseMove):
+            self._delta_x += message._delta_x
+            self._delta_y += message._delta_y
+
 
 @rich.repr.auto
 class MouseDown(MouseEvent, bubble=True, verbose=True):
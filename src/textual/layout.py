@@ -31,6 +31,9 @@ class DockArrangeResult:
     _spatial_map: SpatialMap[WidgetPlacement] | None = None
     """A Spatial map to query widget placements."""
 
+    extent: Region | None = None
+    """Region covered by all widgets, if not all widgets have placements (i.e. a virtual layout)."""
+
     @property
     def spatial_map(self) -> SpatialMap[WidgetPlacement]:
         """A lazy-calculated spatial map."""
@@ -57,7 +60,10 @@ class DockArrangeResult:
             A Region.
         """
         _top, right, bottom, _left = self.scroll_spacing
-        return self.spatial_map.total_region.grow((0, right, bottom, 0))
+        total_region = self.spatial_map.total_region
+        if self.extent is not None:
+            total_region = total_region.union(self.extent)
+        return total_region.grow((0, right, bottom, 0))
 
     def get_visible_placements(self, region: Region) -> list[WidgetPlacement]:
         """Get the placements visible within the given region.
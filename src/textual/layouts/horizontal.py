@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from fractions import Fraction
 from typing import TYPE_CHECKING
 
-from textual._resolve import resolve_box_models
+from textual._resolve import get_common_denominator, resolve_box_models
 from textual.geometry import NULL_OFFSET, Region, Size
 from textual.layout import ArrangeResult, Layout, WidgetPlacement
 
@@ -66,13 +65,15 @@ class HorizontalLayout(Layout):
         if box_models:
             margins.append(box_models[-1].margin.right)
 
-        x = next(
+        # Positions are integers scaled by the common denominator of the widths
+        scale = get_common_denominator([box_model.width for box_model in box_models])
+        x = scale * next(
             (
-                Fraction(box_model.margin.left)
+                box_model.margin.left
                 for box_model, child in zip(box_models, children)
                 if child.styles.overlay != "screen"
             ),
-            Fraction(0),
+            0,
         )
 
         _Region = Region
@@ -93,12 +94,12 @@ class HorizontalLayout(Layout):
                 else NULL_OFFSET
             )
             offset_y = box_margin.top
-            next_x = x + content_width
+            next_x = x + content_width.numerator * (scale // content_width.denominator)
 
             region = _Region(
-                x.__floor__(),
+                x // scale,
                 offset_y,
-                (next_x - x.__floor__()).__floor__(),
+                next_x // scale - x // scale,
                 content_height.__floor__(),
             )
             absolute = styles.has_rule("position") and styles.position == "absolute"
@@ -115,6 +116,6 @@ class HorizontalLayout(Layout):
                 )
             )
             if not overlay and not absolute:
-                x = next_x + margin
+                x = next_x + margin * scale
 
         return placements
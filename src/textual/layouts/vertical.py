@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from fractions import Fraction
 from typing import TYPE_CHECKING
 
-from textual._resolve import resolve_box_models
+from textual._resolve import get_common_denominator, resolve_box_models
 from textual.geometry import NULL_OFFSET, Region, Size
 from textual.layout import ArrangeResult, Layout, WidgetPlacement
 
@@ -71,13 +70,15 @@ class VerticalLayout(Layout):
         if box_models:
             margins.append(box_models[-1].margin.bottom)
 
-        y = next(
+        # Positions are integers scaled by the common denominator of the heights
+        scale = get_common_denominator([box_model.height for box_model in box_models])
+        y = scale * next(
             (
-                Fraction(box_model.margin.top)
+                box_model.margin.top
                 for box_model, child in zip(box_models, children)
                 if child.styles.overlay != "screen"
             ),
-            Fraction(0),
+            0,
         )
 
         _Region = Region
@@ -88,7 +89,9 @@ class VerticalLayout(Layout):
         ):
             styles = widget.styles
             overlay = styles.overlay == "screen"
-            next_y = y + content_height
+            next_y = y + content_height.numerator * (
+                scale // content_height.denominator
+            )
             offset = (
                 styles.offset.resolve(
                     _Size(content_width.__floor__(), content_height.__floor__()),
@@ -100,9 +103,9 @@ class VerticalLayout(Layout):
 
             region = _Region(
                 box_margin.left,
-                y.__floor__(),
+                y // scale,
                 content_width.__floor__(),
-                next_y.__floor__() - y.__floor__(),
+                next_y // scale - y // scale,
             )
 
             absolute = styles.has_rule("position") and styles.position == "absolute"
@@ -119,6 +122,6 @@ class VerticalLayout(Layout):
                 )
             )
             if not overlay and not absolute:
-                y = next_y + margin
+                y = next_y + margin * scale
 
         return placements
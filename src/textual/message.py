@@ -5,7 +5,7 @@ The base class for all messages (including events).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, Hashable
 
 import rich.repr
 from typing_extensions import Self
@@ -128,6 +128,26 @@ class Message:
         """
         return False
 
+    def coalesce_key(self) -> Hashable | None:
+        """Get a key used to coalesce messages.
+
+        If this message is posted while a message with the same key is waiting to be
+        processed (anywhere in the queue), the waiting message is discarded. Override this
+        method for high-frequency messages where only the most recent matters (such as
+        progress updates).
+
+        Returns:
+            A hashable key, or `None` to never coalesce (the default).
+        """
+        return None
+
+    def _coalesce(self, message: Message) -> None:
+        """Called when this message replaces a pending message with the same coalesce key.
+
+        Args:
+            message: The discarded message.
+        """
+
     def prevent_default(self, prevent: bool = True) -> Message:
         """Suppress the default action(s). This will prevent handlers in any base classes
         from being called.
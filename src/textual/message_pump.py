@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import asyncio
 import threading
-from asyncio import CancelledError, Queue, QueueEmpty, Task, create_task
+from asyncio import CancelledError, QueueEmpty, Task, create_task
 from contextlib import contextmanager
 from functools import partial
 from time import perf_counter
@@ -34,6 +34,7 @@ from textual._callback import invoke
 from textual._context import NoActiveAppError, active_app, active_message_pump
 from textual._context import message_hook as message_hook_context_var
 from textual._context import prevent_message_types_stack
+from textual._message_queue import MessageQueue
 from textual._on import OnNoWidget
 from textual._time import time
 from textual.constants import SLOW_THRESHOLD
@@ -53,6 +54,18 @@ if TYPE_CHECKING:
 
 Callback: TypeAlias = "Callable[..., Any] | Callable[..., Awaitable[Any]]"
 
+DispatchPlan: TypeAlias = (
+    "tuple[tuple[type, tuple[tuple[Callable, dict[str, tuple[SelectorSet, ...]] | None], ...]], ...]"
+)
+"""Handlers for a message, grouped by class in MRO order.
+
+Each handler has a dict of `@on` selectors (which may be empty), or `None` for handlers
+found by the naming convention.
+"""
+
+_dispatch_plans: dict[tuple[type, type[Message], str], DispatchPlan] = {}
+"""Cache of dispatch plans, keyed on receiver class, message class, and handler name."""
+
 
 class CallbackError(Exception):
     pass
@@ -109,12 +122,23 @@ class _MessagePumpMeta(type):
         class_obj = super().__new__(cls, name, bases, class_dict, **kwargs)
         return class_obj
 
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if name.startswith(("on_", "_on_", "_decorated_handlers")):
+            # A handler may have changed
+            _dispatch_plans.clear()
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name: str) -> None:
+        if name.startswith(("on_", "_on_", "_decorated_handlers")):
+            _dispatch_plans.clear()
+        super().__delattr__(name)
+
 
 class MessagePump(metaclass=_MessagePumpMeta):
     """Base class which supplies a message pump."""
 
     def __init__(self, parent: MessagePump | None = None) -> None:
-        self._message_queue: Queue[Message | None] = Queue()
+        self._message_queue = MessageQueue()
         self._parent = parent
         self._running: bool = False
         self._closing: bool = False
@@ -205,6 +229,11 @@ class MessagePump(metaclass=_MessagePumpMeta):
         """The current size of the message queue."""
         return self._message_queue.qsize()
 
+    @property
+    def coalesced_message_count(self) -> int:
+        """The number of messages discarded because a newer message had the same coalesce key."""
+        return self._message_queue.coalesced_count
+
     @property
     def is_dom_root(self):
         """Is this a root node (i.e. the App)?"""
@@ -686,64 +715,102 @@ class MessagePump(metaclass=_MessagePumpMeta):
             if self._next_callbacks:
                 await self._flush_next_callbacks()
 
-    def _get_dispatch_methods(
-        self, method_name: str, message: Message
-    ) -> Iterable[tuple[type, Callable[[Message], Awaitable]]]:
-        """Gets handlers from the MRO
+    @classmethod
+    def _get_dispatch_plan(
+        cls, method_name: str, message_type: type[Message]
+    ) -> DispatchPlan:
+        """Get the handlers for a message type, by searching the MRO.
+
+        The result is cached, and only recalculated if a handler is set on a class.
 
         Args:
             method_name: Handler method name.
-            message: Message object.
+            message_type: Type of the message.
+
+        Returns:
+            Handlers grouped by class.
         """
-        from textual.widget import Widget
+        cache_key = (cls, message_type, method_name)
+        plan = _dispatch_plans.get(cache_key)
+        if plan is not None:
+            return plan
 
-        methods_dispatched: set[Callable] = set()
         message_mro = [
-            _type for _type in message.__class__.__mro__ if issubclass(_type, Message)
+            _type for _type in message_type.__mro__ if issubclass(_type, Message)
         ]
-        for cls in self.__class__.__mro__:
-            if message._no_default_action:
-                break
+        class_handlers: list[
+            tuple[
+                type,
+                tuple[tuple[Callable, dict[str, tuple[SelectorSet, ...]] | None], ...],
+            ]
+        ] = []
+        for base in cls.__mro__:
+            handlers: list[
+                tuple[Callable, dict[str, tuple[SelectorSet, ...]] | None]
+            ] = []
             # Try decorated handlers first
             decorated_handlers = cast(
                 "dict[type[Message], list[tuple[Callable, dict[str, tuple[SelectorSet, ...]]]]] | None",
-                cls.__dict__.get("_decorated_handlers"),
+                base.__dict__.get("_decorated_handlers"),
             )
-
             if decorated_handlers:
                 for message_class in message_mro:
-                    handlers = decorated_handlers.get(message_class, [])
-
-                    for method, selectors in handlers:
-                        if method in methods_dispatched:
-                            continue
-                        if not selectors:
-                            yield cls, method.__get__(self, cls)
-                            methods_dispatched.add(method)
-                        else:
-                            if not message._sender:
-                                continue
-                            for attribute, selector in selectors.items():
-                                node = getattr(message, attribute)
-                                if node is None:
-                                    break
-                                if not isinstance(node, Widget):
-                                    raise OnNoWidget(
-                                        f"on decorator can't match against {attribute!r} as it is not a widget."
-                                    )
-                                if not match(selector, node):
-                                    break
-                            else:
-                                yield cls, method.__get__(self, cls)
-                                methods_dispatched.add(method)
+                    handlers.extend(decorated_handlers.get(message_class, []))
 
             # Fall back to the naming convention
             # But avoid calling the handler if it was decorated
-            method = cls.__dict__.get(f"_{method_name}") or cls.__dict__.get(
+            method = base.__dict__.get(f"_{method_name}") or base.__dict__.get(
                 method_name
             )
             if method is not None and not getattr(method, "_textual_on", None):
-                yield cls, method.__get__(self, cls)
+                handlers.append((method, None))
+
+            if handlers:
+                class_handlers.append((base, tuple(handlers)))
+
+        plan = _dispatch_plans[cache_key] = tuple(class_handlers)
+        return plan
+
+    def _get_dispatch_methods(
+        self, method_name: str, message: Message
+    ) -> Iterable[tuple[type, Callable[[Message], Awaitable]]]:
+        """Gets handlers from the MRO
+
+        Args:
+            method_name: Handler method name.
+            message: Message object.
+        """
+        from textual.widget import Widget
+
+        methods_dispatched: set[Callable] = set()
+        for cls, handlers in self._get_dispatch_plan(method_name, type(message)):
+            if message._no_default_action:
+                break
+            for method, selectors in handlers:
+                if selectors is None:
+                    yield cls, method.__get__(self, cls)
+                    continue
+                if method in methods_dispatched:
+                    continue
+                if selectors:
+                    if not message._sender:
+                        continue
+                    for attribute, selector in selectors.items():
+                        node = getattr(message, attribute)
+                        if node is None:
+                            break
+                        if not isinstance(node, Widget):
+                            raise OnNoWidget(
+                                f"on decorator can't match against {attribute!r} as it is not a widget."
+                            )
+                        if not match(selector, node):
+                            break
+                    else:
+                        yield cls, method.__get__(self, cls)
+                        methods_dispatched.add(method)
+                else:
+                    yield cls, method.__get__(self, cls)
+                    methods_dispatched.add(method)
 
     async def on_event(self, event: events.Event) -> None:
         """Called to process an event.
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Hashable
 
 import rich.repr
 
@@ -47,13 +47,34 @@ class Update(Message, verbose=True):
         # Update messages can replace update for the same widget
         return isinstance(message, Update) and self.widget == message.widget
 
+    def coalesce_key(self) -> Hashable | None:
+        return (Update, self.widget)
+
 
 @rich.repr.auto
 class Layout(Message, verbose=True):
-    """Sent by Textual when a layout is required."""
+    """Sent by Textual when a layout is required.
+
+    Args:
+        widget: The container whose children require a layout, or `None` to layout
+            the entire screen.
+    """
+
+    def __init__(self, widget: Widget | None = None) -> None:
+        super().__init__()
+        self.widget = widget
+
+    def __rich_repr__(self) -> rich.repr.Result:
+        yield self.widget, None
 
     def can_replace(self, message: Message) -> bool:
-        return isinstance(message, Layout)
+        # A layout of the screen can replace any layout
+        return isinstance(message, Layout) and (
+            self.widget is None or self.widget is message.widget
+        )
+
+    def coalesce_key(self) -> Hashable | None:
+        return (Layout, self.widget)
 
 
 @rich.repr.auto
@@ -63,6 +84,9 @@ class UpdateScroll(Message, verbose=True):
     def can_replace(self, message: Message) -> bool:
         return isinstance(message, UpdateScroll)
 
+    def coalesce_key(self) -> Hashable | None:
+        return UpdateScroll
+
 
 @rich.repr.auto
 class InvokeLater(Message, verbose=True, bubble=False):
@@ -91,6 +115,9 @@ class Prompt(Message, no_dispatch=True):
     def can_replace(self, message: Message) -> bool:
         return isinstance(message, Prompt)
 
+    def coalesce_key(self) -> Hashable | None:
+        return Prompt
+
 
 class TerminalSupportsSynchronizedOutput(Message):
     """
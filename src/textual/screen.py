@@ -29,7 +29,7 @@ import rich.repr
 from rich.console import RenderableType
 from rich.style import Style
 
-from textual import constants, errors, events, messages
+from textual import errors, events, messages
 from textual._arrange import arrange
 from textual._callback import invoke
 from textual._compositor import Compositor, MapGeometry
@@ -63,16 +63,11 @@ from textual.widgets import Tooltip
 from textual.widgets._toast import ToastRack
 
 if TYPE_CHECKING:
-    from typing_extensions import Final
-
     from textual.command import Provider
 
     # Unused & ignored imports are needed for the docs to link to these objects:
     from textual.message_pump import MessagePump
 
-# Screen updates will be batched so that they don't happen more often than 60 times per second:
-UPDATE_PERIOD: Final[float] = 1 / constants.MAX_FPS
-
 ScreenResultType = TypeVar("ScreenResultType")
 """The result type of a screen."""
 
@@ -262,6 +257,10 @@ class Screen(Generic[ScreenResultType], Widget):
         super().__init__(name=name, id=id, classes=classes)
         self._compositor = Compositor()
         self._dirty_widgets: set[Widget] = set()
+        self._layout_widgets: set[Widget] = set()
+        """Containers whose children require a layout."""
+        self._style_nodes: dict[DOMNode, None] = {}
+        """Nodes whose styles should be updated before the next refresh."""
         self.__update_timer: Timer | None = None
         self._callbacks: list[tuple[CallbackType, MessagePump]] = []
         self._result_callbacks: list[ResultCallback[ScreenResultType | None]] = []
@@ -313,7 +312,10 @@ class Screen(Generic[ScreenResultType], Widget):
         """Timer used to perform updates."""
         if self.__update_timer is None:
             self.__update_timer = self.set_interval(
-                UPDATE_PERIOD, self._on_timer_update, name="screen_update", pause=True
+                self.app._frame_rate.period,
+                self._on_timer_update,
+                name="screen_update",
+                pause=True,
             )
         return self.__update_timer
 
@@ -671,6 +673,8 @@ class Screen(Generic[ScreenResultType], Widget):
         # TODO: Calculating a focus chain is moderately expensive.
         # Suspect we can move focus without calculating the entire thing again.
 
+        # Focus depends on display and visibility, so resolve any queued styles
+        self._update_queued_styles()
         widgets: list[Widget] = []
         add_widget = widgets.append
         focus_sorter = attrgetter("_focus_sort_key")
@@ -702,10 +706,13 @@ class Screen(Generic[ScreenResultType], Widget):
                     else parent_visibility  # Inherit visibility if the style is unset.
                 )
                 if node.is_container and node.allow_focus_children():
-                    sorted_displayed_children = sorted(
-                        node.displayed_children, key=focus_sorter
-                    )
-                    push((iter(sorted_displayed_children), node_is_visible))
+                    displayed_children = node.displayed_children
+                    if not node.VIRTUAL_LAYOUT:
+                        # Children of a virtual layout are already in order
+                        displayed_children = sorted(
+                            displayed_children, key=focus_sorter
+                        )
+                    push((iter(displayed_children), node_is_visible))
                 # Same check as `if node.focusable`, but we cached inherited visibility
                 # and we also skipped disabled nodes altogether.
                 if node_is_visible and node.allow_focus():
@@ -949,18 +956,31 @@ class Screen(Generic[ScreenResultType], Widget):
             focused: The widget that was focused.
             blurred: The widget that was blurred.
         """
+        for widget in (focused, blurred):
+            if widget is not None:
+                for ancestor in widget.ancestors_with_self:
+                    ancestor._pseudo_class_mask = None
+
         widgets: set[DOMNode] = set()
+        update_scope = self.app.stylesheet.get_update_scope({":focus-within"})
+        if update_scope is None:
+            return
 
-        if focused is not None:
-            for widget in reversed(focused.ancestors_with_self):
-                if widget._has_focus_within:
-                    widgets.update(widget.walk_children(with_self=True))
-                    break
-        if blurred is not None:
-            for widget in reversed(blurred.ancestors_with_self):
-                if widget._has_focus_within:
-                    widgets.update(widget.walk_children(with_self=True))
-                    break
+        for widget in (focused, blurred):
+            if widget is None:
+                continue
+            if update_scope == "node":
+                # Only the ancestors (where focus-within changed) need updating
+                widgets.update(
+                    ancestor
+                    for ancestor in widget.ancestors_with_self
+                    if ancestor._has_focus_within
+                )
+            else:
+                for ancestor in reversed(widget.ancestors_with_self):
+                    if ancestor._has_focus_within:
+                        widgets.update(ancestor.walk_children(with_self=True))
+                        break
         if widgets:
             self.app.stylesheet.update_nodes(widgets, animate=True)
 
@@ -1039,12 +1059,32 @@ class Screen(Generic[ScreenResultType], Widget):
             self, self._maybe_clear_tooltip, immediate=True
         )
 
+    def _update_styles_later(self, nodes: Iterable[DOMNode]) -> None:
+        """Queue nodes to have their styles updated before the next refresh.
+
+        Args:
+            nodes: Nodes to update.
+        """
+        self._style_nodes.update(dict.fromkeys(nodes))
+        if self._style_nodes:
+            self.check_idle()
+
+    def _update_queued_styles(self) -> None:
+        """Update the styles of any queued nodes, in a single pass."""
+        if self._style_nodes:
+            nodes = [node for node in self._style_nodes if node.is_attached]
+            self._style_nodes.clear()
+            self.app.stylesheet.update_nodes(nodes, animate=True)
+
     async def _on_idle(self, event: events.Idle) -> None:
         # Check for any widgets marked as 'dirty' (needs a repaint)
         event.prevent_default()
+        if not self.app._batch_count:
+            self._update_queued_styles()
         if not self.app._batch_count and self.is_current:
             if (
                 self._layout_required
+                or self._layout_widgets
                 or self._scroll_required
                 or self._repaint_required
                 or self._recompose_required
@@ -1107,9 +1147,14 @@ class Screen(Generic[ScreenResultType], Widget):
         """Called by the _update_timer."""
         self._update_timer.pause()
         if self.is_current and not self.app._batch_count:
-            if self._layout_required:
-                self._refresh_layout(scroll=self._scroll_required)
+            self._update_queued_styles()
+            if self._layout_required or self._layout_widgets:
+                self._refresh_layout(
+                    scroll=self._scroll_required,
+                    widgets=None if self._layout_required else self._layout_widgets,
+                )
                 self._layout_required = False
+                self._layout_widgets.clear()
                 self._dirty_widgets.clear()
             elif self._scroll_required:
                 self._refresh_layout(scroll=True)
@@ -1131,6 +1176,10 @@ class Screen(Generic[ScreenResultType], Widget):
         if self._callbacks:
             self.call_next(self._invoke_and_clear_callbacks)
 
+        update_period = self.app._frame_rate.period
+        if self._update_timer._interval != update_period:
+            self._update_timer._set_interval(update_period)
+
     async def _invoke_and_clear_callbacks(self) -> None:
         """If there are scheduled callbacks to run, call them and clear
         the callback queue."""
@@ -1183,8 +1232,20 @@ class Screen(Generic[ScreenResultType], Widget):
         """Remove the latest result callback from the stack."""
         self._result_callbacks.pop()
 
-    def _refresh_layout(self, size: Size | None = None, scroll: bool = False) -> None:
-        """Refresh the layout (can change size and positions of widgets)."""
+    def _refresh_layout(
+        self,
+        size: Size | None = None,
+        scroll: bool = False,
+        widgets: set[Widget] | None = None,
+    ) -> None:
+        """Refresh the layout (can change size and positions of widgets).
+
+        Args:
+            size: Size of the screen, or `None` for the current size.
+            scroll: Only update the visible widgets (used in scrolling).
+            widgets: Only layout the children of these containers, if possible.
+        """
+        self._update_queued_styles()
         size = self.outer_size if size is None else size
         if self.app.is_inline:
             size = size.with_height(self.app._get_inline_height())
@@ -1219,7 +1280,16 @@ class Screen(Generic[ScreenResultType], Widget):
                                 )
 
             else:
-                hidden, shown, resized = self._compositor.reflow(self, size)
+                reflow = (
+                    None
+                    if widgets is None
+                    else self._compositor.reflow_widgets(self, size, widgets)
+                )
+                if reflow is None:
+                    hidden, shown, resized = self._compositor.reflow(self, size)
+                    layers = self._compositor.layers
+                else:
+                    (hidden, shown, resized), layers = reflow
                 Hide = events.Hide
                 Show = events.Show
 
@@ -1229,7 +1299,6 @@ class Screen(Generic[ScreenResultType], Widget):
                 # We want to send a resize event to widgets that were just added or change since last layout
                 send_resize = shown | resized
 
-                layers = self._compositor.layers
                 for widget, (
                     region,
                     _order,
@@ -1273,7 +1342,10 @@ class Screen(Generic[ScreenResultType], Widget):
     async def _on_layout(self, message: messages.Layout) -> None:
         message.stop()
         message.prevent_default()
-        self._layout_required = True
+        if message.widget is None or message.widget is self:
+            self._layout_required = True
+        else:
+            self._layout_widgets.add(message.widget)
         self.check_idle()
 
     async def _on_update_scroll(self, message: messages.UpdateScroll) -> None:
@@ -1342,6 +1414,8 @@ class Screen(Generic[ScreenResultType], Widget):
         self.app._set_mouse_over(None)
         self._clear_tooltip()
         self.stack_updates += 1
+        # Another screen will write to the terminal while this one is suspended
+        self._compositor.invalidate_cells()
 
     async def _on_resize(self, event: events.Resize) -> None:
         event.stop()
@@ -20,6 +20,9 @@ class ScrollView(ScrollableContainer):
 
     ALLOW_MAXIMIZE = True
 
+    # Lines from `render_line` are typically cached, so they may be styled from a cache
+    _CONTENT_CACHE_SIZE = 1024
+
     DEFAULT_CSS = """
     ScrollView {
         overflow-y: auto;
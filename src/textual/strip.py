@@ -92,18 +92,17 @@ class Strip:
     ) -> None:
         self._segments = list(segments)
         self._cell_length = cell_length
-        self._divide_cache: FIFOCache[tuple[int, ...], list[Strip]] = FIFOCache(4)
-        self._crop_cache: FIFOCache[tuple[int, int], Strip] = FIFOCache(16)
-        self._style_cache: FIFOCache[Style, Strip] = FIFOCache(16)
-        self._filter_cache: FIFOCache[tuple[LineFilter, Color], Strip] = FIFOCache(4)
-        self._line_length_cache: FIFOCache[
-            tuple[int, Style | None],
-            Strip,
-        ] = FIFOCache(4)
-        self._crop_extend_cache: FIFOCache[
-            tuple[int, int, Style | None],
-            Strip,
-        ] = FIFOCache(4)
+        # Caches are created on first use, as most strips are never cropped, styled etc.
+        self._divide_cache: FIFOCache[tuple[int, ...], list[Strip]] | None = None
+        self._crop_cache: FIFOCache[tuple[int, int], Strip] | None = None
+        self._style_cache: FIFOCache[Style, Strip] | None = None
+        self._filter_cache: FIFOCache[tuple[LineFilter, Color], Strip] | None = None
+        self._line_length_cache: FIFOCache[tuple[int, Style | None], Strip] | None = (
+            None
+        )
+        self._crop_extend_cache: (
+            FIFOCache[tuple[int, int, Style | None], Strip] | None
+        ) = None
         self._render_cache: str | None = None
         self._link_ids: set[str] | None = None
 
@@ -348,9 +347,12 @@ class Strip:
             return self
 
         cache_key = (cell_length, style)
-        cached_strip = self._line_length_cache.get(cache_key)
-        if cached_strip is not None:
-            return cached_strip
+        if self._line_length_cache is None:
+            self._line_length_cache = FIFOCache(4)
+        else:
+            cached_strip = self._line_length_cache.get(cache_key)
+            if cached_strip is not None:
+                return cached_strip
 
         new_line: list[Segment]
         line = self._segments
@@ -437,6 +439,8 @@ class Strip:
         Returns:
             A new Strip.
         """
+        if self._filter_cache is None:
+            self._filter_cache = FIFOCache(4)
         cached_strip = self._filter_cache.get((filter, background))
         if cached_strip is None:
             cached_strip = Strip(
@@ -485,9 +489,12 @@ class Strip:
             New cropped Strip.
         """
         cache_key = (start, end, style)
-        cached_result = self._crop_extend_cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        if self._crop_extend_cache is None:
+            self._crop_extend_cache = FIFOCache(4)
+        else:
+            cached_result = self._crop_extend_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
         strip = self.extend_cell_length(end, style).crop(start, end)
         self._crop_extend_cache[cache_key] = strip
         return strip
@@ -510,9 +517,12 @@ class Strip:
         if end <= start:
             return Strip([], 0)
         cache_key = (start, end)
-        cached = self._crop_cache.get(cache_key)
-        if cached is not None:
-            return cached
+        if self._crop_cache is None:
+            self._crop_cache = FIFOCache(16)
+        else:
+            cached = self._crop_cache.get(cache_key)
+            if cached is not None:
+                return cached
         _cell_len = cell_len
         pos = 0
         output_segments: list[Segment] = []
@@ -564,9 +574,12 @@ class Strip:
         cell_length = self.cell_length
         cuts = [cut for cut in cuts if cut <= cell_length]
         cache_key = tuple(cuts)
-        cached = self._divide_cache.get(cache_key)
-        if cached is not None:
-            return cached
+        if self._divide_cache is None:
+            self._divide_cache = FIFOCache(4)
+        else:
+            cached = self._divide_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         strips: list[Strip]
         if cuts == [cell_length]:
@@ -590,9 +603,12 @@ class Strip:
         Returns:
             A new strip.
         """
-        cached = self._style_cache.get(style)
-        if cached is not None:
-            return cached
+        if self._style_cache is None:
+            self._style_cache = FIFOCache(16)
+        else:
+            cached = self._style_cache.get(style)
+            if cached is not None:
+                return cached
         styled_strip = Strip(
             Segment.apply_style(self._segments, style), self.cell_length
         )
@@ -134,6 +134,16 @@ class Timer:
         """Resume a paused timer."""
         self._active.set()
 
+    def _set_interval(self, interval: float) -> None:
+        """Change the interval, keeping the time of the last event.
+
+        Unlike `reset`, this won't resume a paused timer.
+
+        Args:
+            interval: The time between timer events, in seconds.
+        """
+        self._interval = interval
+
     async def _run_timer(self) -> None:
         """Run the timer task."""
         try:
@@ -150,6 +160,10 @@ class Timer:
         start = _time.get_time()
 
         while _repeat is None or count <= _repeat:
+            if self._interval != _interval:
+                # Schedule the next event from the last, with the new interval
+                start += count * (_interval - self._interval)
+                _interval = self._interval
             next_timer = start + ((count + 1) * _interval)
             now = _time.get_time()
             if self._skip and next_timer < now:
@@ -158,11 +172,15 @@ class Timer:
             now = _time.get_time()
             wait_time = max(0, next_timer - now)
             await sleep(wait_time)
+            if self._interval != _interval:
+                # The interval changed while waiting
+                continue
             count += 1
             await self._active.wait()
             if self._reset:
                 start = _time.get_time()
                 count = 0
+                _interval = self._interval
                 self._reset = False
                 continue
             try:
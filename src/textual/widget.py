@@ -77,7 +77,7 @@ from textual.geometry import (
     Spacing,
     clamp,
 )
-from textual.layout import Layout
+from textual.layout import Layout, WidgetPlacement
 from textual.layouts.vertical import VerticalLayout
 from textual.message import Message
 from textual.messages import CallbackType, Prune
@@ -318,6 +318,16 @@ class Widget(DOMNode):
     ALLOW_SELECT: ClassVar[bool] = True
     """Does this widget support automatic text selection? May be further refined with [Widget.allow_select][textual.widget.Widget.allow_select]"""
 
+    VIRTUAL_LAYOUT: ClassVar[bool] = False
+    """Arrange and render only the children in view (plus an overscan margin)?
+
+    Enable this in scrolling containers with a very large number of children. All children
+    should have the same height and margin as the first child. If the layout isn't vertical,
+    or any children are docked, all children are arranged as normal.
+
+    Children out of view are still styled, and keep their message pumps.
+    """
+
     can_focus: bool = False
     """Widget may receive focus."""
     can_focus_children: bool = True
@@ -373,6 +383,9 @@ class Widget(DOMNode):
     # Default sort order, incremented by constructor
     _sort_order: ClassVar[int] = 0
 
+    _CONTENT_CACHE_SIZE: ClassVar[int] = 0
+    """Number of styled lines to cache by content (see `StylesCache`), or 0 to disable."""
+
     _PSEUDO_CLASSES: ClassVar[dict[str, Callable[[Widget], bool]]] = {
         "hover": lambda widget: widget.mouse_hover,
         "focus": lambda widget: widget.has_focus,
@@ -447,8 +460,12 @@ class Widget(DOMNode):
         self._arrangement_cache: FIFOCache[
             tuple[Size, int, Widget], DockArrangeResult
         ] = FIFOCache(4)
+        self._virtual_row: tuple[Region, int] | None = None
+        """Region of the first child and the distance between children, in a virtual layout."""
+        self._virtual_children_docked: tuple[int, bool] | None = None
+        """Children updates count, and whether any children are docked or split."""
 
-        self._styles_cache = StylesCache()
+        self._styles_cache = StylesCache(self._CONTENT_CACHE_SIZE)
         self._rich_style_cache: dict[tuple[str, ...], tuple[Style, Style]] = {}
         self._visual_style_cache: dict[tuple[str, ...], VisualStyle] = {}
 
@@ -500,6 +517,10 @@ class Widget(DOMNode):
         """Used to cache :last-of-type pseudoclass state."""
         self._odd: tuple[int, bool] = (-1, False)
         """Used to cache :odd pseudoclass state."""
+        self._positional_state: tuple[bool, bool, bool] | None = None
+        """The positional pseudo classes when styles were last applied."""
+        self._positional_update_pending = False
+        """Is an update of the children's positional styles scheduled?"""
         self._last_scroll_time = monotonic()
         """Time of last scroll."""
 
@@ -851,6 +872,51 @@ class Widget(DOMNode):
         """Is this widget at an evenly numbered position within its siblings?"""
         return not self.is_odd
 
+    def _get_positional_state(self) -> tuple[bool, bool, bool]:
+        """Get the state of the pseudo classes which depend on the widget's position.
+
+        Returns:
+            A tuple of `first_of_type`, `last_of_type`, and `is_odd`.
+        """
+        return (self.first_of_type, self.last_of_type, self.is_odd)
+
+    def _update_positional_styles_later(self) -> None:
+        """Update the styles of children whose position may have changed.
+
+        Multiple calls are combined into a single update.
+        """
+        if not self._positional_update_pending and not (self._closing or self._pruning):
+            self._positional_update_pending = True
+            self.call_later(self._update_positional_styles)
+
+    def _update_positional_styles(self) -> None:
+        """Update children whose positional pseudo classes have changed."""
+        self._positional_update_pending = False
+        nodes = self._nodes
+        node_updates = nodes._updates
+        for index, child in enumerate(nodes):
+            # Avoid searching the siblings for the index of every child
+            child._odd = (node_updates, index % 2 == 0)
+            if not (child._has_order_style or child._has_odd_or_even):
+                continue
+            positional_state = child._get_positional_state()
+            previous_state = child._positional_state
+            if positional_state == previous_state:
+                continue
+            child._positional_state = positional_state
+            if previous_state is None:
+                child._update_styles()
+                continue
+            first_of_type, last_of_type, is_odd = positional_state
+            names: set[str] = set()
+            if first_of_type != previous_state[0]:
+                names.add(":first-of-type")
+            if last_of_type != previous_state[1]:
+                names.add(":last-of-type")
+            if is_odd != previous_state[2]:
+                names.update((":odd", ":even"))
+            child._update_styles(names)
+
     def __enter__(self) -> Self:
         """Use as context manager when composing."""
         self.app._compose_stacks[-1].append(self)
@@ -1136,6 +1202,12 @@ class Widget(DOMNode):
         Returns:
             Widget locations.
         """
+        if self.VIRTUAL_LAYOUT and self._nodes:
+            arrangement = self._arrange_virtual(size)
+            if arrangement is not None:
+                return arrangement
+            self._virtual_row = None
+
         cache_key = (size, self._nodes._updates)
         cached_result = self._arrangement_cache.get(cache_key)
         if cached_result is not None:
@@ -1147,9 +1219,94 @@ class Widget(DOMNode):
 
         return arrangement
 
+    def _arrange_virtual(self, size: Size) -> DockArrangeResult | None:
+        """Arrange the children in view, for a virtual layout.
+
+        Children are assumed to have the same height as the first child. A page either
+        side of the visible children is also arranged, so that scrolling within a page
+        doesn't require a new arrangement.
+
+        Args:
+            size: Size of container.
+
+        Returns:
+            Widget locations, or `None` if the children can't be arranged virtually.
+        """
+        children = self._nodes
+        if self.layout.name != "vertical":
+            return None
+        if (
+            self._virtual_children_docked is None
+            or self._virtual_children_docked[0] != children._updates
+        ):
+            docked = any(
+                child.styles.is_docked or child.styles.is_split for child in children
+            )
+            self._virtual_children_docked = (children._updates, docked)
+        if self._virtual_children_docked[1]:
+            return None
+        viewport = self.screen.size
+        first_placements = arrange(self, children[:1], size, viewport).placements
+        if not first_placements:
+            return None
+        row_region = first_placements[0].region
+        margin = first_placements[0].margin
+        row_gap = max(margin.top, margin.bottom)
+        row_height = row_region.height + row_gap
+        page_height = size.height
+        if not row_height or not page_height:
+            return None
+
+        page = self.scroll_offset.y // page_height
+        first = max(0, ((page - 1) * page_height - row_region.y) // row_height)
+        last = min(
+            len(children),
+            ((page + 2) * page_height - row_region.y) // row_height + 1,
+        )
+
+        cache_key = (size, children._updates, row_region, row_height, first, last)
+        cached_result = self._arrangement_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        window = arrange(self, children[first:last], size, viewport)
+        extent = Region(
+            0,
+            0,
+            row_region.right + margin.right,
+            row_region.y + len(children) * row_height - row_gap + margin.bottom,
+        )
+        arrangement = self._arrangement_cache[cache_key] = DockArrangeResult(
+            WidgetPlacement.translate(window.placements, Offset(0, first * row_height)),
+            window.widgets,
+            window.scroll_spacing,
+            extent=extent,
+        )
+        self._virtual_row = (row_region, row_height)
+        return arrangement
+
+    def _get_virtual_child_region(self, child: Widget) -> Region:
+        """Get the region of a child in a virtual layout, which may not be arranged.
+
+        Args:
+            child: A child widget.
+
+        Returns:
+            Region relative to the container.
+        """
+        if self._virtual_row is None:
+            return Region()
+        row_region, row_height = self._virtual_row
+        try:
+            index = self._nodes.index(child)
+        except ValueError:
+            return Region()
+        return row_region.translate((0, index * row_height))
+
     def _clear_arrangement_cache(self) -> None:
         """Clear arrangement cache, forcing a new arrange operation."""
         self._arrangement_cache.clear()
+        self._virtual_children_docked = None
 
     def _get_virtual_dom(self) -> Iterable[Widget]:
         """Get widgets not part of the DOM.
@@ -1278,20 +1435,8 @@ class Widget(DOMNode):
             parent, *widgets, before=insert_before, after=insert_after
         )
 
-        def update_styles(children: list[DOMNode]) -> None:
-            """Update order related CSS"""
-            if before is not None or after is not None:
-                # If the new children aren't at the end.
-                # we need to update both odd/even and first-of-type/last-of-type
-                for child in children:
-                    if child._has_order_style or child._has_odd_or_even:
-                        child._update_styles()
-            else:
-                for child in children:
-                    if child._has_order_style:
-                        child._update_styles()
-
-        self.call_later(update_styles, list(self.children))
+        if isinstance(parent, Widget):
+            parent._update_positional_styles_later()
         await_mount = AwaitMount(self, mounted)
         self.call_next(await_mount)
 
@@ -1418,6 +1563,7 @@ class Widget(DOMNode):
 
         # Request a refresh.
         self.refresh(layout=True)
+        self._update_positional_styles_later()
 
     def compose(self) -> ComposeResult:
         """Called by Textual to create child widgets.
@@ -1495,9 +1641,8 @@ class Widget(DOMNode):
             The size and margin for this widget.
         """
         styles = self.styles
-        _content_width, _content_height = container
-        content_width = Fraction(_content_width)
-        content_height = Fraction(_content_height)
+        content_width: Fraction
+        content_height: Fraction
         is_border_box = styles.box_sizing == "border-box"
         gutter = styles.gutter
         margin = styles.margin
@@ -2064,6 +2209,10 @@ class Widget(DOMNode):
         except NoScreen:
             return Region()
         except errors.NoWidget:
+            parent = self._parent
+            if isinstance(parent, Widget) and parent.VIRTUAL_LAYOUT:
+                # Children of a virtual layout may not be arranged
+                return parent._get_virtual_child_region(self)
             return Region()
 
     @property
@@ -2245,6 +2394,45 @@ class Widget(DOMNode):
         """Is this widget a container (contains other widgets)?"""
         return self.styles.layout is not None or bool(self._nodes)
 
+    @property
+    def _is_layout_boundary(self) -> bool:
+        """Is the size of this container independent of its children?
+
+        A change to the layout of the children of a layout boundary doesn't require the
+        widgets outside of it to be arranged again.
+        """
+        if not self._nodes:
+            return False
+        styles = self.styles
+        for scalar in (
+            styles.width,
+            styles.height,
+            styles.min_width,
+            styles.min_height,
+            styles.max_width,
+            styles.max_height,
+        ):
+            if scalar is not None and scalar.is_auto:
+                return False
+        parent = self._parent
+        return isinstance(parent, Widget) and parent.layout.name in (
+            "vertical",
+            "horizontal",
+        )
+
+    def _get_layout_boundary(self) -> Widget:
+        """Get the container which must be arranged after a change to this widget's layout.
+
+        Returns:
+            The nearest ancestor which is a layout boundary, or the screen.
+        """
+        ancestor: DOMNode | None = self._parent
+        while isinstance(ancestor, Widget):
+            if ancestor._is_layout_boundary or not isinstance(ancestor._parent, Widget):
+                return ancestor
+            ancestor = ancestor._parent
+        return self
+
     @property
     def is_scrollable(self) -> bool:
         """Can this widget be scrolled?"""
@@ -3659,14 +3847,34 @@ class Widget(DOMNode):
         )
         return pseudo_classes
 
+    def _get_pseudo_class_mask(self) -> int:
+        """Get the pseudo classes of this widget as a bitmask.
+
+        The mask is cached. Changes to hover, focus, focus within, disabled, and the
+        app's theme clear the cache. Changes to the widget's siblings, and to
+        `can_focus`, are detected when the mask is requested.
+
+        Returns:
+            A bitmask of the pseudo classes which are present.
+        """
+        parent = self._parent
+        cache_key = (
+            parent,
+            -1 if parent is None else cast(DOMNode, parent)._nodes._updates,
+            self.can_focus,
+        )
+        pseudo_class_mask = self._pseudo_class_mask
+        if pseudo_class_mask is None or pseudo_class_mask[0] != cache_key:
+            pseudo_class_mask = self._pseudo_class_mask = (
+                cache_key,
+                super()._get_pseudo_class_mask(),
+            )
+        return pseudo_class_mask[1]
+
     @property
-    def _pseudo_classes_cache_key(self) -> tuple[int, ...]:
+    def _pseudo_classes_cache_key(self) -> int:
         """A cache key that changes when the pseudo-classes change."""
-        return (
-            self.mouse_hover,
-            self.has_focus,
-            self.is_disabled,
-        )
+        return self._get_pseudo_class_mask()
 
     def _get_justify_method(self) -> JustifyMethod | None:
         """Get the justify method that may be passed to a Rich renderable."""
@@ -3712,12 +3920,14 @@ class Widget(DOMNode):
 
     def watch_mouse_hover(self, value: bool) -> None:
         """Update from CSS if mouse over state changes."""
+        self._pseudo_class_mask = None
         if self._has_hover_style:
-            self._update_styles()
+            self._update_styles({":hover"})
 
     def watch_has_focus(self, value: bool) -> None:
         """Update from CSS if has focus state changes."""
-        self._update_styles()
+        self._pseudo_class_mask = None
+        self._update_styles({":focus", ":blur"})
 
     def watch_disabled(self, disabled: bool) -> None:
         """Update the styles of the widget and its children when disabled is toggled."""
@@ -3737,6 +3947,8 @@ class Widget(DOMNode):
         except (ScreenStackError, NoActiveAppError, NoScreen):
             pass
 
+        for node in self.walk_children(with_self=True):
+            node._pseudo_class_mask = None
         self._update_styles()
 
     def _size_updated(
@@ -3801,40 +4013,7 @@ class Widget(DOMNode):
 
     @property
     def visual_style(self) -> VisualStyle:
-        background = Color(0, 0, 0, 0)
-        color = Color(255, 255, 255, 0)
-
-        style = Style()
-        opacity = 1.0
-
-        for node in reversed(self.ancestors_with_self):
-            styles = node.styles
-            has_rule = styles.has_rule
-            opacity *= styles.opacity
-            if has_rule("background"):
-                text_background = background + styles.background.tint(
-                    styles.background_tint
-                )
-                background += (
-                    styles.background.tint(styles.background_tint)
-                ).multiply_alpha(opacity)
-            else:
-                text_background = background
-            if has_rule("color"):
-                color = styles.color
-            style += styles.text_style
-            if has_rule("auto_color") and styles.auto_color:
-                color = text_background.get_contrast_text(color.a)
-
-        return VisualStyle(
-            background,
-            color,
-            bold=style.bold,
-            dim=style.dim,
-            italic=style.italic,
-            underline=style.underline,
-            strike=style.strike,
-        )
+        return self._get_computed_style().visual_style
 
     def get_selection(self, selection: Selection) -> tuple[str, str] | None:
         """Get the text under the selection.
@@ -3970,6 +4149,9 @@ class Widget(DOMNode):
                 if not isinstance(ancestor, Widget):
                     break
                 ancestor._clear_arrangement_cache()
+                if ancestor._is_layout_boundary:
+                    # Arrangements above the boundary are unaffected
+                    break
 
         if recompose:
             self._recompose_required = True
@@ -4141,6 +4323,8 @@ class Widget(DOMNode):
         assert isinstance(parent, DOMNode)
         # Finalize removal from DOM
         parent._nodes._remove(self)
+        if isinstance(parent, Widget):
+            parent._update_positional_styles_later()
         self.app._registry.discard(self)
         self._detach()
         self._arrangement_cache.clear()
@@ -4176,7 +4360,7 @@ class Widget(DOMNode):
                     screen.post_message(messages.Update(self))
                 if self._layout_required:
                     self._layout_required = False
-                    screen.post_message(messages.Layout())
+                    screen.post_message(messages.Layout(self._get_layout_boundary()))
 
     def focus(self, scroll_visible: bool = True) -> Self:
         """Give focus to this widget.
@@ -0,0 +1,39 @@
+from textual.app import App, ComposeResult
+from textual.containers import Container
+from textual.css.match import _check_selector_set, get_ancestor_bloom, match
+from textual.css.parse import parse_selectors
+from textual.widgets import Label
+
+
+class MatchApp(App):
+    def compose(self) -> ComposeResult:
+        with Container(id="outer", classes="panel"):
+            with Container(classes="inner"):
+                yield Label("Hello", id="label", classes="greeting")
+
+
+async def test_match_descendant_selectors():
+    app = MatchApp()
+    async with app.run_test():
+        label = app.query_one("#label")
+        assert match(parse_selectors(".panel Label"), label)
+        assert match(parse_selectors("#outer .inner > .greeting"), label)
+        assert match(parse_selectors("Screen Container.inner Label"), label)
+        assert match(parse_selectors(".missing Label, .panel Label"), label)
+        assert not match(parse_selectors(".missing Label"), label)
+        assert not match(parse_selectors("#outer > Label"), label)
+        assert not match(parse_selectors(".greeting Label"), label)
+
+
+async def test_check_selector_set_ancestor_bloom():
+    app = MatchApp()
+    async with app.run_test():
+        label = app.query_one("#label")
+        css_path_nodes = label.css_path_nodes
+        ancestor_bloom = get_ancestor_bloom(css_path_nodes)
+        (present,) = parse_selectors(".panel .inner Label")
+        (missing,) = parse_selectors(".panel .missing Label")
+        assert _check_selector_set(present, css_path_nodes, ancestor_bloom)
+        assert not _check_selector_set(missing, css_path_nodes, ancestor_bloom)
+        # The filter is cached on the selector set
+        assert present._ancestor_bloom is not None
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from textual.css import _parse_cache
+from textual.css.stylesheet import CssSource, Stylesheet
+
+CSS = "Label { color: $accent; } .panel Label { background: red; }"
+
+
+def _make_stylesheet(cache_path: Path, variables: dict[str, str]) -> Stylesheet:
+    stylesheet = Stylesheet(variables=variables)
+    stylesheet._disk_cache_path = cache_path
+    stylesheet.source[("test.tcss", "")] = CssSource(CSS, is_defaults=False)
+    stylesheet.parse()
+    return stylesheet
+
+
+def test_parse_cache_round_trip(tmp_path: Path, monkeypatch):
+    stylesheet = _make_stylesheet(tmp_path, {"accent": "blue"})
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("CSS should have been loaded from the cache")
+
+    monkeypatch.setattr("textual.css.stylesheet.parse", fail)
+    cached_stylesheet = _make_stylesheet(tmp_path, {"accent": "blue"})
+    assert cached_stylesheet.css == stylesheet.css
+
+
+def test_parse_cache_key_includes_variables(tmp_path: Path):
+    blue = _make_stylesheet(tmp_path, {"accent": "blue"})
+    green = _make_stylesheet(tmp_path, {"accent": "green"})
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+    assert blue.css != green.css
+
+
+def test_parse_cache_invalid_file(tmp_path: Path):
+    stylesheet = _make_stylesheet(tmp_path, {"accent": "blue"})
+    (cache_file,) = tmp_path.glob("*.pickle")
+    cache_file.write_bytes(b"not a pickle")
+    assert _parse_cache.load_rules(tmp_path, cache_file.stem) is None
+
+    # Invalid cache is parsed again, and replaced
+    reparsed_stylesheet = _make_stylesheet(tmp_path, {"accent": "blue"})
+    assert reparsed_stylesheet.css == stylesheet.css
+    assert _parse_cache.load_rules(tmp_path, cache_file.stem) is not None
+
+
+def test_parse_cache_unwritable(tmp_path: Path):
+    cache_path = tmp_path / "file"
+    cache_path.write_text("")
+    stylesheet = _make_stylesheet(cache_path, {"accent": "blue"})
+    assert stylesheet.rules
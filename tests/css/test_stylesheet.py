@@ -1,13 +1,17 @@
+from __future__ import annotations
+
 from contextlib import nullcontext as does_not_raise
 
 import pytest
 
+from textual.app import App, ComposeResult
 from textual.color import Color
 from textual.css.stylesheet import CssSource, Stylesheet, StylesheetParseError
 from textual.css.tokenizer import TokenError
 from textual.dom import DOMNode
 from textual.geometry import Spacing
 from textual.widget import Widget
+from textual.widgets import Label
 
 
 def _make_user_stylesheet(css: str) -> Stylesheet:
@@ -293,3 +297,264 @@ def test_did_you_mean_for_color_names(
         expected_error_summary += f". Did you mean '{expected_color_suggestion}'?"
 
     assert help_text.summary == expected_error_summary
+
+
+def test_stylesheet_update_variables():
+    """Only the rules using changed variables are updated."""
+    css = "#a {color: $foo; background: red;} #b {color: $bar;} #c {color: blue;}"
+    stylesheet = Stylesheet(variables={"foo": "red", "bar": "green"})
+    stylesheet.source["test.tcss"] = CssSource(css, is_defaults=False)
+    stylesheet.parse()
+    rule_a, rule_b, rule_c = stylesheet.rules
+
+    updated_rules = stylesheet.update_variables({"foo": "#00ff00", "bar": "green"})
+    assert updated_rules == {rule_a}
+    assert stylesheet.rules == [rule_a, rule_b, rule_c]
+    assert rule_a.styles.color == Color(0, 255, 0)
+    assert rule_a.styles.background == Color(255, 0, 0)
+
+    # Styles are the same as parsing from scratch
+    expected = Stylesheet(variables={"foo": "#00ff00", "bar": "green"})
+    expected.source["test.tcss"] = CssSource(css, is_defaults=False)
+    expected.parse()
+    assert stylesheet.css == expected.css
+
+    assert stylesheet.update_variables({"foo": "#00ff00", "bar": "green"}) == set()
+
+
+def test_stylesheet_update_variables_requires_reparse():
+    """Variables defined in CSS can't be updated without parsing again."""
+    css = "$baz: $foo; #a {color: $baz;}"
+    stylesheet = Stylesheet(variables={"foo": "red"})
+    stylesheet.source["test.tcss"] = CssSource(css, is_defaults=False)
+    stylesheet.parse()
+    assert stylesheet.update_variables({"foo": "blue"}) is None
+    stylesheet.reparse()
+    assert stylesheet.rules[0].styles.color == Color(0, 0, 255)
+
+
+def test_stylesheet_update_variables_invalid():
+    """An invalid value for a variable requires a reparse (which reports the error)."""
+    stylesheet = Stylesheet(variables={"foo": "red"})
+    stylesheet.source["test.tcss"] = CssSource("#a {color: $foo;}", is_defaults=False)
+    stylesheet.parse()
+    assert stylesheet.update_variables({"foo": "not-a-color"}) is None
+    with pytest.raises(StylesheetParseError):
+        stylesheet.reparse()
+
+
+async def test_refresh_css_restyles_nodes_using_changed_variables():
+    """Refreshing CSS restyles only the nodes with rules that use changed variables."""
+
+    class VariableApp(App):
+        CSS = """
+        #uses-variable { color: $my-color; }
+        #no-variable { color: red; }
+        """
+        my_color = "red"
+
+        def get_css_variables(self) -> dict[str, str]:
+            return {**super().get_css_variables(), "my-color": self.my_color}
+
+        def compose(self) -> ComposeResult:
+            yield Label("Hello", id="uses-variable")
+            yield Label("World", id="no-variable")
+
+    app = VariableApp()
+    async with app.run_test():
+        app.refresh_css()
+        uses_variable = app.query_one("#uses-variable")
+        assert uses_variable.styles.color == Color(255, 0, 0)
+        applied: list[DOMNode] = []
+        apply = app.stylesheet.apply
+
+        def record_apply(node: DOMNode, *args, **kwargs) -> None:
+            applied.append(node)
+            apply(node, *args, **kwargs)
+
+        app.stylesheet.apply = record_apply
+        app.my_color = "blue"
+        app.refresh_css(animate=False)
+        assert applied == [uses_variable]
+        assert uses_variable.styles.color == Color(0, 0, 255)
+
+
+async def test_component_styles_reused():
+    """Component styles are only resolved again if relevant state changes."""
+
+    class ComponentWidget(Widget):
+        COMPONENT_CLASSES = {"component--part"}
+        DEFAULT_CSS = """
+        ComponentWidget > .component--part { color: red; }
+        ComponentWidget.-active > .component--part { color: blue; }
+        """
+
+    class ComponentApp(App):
+        def compose(self) -> ComposeResult:
+            yield ComponentWidget()
+            yield ComponentWidget()
+
+    app = ComponentApp()
+    async with app.run_test():
+        first, second = app.query(ComponentWidget)
+        part_styles = first._component_styles["component--part"]
+        assert part_styles.color == Color(255, 0, 0)
+
+        # An unrelated class doesn't change the component styles
+        first.add_class("unrelated")
+        app.stylesheet.apply(first)
+        assert first._component_styles["component--part"] is part_styles
+
+        first.add_class("-active")
+        app.stylesheet.apply(first)
+        assert first.get_component_styles("component--part").color == Color(0, 0, 255)
+        assert second.get_component_styles("component--part").color == Color(255, 0, 0)
+
+        # Resolved from the cache, but attached to the second widget
+        second.add_class("-active")
+        app.stylesheet.apply(second)
+        second_styles = second._component_styles["component--part"]
+        assert second_styles.color == Color(0, 0, 255)
+        assert second_styles.node is not None
+        assert second_styles.node.parent is second
+
+
+def test_stylesheet_get_update_scope():
+    css = """
+    .node-only { color: red; }
+    .ancestor Label { color: blue; }
+    Button:hover { color: green; }
+    Container:focus-within > Label.both { color: yellow; }
+    .both { color: red; }
+    """
+    stylesheet = _make_user_stylesheet(css)
+    assert stylesheet.get_update_scope({".node-only"}) == "node"
+    assert stylesheet.get_update_scope({".ancestor"}) == "descendants"
+    assert stylesheet.get_update_scope({":hover"}) == "node"
+    assert stylesheet.get_update_scope({":focus-within"}) == "descendants"
+    assert stylesheet.get_update_scope({".both"}) == "node"
+    assert stylesheet.get_update_scope({".node-only", ".ancestor"}) == "descendants"
+    assert stylesheet.get_update_scope({".unused", ":focus"}) is None
+
+
+def test_stylesheet_affects_display():
+    css = """
+    .hide-children Label { display: none; }
+    .dim-children Label { visibility: hidden; }
+    .color-children Label { color: red; }
+    .hide-self { display: none; }
+    """
+    stylesheet = _make_user_stylesheet(css)
+    assert stylesheet.affects_display({".hide-children"})
+    assert stylesheet.affects_display({".dim-children", ".unused"})
+    assert not stylesheet.affects_display({".color-children"})
+    assert not stylesheet.affects_display({".hide-self"})
+
+
+async def test_class_change_restyles_affected_nodes():
+    """Changing a class restyles only the nodes which may be affected."""
+
+    class ClassApp(App):
+        CSS = """
+        #parent.-highlight { background: red; }
+        #parent.-context Label { color: blue; }
+        """
+
+        def compose(self) -> ComposeResult:
+            with Widget(id="parent"):
+                yield Label("Hello")
+
+    app = ClassApp()
+    async with app.run_test() as pilot:
+        parent = app.query_one("#parent")
+        label = app.query_one(Label)
+        applied: list[DOMNode] = []
+        apply = app.stylesheet.apply
+
+        def record_apply(node: DOMNode, *args, **kwargs) -> None:
+            applied.append(node)
+            apply(node, *args, **kwargs)
+
+        app.stylesheet.apply = record_apply
+
+        parent.add_class("-unused")
+        await pilot.pause()
+        assert applied == []
+
+        parent.add_class("-highlight")
+        assert applied == [parent]
+        assert parent.styles.background == Color(255, 0, 0)
+
+        applied.clear()
+        parent.add_class("-context")
+        await pilot.pause()
+        assert applied == [parent, label]
+        assert label.styles.color == Color(0, 0, 255)
+
+
+async def test_descendant_style_updates_are_coalesced():
+    """Several class changes before a refresh restyle each descendant once."""
+
+    class RowsApp(App):
+        CSS = """
+        #rows.-odd Label { color: red; }
+        #rows.-selected Label { background: blue; }
+        """
+
+        def compose(self) -> ComposeResult:
+            with Widget(id="rows"):
+                for row in range(10):
+                    yield Label(f"Row {row}")
+
+    app = RowsApp()
+    async with app.run_test() as pilot:
+        rows = app.query_one("#rows")
+        labels = list(app.query(Label))
+        applied: list[DOMNode] = []
+        apply = app.stylesheet.apply
+
+        def record_apply(node: DOMNode, *args, **kwargs) -> None:
+            applied.append(node)
+            apply(node, *args, **kwargs)
+
+        app.stylesheet.apply = record_apply
+
+        rows.add_class("-odd")
+        rows.add_class("-selected")
+        rows.remove_class("-odd")
+        assert applied == [rows, rows, rows]
+
+        await pilot.pause()
+        assert applied == [rows, rows, rows, *labels]
+        assert all(label.styles.background == Color(0, 0, 255) for label in labels)
+        assert all(label.styles.color != Color(255, 0, 0) for label in labels)
+
+
+async def test_class_change_updates_descendant_component_styles():
+    """Component styles of descendants follow the colors of a restyled ancestor."""
+
+    class PartWidget(Widget):
+        COMPONENT_CLASSES = {"part-widget--part"}
+
+    class ClassApp(App):
+        CSS = "#parent.-hot { background: red; }"
+
+        def compose(self) -> ComposeResult:
+            with Widget(id="parent"):
+                yield PartWidget()
+
+    app = ClassApp()
+    async with app.run_test():
+        parent = app.query_one("#parent")
+        widget = app.query_one(PartWidget)
+        background = widget.get_visual_style("part-widget--part").background
+        assert background != Color(255, 0, 0)
+        widget.get_component_rich_style("part-widget--part")
+
+        parent.add_class("-hot")
+        assert widget.get_visual_style("part-widget--part").background == Color(
+            255, 0, 0
+        )
+        assert widget.get_component_rich_style("part-widget--part").bgcolor == (
+            Color(255, 0, 0).rich_color
+        )
@@ -0,0 +1,86 @@
+import pytest
+
+from textual.app import App, ComposeResult
+from textual.containers import VerticalScroll
+from textual.widgets import Static
+
+
+class VirtualScroll(VerticalScroll):
+    VIRTUAL_LAYOUT = True
+
+
+class RowsApp(App):
+    CSS = """
+    Static {
+        height: 2;
+        margin: 1 0 2 0;
+    }
+    """
+
+    def __init__(self, container_type: type[VerticalScroll]) -> None:
+        self.container_type = container_type
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        with self.container_type():
+            for row in range(500):
+                yield Static(f"row {row}", id=f"row{row}")
+
+
+async def get_layout(container_type: type[VerticalScroll]) -> list:
+    app = RowsApp(container_type)
+    layout = []
+    async with app.run_test(size=(40, 20)) as pilot:
+        container = app.query_one(container_type)
+        for scroll_y in (0, 7, 500, 10_000):
+            container.scroll_to(y=scroll_y, animate=False)
+            await pilot.pause()
+            visible_regions = sorted(
+                (widget.id, widget.region)
+                for widget in app.screen._compositor.visible_widgets
+                if widget.id
+            )
+            layout.append((container.virtual_size, visible_regions))
+        container.scroll_to_widget(app.query_one("#row250"), animate=False)
+        await pilot.pause()
+        layout.append(container.scroll_offset)
+    return layout
+
+
+async def test_virtual_layout_matches_vertical_layout():
+    """A virtual layout should place visible children as a vertical layout does."""
+    assert await get_layout(VirtualScroll) == await get_layout(VerticalScroll)
+
+
+@pytest.mark.parametrize("scroll_y", [0, 1_000, 2_400])
+async def test_virtual_layout_arranges_children_in_view(scroll_y: int):
+    """Only the children around the visible region should be arranged."""
+    app = RowsApp(VirtualScroll)
+    async with app.run_test(size=(40, 20)) as pilot:
+        container = app.query_one(VirtualScroll)
+        container.scroll_to(y=scroll_y, animate=False)
+        await pilot.pause()
+        arranged = container._arrange(container.scrollable_content_region.size)
+        assert len(arranged.widgets) < 40
+        assert arranged.total_region.height == 500 * 4 + 1
+
+
+async def test_virtual_layout_falls_back_to_full_arrange():
+    """Children should all be arranged if the layout isn't vertical, or a child is docked."""
+    app = RowsApp(VirtualScroll)
+    async with app.run_test(size=(40, 20)) as pilot:
+        container = app.query_one(VirtualScroll)
+        size = container.scrollable_content_region.size
+        assert len(container._arrange(size).widgets) < 40
+
+        app.query_one("#row10").styles.dock = "top"
+        await pilot.pause()
+        assert len(container._arrange(size).widgets) == 500
+
+        app.query_one("#row10").styles.dock = "none"
+        await pilot.pause()
+        assert len(container._arrange(size).widgets) < 40
+
+        container.styles.layout = "horizontal"
+        await pilot.pause()
+        assert len(container._arrange(size).widgets) == 500
@@ -0,0 +1,92 @@
+from rich.segment import Segment
+from rich.style import Style
+
+from textual._cell_buffer import CellBuffer
+from textual.strip import Strip
+
+RED = Style(color="red")
+BLUE = Style(color="blue")
+
+
+def make_chops(*segments: Segment):
+    strip = Strip(segments)
+    return [{0: strip}], [[strip.cell_length]]
+
+
+def test_first_update_writes_everything():
+    cell_buffer = CellBuffer(10, 1)
+    chops, chop_ends = make_chops(Segment("0123456789", RED))
+    assert cell_buffer.update(chops, chop_ends, [(0, 0, 10)]) == [(0, 0, 10)]
+
+
+def test_unchanged_cells_are_skipped():
+    cell_buffer = CellBuffer(10, 1)
+    chops, chop_ends = make_chops(Segment("0123456789", RED))
+    cell_buffer.update(chops, chop_ends, [(0, 0, 10)])
+    assert cell_buffer.update(chops, chop_ends, [(0, 0, 10)]) == []
+
+    chops, chop_ends = make_chops(Segment("01234X6789", RED))
+    assert cell_buffer.update(chops, chop_ends, [(0, 0, 10)]) == [(0, 5, 6)]
+
+
+def test_style_change():
+    cell_buffer = CellBuffer(10, 1)
+    chops, chop_ends = make_chops(Segment("0123456789", RED))
+    cell_buffer.update_lines([chops[0][0]])
+    chops, chop_ends = make_chops(
+        Segment("01", RED), Segment("23", BLUE), Segment("456789", RED)
+    )
+    assert cell_buffer.update(chops, chop_ends, [(0, 0, 10)]) == [(0, 2, 4)]
+    assert cell_buffer.get_style(2, 0) == BLUE
+    assert cell_buffer.get_style(4, 0) == RED
+
+
+def test_nearby_changes_are_merged():
+    cell_buffer = CellBuffer(20, 1)
+    chops, chop_ends = make_chops(Segment("a" * 20, RED))
+    cell_buffer.update_lines([chops[0][0]])
+    chops, chop_ends = make_chops(Segment("aXaaXaaaaaaaaaaaaaXa", RED))
+    assert cell_buffer.update(chops, chop_ends, [(0, 0, 20)]) == [
+        (0, 1, 5),
+        (0, 18, 19),
+    ]
+
+
+def test_double_width_characters():
+    cell_buffer = CellBuffer(6, 1)
+    chops, chop_ends = make_chops(Segment("ab💩cd", RED))
+    cell_buffer.update_lines([chops[0][0]])
+    chops, chop_ends = make_chops(Segment("abXYcd", RED))
+    assert cell_buffer.update(chops, chop_ends, [(0, 0, 6)]) == [(0, 2, 4)]
+    chops, chop_ends = make_chops(Segment("ab💩cd", RED))
+    cell_buffer.update(chops, chop_ends, [(0, 0, 6)])
+    chops, chop_ends = make_chops(Segment("ab🎉cd", RED))
+    # The run is extended to cover the whole of the double width character
+    assert cell_buffer.update(chops, chop_ends, [(0, 0, 6)]) == [(0, 2, 4)]
+
+
+def test_invalidate():
+    cell_buffer = CellBuffer(10, 1)
+    chops, chop_ends = make_chops(Segment("0123456789", RED))
+    cell_buffer.update(chops, chop_ends, [(0, 0, 10)])
+    cell_buffer.invalidate()
+    assert cell_buffer.get_style(0, 0) is None
+    assert cell_buffer.update(chops, chop_ends, [(0, 0, 10)]) == [(0, 0, 10)]
+
+
+def test_scroll():
+    cell_buffer = CellBuffer(3, 4)
+    cell_buffer.update_lines(
+        [Strip([Segment(text, RED)]) for text in ("aaa", "bbb", "ccc", "ddd")]
+    )
+    cell_buffer.scroll(1, 4, 1)
+    chops = [{0: Strip([Segment(text, RED)])} for text in ("aaa", "ccc", "ddd", "eee")]
+    chop_ends = [[3]] * 4
+    spans = [(y, 0, 3) for y in range(4)]
+    # Only the exposed line should be written
+    assert cell_buffer.update(chops, chop_ends, spans) == [(3, 0, 3)]
+
+    cell_buffer.scroll(0, 4, -2)
+    assert cell_buffer.get_style(0, 0) is None
+    assert cell_buffer.get_style(0, 1) is None
+    assert cell_buffer.get_style(0, 2) == RED
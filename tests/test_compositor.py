@@ -1,6 +1,7 @@
+from textual import errors
 from textual.app import App, ComposeResult
-from textual.containers import Container
-from textual.widgets import Static
+from textual.containers import Container, Vertical, VerticalScroll
+from textual.widgets import Label, Log, Static
 
 
 async def test_compositor_scroll_placements():
@@ -40,3 +41,265 @@ async def test_compositor_scroll_placements():
         # The static wasn't scrolled out of view, and should be visible
         # This wasn't the case <= v0.86.1
         assert static in widgets
+
+
+async def test_compositor_culls_covered_widgets():
+    """Widgets entirely hidden by a widget in front should not be rendered."""
+
+    class CoveredStatic(Static):
+        rendered = False
+
+        def render_lines(self, crop):
+            self.rendered = True
+            return super().render_lines(crop)
+
+    class CullApp(App):
+        CSS = """
+        Screen {
+            layers: base overlay;
+        }
+        #covered {
+            width: 20;
+            height: 5;
+        }
+        #cover {
+            layer: overlay;
+            width: 30;
+            height: 10;
+        }
+        """
+
+        def compose(self) -> ComposeResult:
+            yield CoveredStatic("Hidden", id="covered")
+            yield Static("Cover", id="cover")
+
+    app = CullApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        compositor = app.screen._compositor
+        covered = app.query_one("#covered", CoveredStatic)
+        covered.rendered = False
+        compositor.render_update(full=True)
+        assert not covered.rendered
+        assert compositor.culled_cells >= 20 * 5
+
+
+async def test_compositor_skips_unchanged_cells():
+    """A partial update should only write cells which changed."""
+
+    class CounterApp(App):
+        def compose(self) -> ComposeResult:
+            yield Static("Count 1", id="counter")
+
+    app = CounterApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        compositor = app.screen._compositor
+        counter = app.query_one("#counter", Static)
+        compositor.render_update(full=True)
+
+        # A repaint with no changes has nothing to write
+        counter.refresh()
+        compositor.update_widgets({counter})
+        assert compositor.render_update() is None
+
+        counter.update("Count 2")
+        compositor.update_widgets({counter})
+        update = compositor.render_update()
+        assert update.spans == [(0, 6, 7)]
+
+
+async def test_compositor_rewrites_cells_after_discarded_update():
+    """Cells from an update which wasn't displayed should be written by the next update."""
+
+    class CounterApp(App):
+        def compose(self) -> ComposeResult:
+            yield Static("Count 1", id="counter")
+
+    app = CounterApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        compositor = app.screen._compositor
+        counter = app.query_one("#counter", Static)
+        compositor.render_update(full=True)
+
+        with app.batch_update():
+            counter.update("Count 2")
+            compositor.update_widgets({counter})
+            app._display(app.screen, compositor.render_update())
+
+        # The terminal never received "Count 2", so the whole widget is written
+        counter.refresh()
+        compositor.update_widgets({counter})
+        update = compositor.render_update()
+        assert update is not None
+        assert update.spans == [(0, 0, counter.size.width)]
+
+
+async def test_compositor_scrolls_with_scroll_region():
+    """Scrolling a full width widget should scroll the terminal, and only write the exposed lines."""
+
+    class LogApp(App):
+        CSS = """
+        Log {
+            scrollbar-size: 0 0;
+        }
+        """
+
+        def compose(self) -> ComposeResult:
+            yield Static("Header")
+            yield Log()
+
+    app = LogApp()
+    async with app.run_test(size=(40, 10)) as pilot:
+        log = app.query_one(Log)
+        log.write_lines([f"Line {line}" for line in range(100)])
+        await pilot.pause()
+        log.scroll_to(y=50, animate=False)
+        await pilot.pause()
+        compositor = app.screen._compositor
+        compositor.render_update(full=True)
+
+        log.scroll_to(y=52, animate=False)
+        log.refresh()
+        compositor.update_widgets({log})
+        update = compositor.render_update()
+        assert update.scroll == (1, 10, 2)
+        assert "\x1b[2;10r\x1b[2S\x1b[r" in update.render_segments(app.console)
+        # Only the exposed lines need to be written
+        assert {y for y, _, _ in update.spans} == {8, 9}
+
+
+async def test_compositor_cuts_updated_incrementally():
+    """Cuts should match cuts calculated from scratch, after widgets move."""
+
+    class CutsApp(App):
+        CSS = """
+        Static { width: 10; height: 3; }
+        Static.wide { width: 20; }
+        """
+
+        def compose(self) -> ComposeResult:
+            with VerticalScroll():
+                for index in range(20):
+                    yield Static(str(index), classes="wide" if index % 2 else "")
+
+    def calculate_cuts(compositor) -> list[list[int]]:
+        width, height = compositor.size
+        cuts = [{0, width} for _ in range(height)]
+        for region, clip in compositor.visible_widgets.values():
+            x, y, region_width, region_height = region.intersection(clip)
+            if region_width and region_height:
+                for line_cuts in cuts[y : y + region_height]:
+                    line_cuts.update((x, x + region_width))
+        return [sorted(line_cuts) for line_cuts in cuts]
+
+    app = CutsApp()
+    async with app.run_test(size=(40, 12)) as pilot:
+        compositor = app.screen._compositor
+        assert compositor.cuts == calculate_cuts(compositor)
+        app.query_one(VerticalScroll).scroll_to(y=4, animate=False)
+        await pilot.pause()
+        assert compositor.cuts == calculate_cuts(compositor)
+        await pilot.resize_terminal(30, 8)
+        await pilot.pause()
+        assert compositor.cuts == calculate_cuts(compositor)
+
+
+async def test_compositor_reflows_layout_boundary():
+    """A layout change within a fixed size container should only arrange that container."""
+
+    class BoundaryApp(App):
+        CSS = """
+        Vertical { height: 5; }
+        Label { width: auto; }
+        """
+
+        def compose(self) -> ComposeResult:
+            with VerticalScroll():
+                for index in range(10):
+                    with Vertical(id=f"container-{index}"):
+                        yield Label("Hello", id=f"label-{index}")
+                        yield Label("World")
+
+    app = BoundaryApp()
+    async with app.run_test(size=(40, 20)) as pilot:
+        screen = app.screen
+        compositor = screen._compositor
+        label = app.query_one("#label-1", Label)
+        assert label._get_layout_boundary() is app.query_one("#container-1")
+
+        reflowed: list[bool] = []
+        reflow_widgets = compositor.reflow_widgets
+
+        def spy_reflow_widgets(*args):
+            result = reflow_widgets(*args)
+            reflowed.append(result is not None)
+            return result
+
+        compositor.reflow_widgets = spy_reflow_widgets
+        label.update("Hello, World!")
+        await pilot.pause()
+        assert reflowed and all(reflowed)
+        assert label.region.width == 13
+
+        full_map, _ = compositor._arrange_root(screen, screen.size, visible_only=False)
+        assert compositor.full_map == full_map
+
+
+async def test_compositor_hit_test():
+    """The hit test index should find the front-most visible widget."""
+
+    class HitTestApp(App):
+        CSS = """
+        #back { width: 20; height: 10; }
+        #front { layer: above; offset: 5 2; width: 6; height: 3; }
+        #hidden { layer: above; offset: 12 5; width: 4; height: 2; visibility: hidden; }
+        Screen { layers: base above; }
+        """
+
+        def compose(self) -> ComposeResult:
+            yield Static("Back", id="back")
+            yield Static("Front", id="front")
+            yield Static("Hidden", id="hidden")
+
+    def linear_get_widget_at(compositor, x, y):
+        for widget, cropped_region, region in compositor.layers_visible[y]:
+            if cropped_region.contains(x, y) and widget.visible:
+                return widget, region
+        return None
+
+    app = HitTestApp()
+    async with app.run_test(size=(30, 12)):
+        compositor = app.screen._compositor
+        for y in range(12):
+            for x in range(30):
+                try:
+                    hit = compositor.get_widget_at(x, y)
+                except errors.NoWidget:
+                    hit = None
+                assert hit == linear_get_widget_at(compositor, x, y)
+        assert compositor.get_widget_at(6, 3)[0].id == "front"
+        assert compositor.get_widget_at(13, 6)[0].id == "back"
+
+
+async def test_compositor_style_at_uses_last_update():
+    """Getting the style under the mouse shouldn't render the widget again."""
+
+    class StyleApp(App):
+        def compose(self) -> ComposeResult:
+            yield Static("[bold]Hello[/bold] World")
+
+    app = StyleApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        compositor = app.screen._compositor
+        compositor.render_update(full=True)
+        static = app.query_one(Static)
+
+        def render_lines(crop):
+            raise AssertionError("Widget was rendered")
+
+        static.render_lines = render_lines
+        assert compositor.get_style_at(0, 0).bold
+        assert not compositor.get_style_at(8, 0).bold
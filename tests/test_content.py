@@ -3,6 +3,7 @@ from __future__ import annotations
 from rich.text import Text
 
 from textual.content import Content, Span
+from textual.style import Style
 
 
 def test_blank():
@@ -229,3 +230,28 @@ def test_strip_control_codes():
     """Test that control codes are removed from content."""
     assert Content("foo\r\nbar").plain == "foo\nbar"
     assert Content.from_markup("foo\r\nbar").plain == "foo\nbar"
+
+
+def test_wrap_cache():
+    """Test wrapping is shared between rendering and measuring."""
+    content = Content.from_markup("[b]Hello[/b], World! " * 4)
+    rules = {"text_align": "center"}
+    height = content.get_height(rules, 20)
+    assert content._wrap_cache is not None
+    assert content._wrap_cache.hits == 0
+    # Rendering with the same width and rules reuses the measured lines
+    assert len(content.render_strips(rules, 20, None, Style())) == height
+    assert content._wrap_cache.hits == 1
+    assert content._wrap_cache.misses == 0
+    # Measuring with the same width and rules reuses the rendered lines
+    hits = content._wrap_cache.hits
+    assert content.get_height(rules, 20) == height
+    assert content._wrap_cache.hits == hits + 1
+    lines = content._wrap_and_format(20, align="center")
+    assert len(lines) == height
+    assert content._wrap_and_format(20, align="center") is lines
+    assert content._wrap_and_format(21, align="center") is not lines
+    assert content._wrap_and_format(20, align="right") is not lines
+    assert content._wrap_and_format(20, align="center", no_wrap=True) is not lines
+    # The cache belongs to the content
+    assert Content(content.plain)._wrap_cache is None
@@ -353,6 +353,31 @@ async def test_focus_chain_handles_inherited_visibility():
         ]
 
 
+async def test_focus_chain_after_class_change():
+    """The focus chain should reflect a class change made immediately before."""
+
+    class FocusApp(App):
+        CSS = """
+        #outer.-collapsed > #inner { display: none; }
+        #outer.-faded > #inner { color: red; }
+        """
+
+        def compose(self) -> ComposeResult:
+            with Container(id="outer"):
+                yield Focusable(id="inner")
+            yield Focusable(id="after")
+
+    app = FocusApp()
+    async with app.run_test():
+        outer = app.query_one("#outer")
+        assert [widget.id for widget in app.screen.focus_chain] == ["inner", "after"]
+        outer.add_class("-faded")
+        outer.add_class("-collapsed")
+        assert [widget.id for widget in app.screen.focus_chain] == ["after"]
+        outer.remove_class("-collapsed")
+        assert [widget.id for widget in app.screen.focus_chain] == ["inner", "after"]
+
+
 async def test_mouse_down_gives_focus():
     class MyApp(App):
         AUTO_FOCUS = None
@@ -0,0 +1,74 @@
+from textual._frame_rate import FrameRate
+from textual._time import get_time
+from textual.app import App
+
+
+def test_fixed_frame_rate():
+    frame_rate = FrameRate(60)
+    assert not frame_rate.adaptive
+    assert not frame_rate.update(1.0)
+    assert frame_rate.fps == 60
+    assert frame_rate.period == 1 / 60
+
+
+def test_frame_rate_reduced_by_slow_output():
+    frame_rate = FrameRate(60, 10)
+    assert frame_rate.adaptive
+    assert not frame_rate.update(None)
+    assert not frame_rate.update(0.001)
+    assert frame_rate.fps == 60
+    # Output taking 25ms allows for 20 fps at 50% load
+    assert frame_rate.update(0.025)
+    assert frame_rate.fps == 20
+    # Never below the minimum
+    assert frame_rate.update(1.0)
+    assert frame_rate.fps == 10
+    assert not frame_rate.update(1.0)
+
+
+def test_frame_rate_raised_gradually():
+    frame_rate = FrameRate(60, 10)
+    frame_rate.update(1.0)
+    assert frame_rate.fps == 10
+    assert frame_rate.update(0.0)
+    assert frame_rate.fps == 11
+    for _ in range(100):
+        frame_rate.update(0.0)
+    assert frame_rate.fps == 60
+
+
+def test_minimum_clamped_to_maximum():
+    frame_rate = FrameRate(30, 60)
+    assert not frame_rate.adaptive
+    assert frame_rate.fps == 30
+
+
+async def test_app_frame_rate_sets_update_interval():
+    app = App()
+    app._frame_rate = FrameRate(60, 10)
+    async with app.run_test() as pilot:
+        update_timer = app.screen._update_timer
+        assert update_timer._interval == 1 / 60
+        # Slow output reduces the frame rate, which is applied on the next update
+        app._frame_rate.update(1.0)
+        app.screen.refresh()
+        await pilot.pause()
+        assert app.frame_rate == 10
+        assert update_timer._interval == 1 / 10
+
+
+async def test_timer_interval_change_schedules_from_last_event():
+    """Changing the interval shouldn't skip the next event."""
+    times: list[float] = []
+    app = App()
+    async with app.run_test() as pilot:
+
+        def callback() -> None:
+            times.append(get_time())
+            timer._set_interval(0.02)
+
+        timer = app.set_interval(0.2, callback)
+        await pilot.pause(0.5)
+    assert len(times) >= 2
+    # The second event is 0.02s after the first (not 0.2s + 0.02s)
+    assert times[1] - times[0] < 0.15
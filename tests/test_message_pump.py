@@ -1,9 +1,11 @@
 import pytest
 
 from textual._dispatch_key import dispatch_key
+from textual._message_queue import MessageQueue
 from textual.app import App, ComposeResult
 from textual.errors import DuplicateKeyHandlers
-from textual.events import Key
+from textual.events import Key, MouseDown, MouseMove, MouseUp
+from textual.geometry import Offset
 from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Button, Input, Label
@@ -91,6 +93,77 @@ async def test_message_queue_size():
         assert app.message_queue_size == 0
 
 
+async def test_coalesce_messages():
+    """Test messages with the same coalesce key replace pending messages."""
+
+    class Progress(Message):
+        def __init__(self, task: str, progress: int) -> None:
+            self.task = task
+            self.progress = progress
+            super().__init__()
+
+        def coalesce_key(self):
+            return (Progress, self.task)
+
+    class TestMessage(Message):
+        pass
+
+    class CoalesceApp(App):
+        def __init__(self) -> None:
+            self.received: list[tuple[str, int] | None] = []
+            super().__init__()
+
+        def on_progress(self, message: Progress) -> None:
+            self.received.append((message.task, message.progress))
+
+        def on_test_message(self, message: TestMessage) -> None:
+            self.received.append(None)
+
+    app = CoalesceApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        coalesced_count = app.coalesced_message_count
+        app.post_message(Progress("foo", 1))
+        app.post_message(Progress("bar", 1))
+        app.post_message(Progress("foo", 2))
+        app.post_message(Progress("foo", 3))
+        # Messages without a coalesce key aren't reordered
+        app.post_message(TestMessage())
+        app.post_message(Progress("foo", 4))
+        assert app.message_queue_size == 4
+        assert app.coalesced_message_count == coalesced_count + 2
+        await pilot.pause()
+        assert app.received == [("foo", 3), ("bar", 1), None, ("foo", 4)]
+
+
+async def test_coalesce_mouse_move_not_across_input_events():
+    """Mouse moves shouldn't be coalesced across other input events."""
+    queue = MessageQueue()
+    messages = [
+        MouseDown(None, 5, 0, 0, 0, 1, False, False, False),
+        MouseMove(None, 5, 0, 5, 0, 1, False, False, False),
+        MouseUp(None, 5, 0, 0, 0, 1, False, False, False),
+        MouseMove(None, 9, 0, 4, 0, 0, False, False, False),
+        MouseMove(None, 10, 0, 1, 0, 0, False, False, False),
+    ]
+    for message in messages:
+        queue.put_nowait(message)
+    assert queue.coalesced_count == 1
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == [
+        *messages[:3],
+        messages[4],
+    ]
+
+
+def test_coalesce_mouse_move():
+    """Test coalesced mouse move events accumulate the movement."""
+    first = MouseMove(None, 1, 1, 1, 1, 0, False, False, False)
+    second = MouseMove(None, 3, 2, 2, 1, 0, False, False, False)
+    assert first.coalesce_key() == second.coalesce_key()
+    second._coalesce(first)
+    assert second.delta == Offset(3, 2)
+
+
 async def test_prevent() -> None:
     app = PreventTestApp()
 
@@ -169,3 +242,34 @@ async def test_prevent_default():
     async with app.run_test() as pilot:
         await pilot.click(MyButton)
         assert app_button_pressed
+
+
+def test_dispatch_plan_updates_when_handler_changes():
+    """Setting a handler on a class should take effect for the next message."""
+
+    class MessageWidget(Widget):
+        class Ping(Message):
+            pass
+
+    def first_handler(self, message):
+        pass
+
+    def second_handler(self, message):
+        pass
+
+    def get_handlers() -> list:
+        message = MessageWidget.Ping()
+        return [
+            method.__func__
+            for _, method in MessageWidget()._get_dispatch_methods(
+                message.handler_name, message
+            )
+        ]
+
+    assert get_handlers() == []
+    MessageWidget.on_message_widget_ping = first_handler
+    assert get_handlers() == [first_handler]
+    MessageWidget.on_message_widget_ping = second_handler
+    assert get_handlers() == [second_handler]
+    del MessageWidget.on_message_widget_ping
+    assert get_handlers() == []
@@ -2,7 +2,7 @@ from fractions import Fraction
 
 import pytest
 
-from textual._resolve import resolve, resolve_fraction_unit
+from textual._resolve import get_common_denominator, resolve, resolve_fraction_unit
 from textual.css.scalar import Scalar
 from textual.geometry import Size
 from textual.widget import Widget
@@ -46,6 +46,18 @@ def test_resolve_empty():
             1,
             [(0, 3), (4, 46), (51, 47), (99, 1)],
         ),
+        (
+            ["1fr", "1fr", "1fr"],
+            100,
+            0,
+            [(0, 33), (33, 33), (66, 34)],
+        ),
+        (
+            ["1fr", "1fr", "1fr"],
+            100,
+            1,
+            [(0, 32), (33, 33), (67, 33)],
+        ),
     ],
 )
 def test_resolve(scalars, total, gutter, result):
@@ -61,6 +73,19 @@ def test_resolve(scalars, total, gutter, result):
     )
 
 
+@pytest.mark.parametrize(
+    "values,denominator",
+    [
+        ([], 1),
+        ([Fraction(3), 4], 1),
+        ([Fraction(1, 2), Fraction(1, 3)], 6),
+        ([Fraction(1, 4), Fraction(5, 6), Fraction(7, 2)], 12),
+    ],
+)
+def test_get_common_denominator(values, denominator):
+    assert get_common_denominator(values) == denominator
+
+
 def test_resolve_fraction_unit():
     """Test resolving fraction units in combination with minimum widths."""
     widget1 = Widget()
@@ -0,0 +1,99 @@
+from rich.color import ColorSystem
+from rich.console import Console
+from rich.segment import Segment
+from rich.style import Style
+
+from textual._sgr_encoder import SGREncoder, get_transition
+from textual.strip import Strip
+
+TRUECOLOR = ColorSystem.TRUECOLOR
+
+
+def make_console() -> Console:
+    return Console(color_system="truecolor", force_terminal=True)
+
+
+def test_transition_from_default():
+    assert get_transition(None, Style(bold=True), TRUECOLOR) == "\x1b[1m"
+    assert get_transition(None, Style(), TRUECOLOR) == ""
+
+
+def test_transition_to_default():
+    assert get_transition(Style(bold=True), Style(), TRUECOLOR) == "\x1b[0m"
+
+
+def test_transition_color_only():
+    assert (
+        get_transition(
+            Style(color="red", bgcolor="blue"),
+            Style(color="green", bgcolor="blue"),
+            TRUECOLOR,
+        )
+        == "\x1b[32m"
+    )
+    assert get_transition(Style(color="red"), Style(), TRUECOLOR) == "\x1b[0m"
+    assert (
+        get_transition(Style(color="red", bold=True), Style(bold=True), TRUECOLOR)
+        == "\x1b[39m"
+    )
+
+
+def test_transition_attributes():
+    assert get_transition(
+        Style(bold=True, color="#ff0000"),
+        Style(italic=True, color="#ff0000"),
+        TRUECOLOR,
+    ) == ("\x1b[22;3m")
+    # A reset is used when it is shorter than the changes
+    assert get_transition(Style(bold=True), Style(italic=True), TRUECOLOR) == (
+        "\x1b[0;3m"
+    )
+    # Bold and dim share a code to disable, so dim must be enabled again
+    assert get_transition(
+        Style(bold=True, dim=True, color="red"),
+        Style(dim=True, color="red"),
+        TRUECOLOR,
+    ) == ("\x1b[22;2m")
+
+
+def test_transition_same_style():
+    assert get_transition(Style(bold=True), Style(bold=True), TRUECOLOR) == ""
+
+
+def test_encoder_merges_same_style():
+    encoder = SGREncoder(make_console())
+    red = Style(color="red")
+    encoder.write_strip(Strip([Segment("foo", red), Segment("bar", red)]))
+    assert encoder.finish() == "\x1b[31mfoobar\x1b[0m"
+
+
+def test_encoder_writes_changes():
+    encoder = SGREncoder(make_console())
+    encoder.write_strip(
+        Strip(
+            [
+                Segment("foo", Style(color="red")),
+                Segment("bar", Style(color="red", bold=True)),
+                Segment("baz", Style(color="green", bold=True)),
+            ]
+        )
+    )
+    encoder.write("\x1b[1;1H")
+    encoder.write_strip(Strip([Segment("qux", Style(color="green", bold=True))]))
+    assert encoder.finish() == ("\x1b[31mfoo\x1b[1mbar\x1b[32mbaz\x1b[1;1Hqux\x1b[0m")
+
+
+def test_encoder_links():
+    encoder = SGREncoder(make_console())
+    link = Style(link="https://textual.textualize.io")
+    encoder.write_strip(Strip([Segment("foo", link), Segment("bar", Style())]))
+    assert encoder.finish() == (
+        f"\x1b]8;id={link._link_id};https://textual.textualize.io\x1b\\foo\x1b]8;;\x1b\\bar"
+    )
+
+
+def test_encoder_no_color():
+    console = Console(color_system=None)
+    encoder = SGREncoder(console)
+    encoder.write_strip(Strip([Segment("foo", Style(color="red"))]))
+    assert encoder.finish() == "foo"
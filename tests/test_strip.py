@@ -151,6 +151,14 @@ def test_crop_out_of_bounds(text, crop, output):
     assert Strip([Segment(text)]).crop(*crop) == Strip(output)
 
 
+def test_crop_cached() -> None:
+    strip = Strip([Segment("foo")])
+    assert strip._crop_cache is None
+    cropped = strip.crop(1, 2)
+    assert strip._crop_cache is not None
+    assert strip.crop(1, 2) is cropped
+
+
 def test_divide():
     assert Strip([Segment("foo")]).divide([1, 2]) == [
         Strip([Segment("f")]),
@@ -1,4 +1,5 @@
 from textual.app import App, ComposeResult
+from textual.color import Color
 from textual.widgets import Button, Static
 
 
@@ -35,3 +36,31 @@ async def test_text_style_inheritance():
         await pilot.pause()
         assert child.rich_style.bold
         assert child.rich_style.reverse
+
+
+async def test_computed_style_follows_ancestor_changes():
+    """Check that computed colors are reused, and rebuilt when an ancestor changes."""
+
+    class ColorApp(App):
+        CSS = """
+        #parent { background: red; }
+        #child { color: blue; }
+        """
+
+        def compose(self) -> ComposeResult:
+            with Static(id="parent"):
+                yield Static("test", id="child")
+
+    app = ColorApp()
+    async with app.run_test():
+        parent = app.query_one("#parent")
+        child = app.query_one("#child")
+        computed_style = child._get_computed_style()
+        assert child._get_computed_style() is computed_style
+        assert child.background_colors[1] == Color(255, 0, 0)
+        assert child.rich_style.color == Color(0, 0, 255).rich_color
+
+        parent.styles.background = "green"
+        assert child._get_computed_style() is not computed_style
+        assert child.background_colors[1] == Color.parse("green")
+        assert child.visual_style.background == Color.parse("green")
@@ -295,3 +295,55 @@ def test_dirty_cache() -> None:
     assert rendered_lines == [0, 1]
     text_content = _extract_content(lines)
     assert text_content == expected_text
+
+
+def test_content_cache() -> None:
+    """Check that styled lines are reused for the same content strips."""
+
+    content = [
+        Strip([Segment("foo")]),
+        Strip([Segment("bar")]),
+        Strip([Segment("baz")]),
+    ]
+    scroll_y = 0
+
+    def get_content_line(y: int) -> Strip:
+        return content[scroll_y + y]
+
+    styles = Styles()
+    styles.padding = (0, 1)
+    styles.border = ("heavy", "white")
+    cache = StylesCache(content_cache_size=10)
+
+    def render() -> list[Strip]:
+        return cache.render(
+            styles,
+            Size(7, 4),
+            Color.parse("blue"),
+            Color.parse("green"),
+            get_content_line,
+            None,
+            None,
+            content_size=Size(3, 2),
+        )
+
+    lines = render()
+    assert _extract_content(lines) == ["┏━━━━━┓", "┃ foo ┃", "┃ bar ┃", "┗━━━━━┛"]
+
+    # Scroll by a line, and render everything again
+    scroll_y = 1
+    cache.clear()
+    scrolled_lines = render()
+    assert _extract_content(scrolled_lines) == [
+        "┏━━━━━┓",
+        "┃ bar ┃",
+        "┃ baz ┃",
+        "┗━━━━━┛",
+    ]
+    # The styled "bar" line was reused
+    assert scrolled_lines[1] is lines[2]
+
+    # A change of style doesn't use the cache
+    styles.border = ("round", "white")
+    cache.clear()
+    assert _extract_content(render())[1] == "│ bar │"
@@ -5,10 +5,12 @@ import pytest
 from textual import events
 from textual._node_list import DuplicateIds
 from textual.app import App, ComposeResult
+from textual.color import Color
 from textual.containers import Container
 from textual.content import Content
 from textual.css.errors import StyleValueError
 from textual.css.query import NoMatches
+from textual.dom import DOMNode
 from textual.geometry import Offset, Size
 from textual.message import Message
 from textual.widget import BadWidgetName, MountError, PseudoClasses, Widget
@@ -272,6 +274,43 @@ def test_get_pseudo_class_state_focus():
     assert pseudo_classes == PseudoClasses(enabled=True, focus=True, hover=False)
 
 
+async def test_pseudo_classes_follow_state_changes():
+    """The cached pseudo classes change with focus, siblings, disabled, and theme."""
+
+    class PseudoApp(App):
+        AUTO_FOCUS = None
+
+        def compose(self) -> ComposeResult:
+            with Container(id="container"):
+                yield Button("first", id="first")
+
+    app = PseudoApp()
+    async with app.run_test() as pilot:
+        container = app.query_one("#container")
+        first = app.query_one("#first")
+        assert first.has_pseudo_classes({"first-of-type", "last-of-type"})
+        assert not container.has_pseudo_class("focus-within")
+        assert app.theme == "textual-dark"
+        assert first.has_pseudo_class("dark")
+
+        await container.mount(Button("second"))
+        assert first.has_pseudo_class("first-of-type")
+        assert not first.has_pseudo_class("last-of-type")
+
+        first.focus()
+        await pilot.pause()
+        assert container.has_pseudo_class("focus-within")
+        assert first.has_pseudo_class("focus")
+
+        container.disabled = True
+        await pilot.pause()
+        assert first.has_pseudo_class("disabled")
+        assert not container.has_pseudo_class("focus-within")
+
+        app.theme = "textual-light"
+        assert first.get_pseudo_classes() >= {"light", "disabled", "first-of-type"}
+
+
 # Regression test for https://github.com/Textualize/textual/issues/1634
 async def test_remove():
     class RemoveMeLabel(Label):
@@ -668,3 +707,54 @@ async def test_of_type() -> None:
         assert labels[4].last_of_type
         assert labels[4].is_odd
         assert not labels[4].is_even
+
+
+async def test_positional_styles_update_changed_siblings() -> None:
+    """Mounting and removing restyles only the siblings whose position changed."""
+
+    class ZebraApp(App):
+        CSS = """
+        Label:odd { background: red; }
+        Label:last-of-type { color: blue; }
+        """
+
+        def compose(self) -> ComposeResult:
+            with Container():
+                for ordinal in range(4):
+                    yield Label(f"Item {ordinal}")
+
+    red = Color.parse("red")
+    blue = Color.parse("blue")
+    app = ZebraApp()
+    async with app.run_test() as pilot:
+        container = app.query_one(Container)
+        applied: list[DOMNode] = []
+        apply = app.stylesheet.apply
+
+        def record_apply(node: DOMNode, *args, **kwargs) -> None:
+            applied.append(node)
+            apply(node, *args, **kwargs)
+
+        app.stylesheet.apply = record_apply
+
+        labels = list(container.query(Label))
+        new_label = Label("Item 4")
+        await container.mount(new_label)
+        await pilot.pause()
+        # Only the new label, and the label which is no longer last, are restyled
+        assert applied == [new_label, labels[3]]
+        assert labels[3].styles.color != blue
+        assert new_label.styles.color == blue
+        assert new_label.styles.background == red
+
+        applied.clear()
+        await labels[0].remove()
+        await pilot.pause()
+        labels = list(container.query(Label))
+        assert set(applied) == set(labels)
+        assert [label.styles.background == red for label in labels] == [
+            True,
+            False,
+            True,
+            False,
+        ]
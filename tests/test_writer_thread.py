@@ -0,0 +1,112 @@
+from io import StringIO
+
+from rich.console import Console
+
+from textual._ansi_sequences import SYNC_END, SYNC_START
+from textual._compositor import ChopsUpdate, Frame, InlineUpdate, LayoutUpdate
+from textual.drivers._writer_thread import MAX_QUEUED_FRAMES, WriterThread
+from textual.geometry import Region
+from textual.strip import Strip
+
+
+def make_full_frame(text: str, sync: bool = False) -> Frame:
+    """Make a frame which updates the whole screen."""
+    update = LayoutUpdate([Strip.blank(0)], Region(0, 0, 0, 1))
+    return Frame(update, Console(), prefix=text, sync=sync)
+
+
+def make_partial_frame(text: str) -> Frame:
+    """Make a frame which updates part of the screen."""
+    update = ChopsUpdate([], [], [])
+    return Frame(update, Console(), prefix=text)
+
+
+def test_writer_thread_writes_frames():
+    file = StringIO()
+    writer = WriterThread(file)
+    writer.write("[start]")
+    writer.write_frame(make_partial_frame("[frame]"))
+    writer.start()
+    writer.stop()
+    assert file.getvalue().startswith("[start][frame]")
+    assert writer.dropped_frames == 0
+    assert writer.output_time is not None
+
+
+def test_writer_thread_drops_superseded_frames():
+    file = StringIO()
+    writer = WriterThread(file)
+    # Enqueue before starting the thread, to simulate a slow terminal
+    writer.write_frame(make_partial_frame("[one]"))
+    writer.write("[text]")
+    writer.write_frame(make_partial_frame("[two]"))
+    writer.write_frame(make_full_frame("[full]"))
+    writer.write_frame(make_partial_frame("[three]"))
+    writer.start()
+    writer.stop()
+    output = file.getvalue()
+    assert "[one]" not in output
+    assert "[two]" not in output
+    assert output.index("[text]") < output.index("[full]") < output.index("[three]")
+    assert writer.dropped_frames == 2
+    assert writer.merged_frames == 1
+
+
+def test_writer_thread_discards_partial_frames_when_behind():
+    file = StringIO()
+    writer = WriterThread(file)
+    writer.write("[text]")
+    for _ in range(MAX_QUEUED_FRAMES):
+        assert writer.write_frame(make_partial_frame("[partial]"))
+    # Too many frames waiting: all partial frames are discarded
+    assert not writer.write_frame(make_partial_frame("[last]"))
+    assert writer.dropped_frames == MAX_QUEUED_FRAMES + 1
+    assert writer.write_frame(make_full_frame("[full]"))
+    writer.start()
+    writer.stop()
+    output = file.getvalue()
+    assert "[partial]" not in output
+    assert "[last]" not in output
+    assert output.index("[text]") < output.index("[full]")
+
+
+def test_writer_thread_keeps_inline_frames_when_behind():
+    file = StringIO()
+    writer = WriterThread(file)
+    for index in range(MAX_QUEUED_FRAMES + 5):
+        update = InlineUpdate([Strip.blank(0)])
+        assert writer.write_frame(Frame(update, Console(), prefix=f"[{index}]"))
+    assert writer.dropped_frames == 0
+    writer.start()
+    writer.stop()
+    output = file.getvalue()
+    positions = [output.index(f"[{index}]") for index in range(MAX_QUEUED_FRAMES + 5)]
+    assert positions == sorted(positions)
+
+
+def test_writer_thread_syncs_batch():
+    file = StringIO()
+    writer = WriterThread(file)
+    writer.write_frame(make_full_frame("[frame]", sync=True))
+    writer.start()
+    writer.stop()
+    output = file.getvalue()
+    assert output.startswith(f"{SYNC_START}[frame]")
+    assert output.endswith(SYNC_END)
+
+
+def test_writer_thread_reports_errors():
+    class BadUpdate(ChopsUpdate):
+        def render_segments(self, console: Console) -> str:
+            raise ValueError("bad")
+
+    errors: list[Exception] = []
+    file = StringIO()
+    writer = WriterThread(file, errors.append)
+    writer.write_frame(Frame(BadUpdate([], [], []), Console()))
+    writer.write("[after]")
+    writer.start()
+    writer.stop()
+    assert file.getvalue() == "[after]"
+    assert len(errors) == 1
+    assert isinstance(errors[0], ValueError)